@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark for blog post rendering with generate_blog_posts --jobs.
+
+Renders and validates every published post in data/blog_posts.json (markdown
+conversion, wiki auto-linking, Jinja render, ContentValidator) at each job
+count, with the build manifest forced so nothing is skipped. Pages go to a
+throwaway directory, not public/blog. The pages and the blocked/fixed counts
+must match the first job count's exactly before a time is reported.
+
+No network, no API keys.
+
+Run:
+    python3 benchmarks/bench_blog_render.py                  # jobs 1,2,4
+    python3 benchmarks/bench_blog_render.py --jobs 1,8 --repeat 3
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+import generate_blog_pages  # noqa: E402
+from build_manifest import BuildManifest  # noqa: E402
+from content_validator import ContentValidator  # noqa: E402
+from output_writer import OutputWriter  # noqa: E402
+
+
+def pages_digest(out_dir: Path) -> str:
+    h = hashlib.sha256()
+    for page in sorted(out_dir.glob("*.html")):
+        h.update(page.name.encode())
+        h.update(page.read_bytes())
+    return h.hexdigest()
+
+
+def run_once(posts, jobs: int, tmp: Path) -> dict:
+    out_dir = tmp / f"jobs-{jobs}"
+    shutil.rmtree(out_dir, ignore_errors=True)
+    out_dir.mkdir(parents=True)
+    generate_blog_pages.BLOG_DIR = out_dir
+    generate_blog_pages.WRITER = OutputWriter()
+
+    with redirect_stdout(StringIO()):
+        env = generate_blog_pages.setup_jinja()
+        build = BuildManifest(tmp / "manifest.json", root=tmp, force=True)
+        start = time.perf_counter()
+        blocked, fixed = generate_blog_pages.generate_blog_posts(
+            env, posts, ContentValidator(log_dir=tmp / "logs"), build=build, jobs=jobs
+        )
+        elapsed = time.perf_counter() - start
+
+    return {
+        "wall_s": elapsed,
+        "pages": len(list(out_dir.glob("*.html"))),
+        "blocked": blocked,
+        "fixed": fixed,
+        "digest": pages_digest(out_dir),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Blog post render benchmark")
+    parser.add_argument("--jobs", default="1,2,4", help="Comma list of job counts")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per job count (best kept)")
+    args = parser.parse_args()
+
+    jobs_list = [int(j) for j in args.jobs.split(",")]
+    posts = generate_blog_pages.load_blog_posts()
+    published = sum(1 for p in posts if p.get("published"))
+    tmp = Path(tempfile.mkdtemp(prefix="bench-blog-"))
+    original = generate_blog_pages.BLOG_DIR, generate_blog_pages.WRITER
+
+    try:
+        print(f"Blog render benchmark: {published} published posts, {os.cpu_count()} CPUs\n")
+        reference = None
+        baseline = None
+        for jobs in jobs_list:
+            runs = [run_once(posts, jobs, tmp) for _ in range(max(1, args.repeat))]
+            r = min(runs, key=lambda run: run["wall_s"])
+            result = (r["pages"], r["blocked"], r["fixed"], r["digest"])
+            if reference is None:
+                reference = result
+            elif result != reference:
+                print(f"  jobs={jobs}: output differs from jobs={jobs_list[0]}")
+                return 1
+            baseline = baseline or r["wall_s"]
+            print(
+                f"  jobs={jobs:<2} {r['wall_s']:7.2f}s  {r['pages']} pages  "
+                f"{r['blocked']} blocked  {r['fixed']} with issues  "
+                f"x{baseline / r['wall_s']:.2f}"
+            )
+        print("\nAll job counts produced identical pages and counts.")
+        return 0
+    finally:
+        generate_blog_pages.BLOG_DIR, generate_blog_pages.WRITER = original
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
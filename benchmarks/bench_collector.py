@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark for YouTubeCollector.collect_all_data, fully offline.
+
+Runs the real collection pipeline (search, relevance filtering, statistics,
+comments, grouping) against a fake YouTube backend from
+scripts/youtube_fake_backend.py and reports wall time, API calls per method
+and peak Python memory at each scale.
+
+No network, no API key, no quota, no Supabase. Quota is metered against a
+throwaway ledger, stats snapshots go to a throwaway store, and the on-disk
+response cache is disabled so every run pays the full request path.
+
+Run:
+    python3 benchmarks/bench_collector.py                      # synthetic, 3 scales
+    python3 benchmarks/bench_collector.py --scales 20x200,100x2000 --latency 50
+    python3 benchmarks/bench_collector.py --workers 1,4,8
+    python3 benchmarks/bench_collector.py --replay fixtures/    # from --record
+"""
+
+import argparse
+import json
+import math
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+import youtube_collector  # noqa: E402
+from youtube_collector import SEARCH_RESULTS_PER_QUERY, YouTubeCollector  # noqa: E402
+from youtube_fake_backend import ReplayYouTube, SyntheticYouTube  # noqa: E402
+from youtube_quota import YouTubeQuota  # noqa: E402
+from youtube_response_cache import ResponseCache  # noqa: E402
+from video_stats_store import VideoStatsStore  # noqa: E402
+
+
+def throwaway_quota(tmp: Path) -> YouTubeQuota:
+    config = tmp / "youtube-quota.json"
+    config.write_text(json.dumps({
+        "enabled": True,
+        "daily_cap_units": 10 ** 9,
+        "unit_costs": json.loads(
+            (PROJECT_ROOT / "config" / "youtube-quota.json").read_text()
+        )["unit_costs"],
+    }))
+    return YouTubeQuota(config_file=config, ledger_file=tmp / "ledger.jsonl", dry_run=True)
+
+
+def run_once(backend, workers: int, tmp: Path) -> dict:
+    with redirect_stdout(StringIO()):
+        collector = YouTubeCollector(
+            "benchmark-key",
+            workers=workers,
+            quota=throwaway_quota(tmp),
+            response_cache=ResponseCache(cache_dir=tmp / "cache", ttls={}),
+            client_factory=lambda: backend,
+            stats_store=VideoStatsStore(tmp / "video_stats"),
+        )
+        collector.supabase = None
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        data = collector.collect_all_data()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    videos = sum(len(c["videos"]) for c in data.get("top_creators", []))
+    return {
+        "wall_s": elapsed,
+        "peak_mb": peak / 1e6,
+        "videos": videos,
+        "creators": len(data.get("top_creators", [])),
+        "calls": dict(backend.calls),
+        "phases": data.get("phase_timings", {}),
+    }
+
+
+def print_row(label: str, workers: int, r: dict):
+    calls = ", ".join(f"{k.split('.')[0]} {v}" for k, v in sorted(r["calls"].items()))
+    phases = " ".join(f"{k} {v:.2f}s" for k, v in r["phases"].items())
+    print(
+        f"  {label:<14} w={workers:<2} {r['wall_s']:7.2f}s  {r['peak_mb']:7.1f} MB  "
+        f"{r['videos']:>5} videos / {r['creators']:>4} creators  [{calls}]  {phases}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline collect_all_data benchmark")
+    parser.add_argument("--scales", default="10x100,50x500,200x2000",
+                        help="Comma list of CREATORSxVIDEOS for the synthetic backend")
+    parser.add_argument("--comments", type=int, default=20, help="Comments per video")
+    parser.add_argument("--latency", type=float, default=20.0,
+                        help="Injected latency per request, milliseconds")
+    parser.add_argument("--workers", default="1,4", help="Comma list of worker counts")
+    parser.add_argument("--replay", metavar="DIR",
+                        help="Replay fixtures recorded with youtube_collector.py --record")
+    args = parser.parse_args()
+
+    latency = args.latency / 1000.0
+    workers_list = [int(w) for w in args.workers.split(",")]
+    tmp = Path(tempfile.mkdtemp(prefix="bench-collector-"))
+    original_queries = youtube_collector.SEARCH_QUERIES
+
+    try:
+        print(f"collect_all_data benchmark (latency {args.latency:.0f} ms/request)\n")
+
+        if args.replay:
+            for workers in workers_list:
+                backend = ReplayYouTube(args.replay, latency=latency)
+                r = run_once(backend, workers, tmp)
+                print_row("replay", workers, r)
+                if backend.misses:
+                    print(f"    fixture misses: {dict(backend.misses)}")
+            return 0
+
+        for scale in args.scales.split(","):
+            creators, videos = (int(x) for x in scale.lower().split("x"))
+            # One query per search page so the whole corpus is reachable
+            queries = max(1, math.ceil(videos / SEARCH_RESULTS_PER_QUERY))
+            youtube_collector.SEARCH_QUERIES = [f"carnivore diet {i}" for i in range(queries)]
+            for workers in workers_list:
+                backend = SyntheticYouTube(
+                    creators=creators, videos=videos,
+                    comments_per_video=args.comments, latency=latency,
+                )
+                print_row(scale, workers, run_once(backend, workers, tmp))
+        return 0
+    finally:
+        youtube_collector.SEARCH_QUERIES = original_queries
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
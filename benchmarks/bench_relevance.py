@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the collector's keyword relevance scorer.
+
+Scores a few thousand synthetic titles + descriptions with the original
+per-keyword implementation (kept below, verbatim in behaviour) and with the
+compiled scorer in scripts/relevance_scoring.py. Every result must match
+exactly before throughput is reported.
+
+No network, no API keys, no third-party packages.
+
+Run: python3 benchmarks/bench_relevance.py [--videos 5000] [--repeat 5]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from relevance_scoring import (  # noqa: E402
+    BLOCKED_TITLE_KEYWORDS,
+    is_likely_english,
+    score_many,
+)
+
+
+# ------------------------------------------------------- original scorer
+
+def legacy_is_blocked_title(title):
+    t = title.lower()
+    return any(re.search(rf"\b{re.escape(kw)}\b", t) for kw in BLOCKED_TITLE_KEYWORDS)
+
+
+def legacy_score(title, description):
+    text = (title + " " + description).lower()
+    strong_keywords = [
+        "carnivore diet", "carnivore", "animal-based", "animal based",
+        "zero carb", "no carb", "meat diet", "meat only", "beef only",
+        "lion diet", "nose to tail",
+        "only meat", "all meat", "meat and salt", "beef and salt",
+    ]
+    meat_keywords = [
+        "steak", "ribeye", "organ meat", "beef tallow", "brisket",
+        "beef liver", "bone broth", "ground beef",
+    ]
+    lowcarb_baking = [
+        "flour", "bread", "tortilla", "brownie", "muffin", "pancake",
+        "cookie", "bun", "buns", "dessert", "sweetener", "sugar-free",
+    ]
+    explicit_carnivore = [
+        "carnivore", "lion diet", "animal-based", "animal based", "nose to tail",
+    ]
+    if legacy_is_blocked_title(title):
+        return (0, "Title contains blocked keyword")
+    title_l = title.lower()
+    if not any(kw in title_l for kw in explicit_carnivore) and any(
+        re.search(rf"\b{kw}\b", title_l) for kw in lowcarb_baking
+    ):
+        return (3, "Low-carb baking content, not carnivore")
+    if any(kw in text for kw in strong_keywords):
+        return (9, "Contains carnivore keywords")
+    if any(kw in text for kw in meat_keywords):
+        return (7, "Contains carnivore-adjacent meat keywords")
+    return (4, "No carnivore keywords found")
+
+
+def legacy_is_likely_english(text):
+    if not text:
+        return True
+    non_latin_count = 0
+    accented_latin_count = 0
+    total_chars = 0
+    for char in text:
+        if char.isspace() or char.isdigit() or not char.isalnum():
+            continue
+        total_chars += 1
+        cp = ord(char)
+        if cp > 0x024F:
+            non_latin_count += 1
+        elif cp > 0x007F:
+            accented_latin_count += 1
+    if total_chars == 0:
+        return True
+    if non_latin_count / total_chars > 0.15:
+        return False
+    if accented_latin_count / total_chars > 0.08:
+        return False
+    return True
+
+
+# ---------------------------------------------------------- synthetic corpus
+
+WORDS = [
+    "carnivore", "diet", "steak", "ribeye", "keto", "low", "carb", "results", "my",
+    "30", "days", "eating", "only", "meat", "and", "salt", "beef", "liver", "bread",
+    "flour", "bun", "buns", "vegan", "veg", "vegetable", "zero", "carbs", "lion",
+    "animal-based", "nose", "to", "tail", "brisket", "bone", "broth", "tallow",
+    "what", "happened", "doctor", "reacts", "weight", "loss", "sugar-free", "cookie",
+    "plant", "based", "meatless", "monday", "all", "ground", "organ",
+]
+NON_ENGLISH = ["Dieta carnívora: o que acontece", "カーニボア ダイエット", "Régime carnivore"]
+
+
+def make_corpus(n, seed=7):
+    rng = random.Random(seed)
+    videos = []
+    for i in range(n):
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 10))).title()
+        if i % 50 == 0:
+            title = rng.choice(NON_ENGLISH)
+        description = " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 120)))
+        videos.append({"title": title, "description": description})
+    return videos
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Relevance scorer micro-benchmark")
+    parser.add_argument("--videos", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    videos = make_corpus(args.videos)
+    print(f"Scoring {len(videos):,} synthetic videos (best of {args.repeat})\n")
+
+    t_old, old = best_of(
+        lambda: [legacy_score(v["title"], v["description"]) for v in videos], args.repeat
+    )
+    t_new, new = best_of(lambda: score_many(videos), args.repeat)
+    mismatches = sum(1 for a, b in zip(old, new) if a != b)
+
+    t_old_en, old_en = best_of(
+        lambda: [legacy_is_likely_english(v["title"]) for v in videos], args.repeat
+    )
+    t_new_en, new_en = best_of(
+        lambda: [is_likely_english(v["title"]) for v in videos], args.repeat
+    )
+    mismatches += sum(1 for a, b in zip(old_en, new_en) if a != b)
+
+    rows = [
+        ("score (legacy)", t_old), ("score_many", t_new),
+        ("is_likely_english (legacy)", t_old_en), ("is_likely_english", t_new_en),
+    ]
+    for name, t in rows:
+        print(f"  {name:<28} {t * 1000:8.1f} ms  {len(videos) / t:>10,.0f} videos/s")
+    print(f"\n  scoring speedup:  {t_old / t_new:.1f}x")
+    print(f"  language speedup: {t_old_en / t_new_en:.1f}x")
+
+    if mismatches:
+        print(f"\n  FAIL: {mismatches} results differ from the legacy scorer")
+        return 1
+    print("\n  All results identical to the legacy scorer")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,13 +5,24 @@ index feed-grid, and update the sitemap with new blog URLs.
 
 Usage:
     python3 generate_kd_blog.py                # generate all
-    python3 generate_kd_blog.py --only-new      # skip posts with existing HTML
+    python3 generate_kd_blog.py --only-new      # only new posts and posts that changed
     python3 generate_kd_blog.py --dry-run       # preview without writing files
 
 Reads from: data/blog_posts.json (site == "kd", status == "published" or published == true)
 Writes to:  ketodial/public/blog/{slug}.html
 Updates:    ketodial/public/blog/index.html (feed-grid section)
             ketodial/public/sitemap.xml (new URLs only)
+
+Each post ends with up to three related KD posts, from the TF-IDF index
+in scripts/related_posts.py (shared with generate_blog_pages.py).
+
+--only-new used to skip any post whose HTML existed, so edits to a post (or
+to the page template in this file) never reached the site. Each post's
+render fingerprint (its fields plus this generator) is now kept in
+data/kd_blog_build_manifest.json; --only-new renders new posts and posts
+whose fingerprint changed. A page the manifest has no record of (first
+run, or edited by hand since) is rendered once; if it already matches, the
+writer leaves it untouched and it is recorded as current.
 """
 
 import argparse
@@ -31,6 +42,16 @@ POSTS_JSON = os.path.join(REPO_ROOT, "data", "blog_posts.json")
 BLOG_DIR = os.path.join(REPO_ROOT, "ketodial", "public", "blog")
 INDEX_HTML = os.path.join(BLOG_DIR, "index.html")
 SITEMAP_XML = os.path.join(REPO_ROOT, "ketodial", "public", "sitemap.xml")
+BUILD_MANIFEST_JSON = os.path.join(REPO_ROOT, "data", "kd_blog_build_manifest.json")
+
+# Shared with the CW generators: unchanged files are not rewritten, the rest
+# are written atomically (temp file + rename)
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+from build_manifest import BuildManifest  # noqa: E402
+from output_writer import OutputWriter  # noqa: E402
+from related_posts import RelatedPostsIndex  # noqa: E402
+
+WRITER = OutputWriter()
 
 # ---------------------------------------------------------------------------
 # Author config
@@ -205,6 +226,14 @@ header.nav{{position:sticky;top:0;z-index:40;background:rgba(241,245,249,.82);ba
 .cta-box a{{display:inline-block;background:var(--accent);color:#062234;font-family:var(--sans);font-weight:700;font-size:15px;padding:12px 28px;border-radius:10px;text-decoration:none;transition:background .15s}}
 .cta-box a:hover{{background:#7dd3fc;text-decoration:none}}
 
+.related{{margin-top:48px;padding-top:28px;border-top:1px solid var(--line)}}
+.related h2{{font-family:var(--mono);font-size:12px;letter-spacing:.2em;text-transform:uppercase;color:var(--ink-faint);font-weight:500;margin-bottom:16px}}
+.related-grid{{display:grid;grid-template-columns:repeat(auto-fit,minmax(200px,1fr));gap:14px}}
+.related-card{{display:block;background:var(--surface);border:1px solid var(--line);border-radius:12px;padding:16px 18px;color:var(--ink)}}
+.related-card:hover{{border-color:var(--accent);text-decoration:none}}
+.related-card .kicker{{font-family:var(--mono);font-size:11px;letter-spacing:.15em;text-transform:uppercase;color:var(--accent-deep)}}
+.related-card h3{{font-size:16px;font-weight:700;line-height:1.3;margin-top:6px}}
+
 footer{{background:#0b1620;color:#9fb8c9;padding:40px 0 24px}}
 .foot-inner{{max-width:1180px;margin:0 auto;padding:0 28px;display:flex;justify-content:space-between;align-items:center;flex-wrap:wrap;gap:16px}}
 .foot-inner .disclaimer{{font-size:12px;color:#6b8aa0;max-width:640px;line-height:1.5}}
@@ -259,6 +288,7 @@ pintrk('page');
       <a href="/#calc">Try the calculator</a>
     </div>
   </div>
+{related}
 </article>
 <footer>
   <div class="foot-inner">
@@ -289,6 +319,23 @@ CARD_TEMPLATE = """      <a class="pcard" href="/blog/{kd_slug}.html">
       </a>"""
 
 
+# Related articles block at the foot of a post
+RELATED_TEMPLATE = """  <section class="related">
+    <h2>Related articles</h2>
+    <div class="related-grid">
+{cards}
+    </div>
+  </section>"""
+
+RELATED_CARD_TEMPLATE = """      <a class="related-card" href="/blog/{kd_slug}.html">
+        <span class="kicker">{category}</span>
+        <h3>{title}</h3>
+      </a>"""
+
+# Fields of a related post its card shows (part of each post's render fingerprint)
+RELATED_CARD_FIELDS = ("slug", "title", "category")
+
+
 # ---------------------------------------------------------------------------
 # Load and filter posts
 # ---------------------------------------------------------------------------
@@ -309,8 +356,23 @@ def load_kd_posts() -> list:
 # Generate individual blog post HTML
 # ---------------------------------------------------------------------------
 
-def generate_post_html(post: dict) -> str:
-    """Render a blog post dict into a full HTML page string."""
+def generate_related_html(related: list) -> str:
+    """Build the Related articles section (empty string if there are none)."""
+    if not related:
+        return ""
+    cards = "\n".join(
+        RELATED_CARD_TEMPLATE.format(
+            kd_slug=strip_date_prefix(rp["slug"]),
+            category=escape(rp.get("category", "Guide").title()),
+            title=escape(rp["title"]),
+        )
+        for rp in related
+    )
+    return RELATED_TEMPLATE.format(cards=cards)
+
+
+def generate_post_html(post: dict, related: list = ()) -> str:
+    """Render a blog post dict (and its related posts) into a full HTML page string."""
     kd_slug = strip_date_prefix(post["slug"])
     author_info = AUTHOR_MAP.get(post.get("author", "team"), AUTHOR_MAP["team"])
     meta_desc = get_meta_description(post)
@@ -339,6 +401,7 @@ def generate_post_html(post: dict) -> str:
         article_image=article_image,
         og_image=og_image,
         json_ld=json_ld,
+        related=generate_related_html(related),
     )
 
     return sanitize_emdash(html)
@@ -442,8 +505,7 @@ def update_blog_index(posts: list, dry_run: bool = False) -> bool:
         print(f"  [DRY RUN] Would insert {len(new_posts)} new card(s) at top of feed-grid")
         return True
 
-    with open(INDEX_HTML, "w", encoding="utf-8") as f:
-        f.write(new_html)
+    WRITER.write_text(INDEX_HTML, new_html)
     print(f"  Inserted {len(new_posts)} new card(s) at top of feed-grid (existing cards preserved)")
     return True
 
@@ -496,8 +558,7 @@ def update_sitemap(posts: list, dry_run: bool = False) -> int:
 
     new_sitemap = sitemap[:insert_pos] + "\n".join(new_entries) + "\n" + sitemap[insert_pos:]
 
-    with open(SITEMAP_XML, "w", encoding="utf-8") as f:
-        f.write(new_sitemap)
+    WRITER.write_text(SITEMAP_XML, new_sitemap)
 
     print(f"  Added {added} new URL(s) to sitemap")
     return added
@@ -510,7 +571,8 @@ def update_sitemap(posts: list, dry_run: bool = False) -> int:
 def main():
     parser = argparse.ArgumentParser(description="Generate KetoDial blog pages")
     parser.add_argument("--dry-run", action="store_true", help="Preview without writing files")
-    parser.add_argument("--only-new", action="store_true", help="Skip posts whose HTML already exists")
+    parser.add_argument("--only-new", action="store_true",
+                        help="Only render new posts and posts whose content changed")
     args = parser.parse_args()
 
     # Verify paths
@@ -529,27 +591,40 @@ def main():
         return
 
     # 1. Generate individual post pages
+    build = BuildManifest(BUILD_MANIFEST_JSON, root=REPO_ROOT, force=not args.only_new)
+    related_index = RelatedPostsIndex(posts)
     generated = 0
     skipped = 0
     for post in posts:
         kd_slug = strip_date_prefix(post["slug"])
         out_path = os.path.join(BLOG_DIR, f"{kd_slug}.html")
+        related = [
+            {k: rp.get(k) for k in RELATED_CARD_FIELDS} for rp in related_index.related(post)
+        ]
+        # The page template lives in this file, so it is part of every fingerprint
+        digest = build.digest([os.path.abspath(__file__)], {"post": post, "related": related})
 
-        if args.only_new and os.path.isfile(out_path):
+        if args.only_new and build.is_current([out_path], digest):
             skipped += 1
             continue
 
-        html = generate_post_html(post)
+        html = generate_post_html(post, related)
 
         if args.dry_run:
             print(f"  [DRY RUN] Would write {out_path}")
         else:
-            with open(out_path, "w", encoding="utf-8") as f:
-                f.write(html)
-            print(f"  Wrote {kd_slug}.html")
+            if WRITER.write_text(out_path, html):
+                print(f"  Wrote {kd_slug}.html")
+            else:
+                print(f"  Unchanged {kd_slug}.html")
+            build.record([out_path], digest, 0.0)
         generated += 1
 
-    print(f"  Generated: {generated}, Skipped (--only-new): {skipped}")
+    if not args.dry_run:
+        build.save()
+        related_index.save()
+    print(f"  {related_index.report()}")
+    print(f"  Generated: {generated}, Skipped (unchanged): {skipped}")
 
     # 2. Update blog index feed-grid
     print("\nUpdating blog index...")
@@ -559,6 +634,8 @@ def main():
     print("\nUpdating sitemap...")
     update_sitemap(posts, dry_run=args.dry_run)
 
+    if not args.dry_run:
+        print(f"\n{WRITER.report()}")
     print("\nDone.")
 
 
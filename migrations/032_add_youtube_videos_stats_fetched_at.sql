@@ -0,0 +1,15 @@
+-- Migration 032: Track when each video's statistics were last fetched
+-- Purpose: youtube_collector.py --incremental refreshes cached view/like/comment
+--          counts older than STATS_STALENESS_HOURS. It used to key that on
+--          updated_at, but the BEFORE UPDATE trigger bumps updated_at on every
+--          upsert, including rows re-saved with cached stats, so known videos
+--          never went stale when runs came more often than the threshold.
+--          stats_fetched_at is written by the collector only after a real
+--          videos.list call.
+-- Status: IDEMPOTENT (safe to re-run)
+
+ALTER TABLE youtube_videos
+    ADD COLUMN IF NOT EXISTS stats_fetched_at TIMESTAMPTZ;
+
+COMMENT ON COLUMN youtube_videos.stats_fetched_at
+    IS 'When view/like/comment counts were last fetched from videos.list. NULL = unknown (treated as stale).';
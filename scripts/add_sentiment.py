@@ -17,6 +17,8 @@ from pathlib import Path
 from dotenv import load_dotenv
 from anthropic import Anthropic
 
+from youtube_data_io import load_youtube_data, save_youtube_data
+
 # Load .env from project root (parent of scripts/)
 PROJECT_ROOT = Path(__file__).parent.parent
 load_dotenv(PROJECT_ROOT / ".env", override=True)
@@ -145,8 +147,7 @@ Counts must add up to {num_comments}. Percentages must add up to 100."""
 
         # Load YouTube data (has all the comments AND where we store sentiment)
         print(f"\n📂 Loading YouTube data...")
-        with open(YOUTUBE_DATA_FILE, "r") as f:
-            youtube_data = json.load(f)
+        youtube_data = load_youtube_data(YOUTUBE_DATA_FILE)
 
         if "top_creators" not in youtube_data:
             print(f"\n⚠️  No top_creators in youtube_data.json")
@@ -179,8 +180,11 @@ Counts must add up to {num_comments}. Percentages must add up to 100."""
 
         # Save updated youtube_data.json with sentiment
         print(f"\n💾 Saving sentiment to youtube_data.json...")
-        with open(YOUTUBE_DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(youtube_data, f, indent=2, ensure_ascii=False)
+        # Refresh the NDJSON copy only if the collector was asked to write one
+        ndjson_file = YOUTUBE_DATA_FILE.with_suffix(".ndjson")
+        save_youtube_data(
+            youtube_data, YOUTUBE_DATA_FILE, ndjson_file if ndjson_file.exists() else None
+        )
 
         print("\n" + "=" * 70)
         print("✓ SENTIMENT ANALYSIS COMPLETE!")
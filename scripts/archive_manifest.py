@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Compact index of archived weeks (data/archive/manifest.json).
+
+Building the archive listing used to open and parse every week file in
+data/archive/, which is why it stopped at the 10 newest weeks. The manifest
+keeps one summary row per week (date, creator and video counts, summary
+preview) plus the file's size, mtime and content hash, so:
+
+- the listing renders from the manifest alone and can page through the
+  whole history;
+- refresh() only re-reads week files whose size or mtime moved, and reports
+  which weeks' JSON actually changed, so only those week pages re-render.
+
+archive_week() writes a new week file and its row in one go; refresh()
+also picks up files dropped into data/archive/ by hand. The manifest's
+name doesn't start with a digit, so it never looks like a week file.
+
+Usage:
+    python3 scripts/archive_manifest.py                  # refresh + list weeks
+    python3 scripts/archive_manifest.py --archive-current --date 2026-01-05
+"""
+
+import argparse
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from output_writer import OutputWriter
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ARCHIVE_DIR = BASE_DIR / "data" / "archive"
+MANIFEST_NAME = "manifest.json"
+
+MANIFEST_VERSION = 1
+PREVIEW_CHARS = 150
+
+
+def week_files(archive_dir: Path = ARCHIVE_DIR) -> List[Path]:
+    """Dated week files (YYYY-MM-DD.json), newest first."""
+    if not archive_dir.exists():
+        return []
+    return sorted(
+        [f for f in archive_dir.glob("*.json") if f.name[0].isdigit()],
+        key=lambda f: f.name,
+        reverse=True,
+    )
+
+
+def summarize_week(date: str, week_data: Dict) -> Dict:
+    """
+    Listing row for one archived week
+
+    Args:
+        date: Week date (the archive file's stem)
+        week_data: Parsed week file, nested under "analysis" or flat
+
+    Returns:
+        {"date", "total_creators", "total_videos", "summary_preview"}
+    """
+    # Handle nested structure (analysis key) or flat structure
+    analysis = week_data.get("analysis", week_data)
+
+    # Extract week info, use actual data if available
+    total_creators = analysis.get("top_creators_count", 0)
+    total_videos = analysis.get("total_videos_found", 0)
+
+    # If counts are 0, try to extract from creators data or trending topics
+    if total_creators == 0:
+        if "creators_data" in analysis:
+            total_creators = len(analysis.get("creators_data", {}))
+        elif "trending_topics" in analysis:
+            total_creators = len([t for t in analysis.get("trending_topics", []) if t])
+
+    if total_videos == 0:
+        if "trending_topics" in analysis:
+            total_videos = len(analysis.get("trending_topics", []))
+        elif "key_insights" in analysis:
+            total_videos = len(analysis.get("key_insights", []))
+
+    # Get summary - first 150 chars of weekly_summary if available
+    summary_preview = analysis.get("weekly_summary", "")
+    if not isinstance(summary_preview, str):
+        summary_preview = str(summary_preview)
+    summary_preview = summary_preview[:PREVIEW_CHARS]
+
+    return {
+        "date": date,
+        "total_creators": max(total_creators, 1),  # At least 1 creator
+        "total_videos": max(total_videos, 1),  # At least 1 video
+        "summary_preview": summary_preview if summary_preview else f"Week of {date}",
+    }
+
+
+def _write_json(path: Path, payload, indent=2):
+    OutputWriter().write_text(path, json.dumps(payload, indent=indent, ensure_ascii=False) + "\n")
+
+
+class ArchiveManifest:
+    """Summary rows for every archived week, kept in step with data/archive/."""
+
+    def __init__(self, archive_dir: Path = ARCHIVE_DIR):
+        self.archive_dir = Path(archive_dir)
+        self.path = self.archive_dir / MANIFEST_NAME
+        self.weeks: Dict[str, Dict] = self._load()
+        self.errors: Dict[str, str] = {}
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return {row["date"]: row for row in data.get("weeks", [])}
+
+    def _row_for(self, path: Path, raw: bytes, st) -> Dict:
+        row = summarize_week(path.stem, json.loads(raw))
+        row["sha256"] = hashlib.sha256(raw).hexdigest()
+        row["mtime_ns"] = st.st_mtime_ns
+        row["size"] = st.st_size
+        return row
+
+    def refresh(self) -> List[str]:
+        """
+        Bring the rows in line with the week files on disk
+
+        Only files whose size or mtime differ from their row are opened.
+        Unreadable files are left out of the listing and noted in
+        self.errors.
+
+        Returns:
+            Dates whose JSON content changed (new, edited or removed weeks)
+        """
+        changed = []
+        seen = set()
+        dirty = False
+        self.errors = {}
+        for path in week_files(self.archive_dir):
+            date = path.stem
+            seen.add(date)
+            st = path.stat()
+            row = self.weeks.get(date)
+            if row and row.get("mtime_ns") == st.st_mtime_ns and row.get("size") == st.st_size:
+                continue
+            try:
+                new_row = self._row_for(path, path.read_bytes(), st)
+            except (OSError, ValueError, AttributeError) as e:
+                self.errors[path.name] = str(e)
+                if self.weeks.pop(date, None) is not None:
+                    changed.append(date)
+                    dirty = True
+                continue
+            if not row or row.get("sha256") != new_row["sha256"]:
+                changed.append(date)
+            self.weeks[date] = new_row
+            dirty = True
+
+        for date in [d for d in self.weeks if d not in seen]:
+            del self.weeks[date]
+            changed.append(date)
+            dirty = True
+
+        if dirty:
+            self.save()
+        return changed
+
+    def archive_week(self, date: str, week_data: Dict) -> Path:
+        """
+        Write data/archive/<date>.json and its manifest row
+
+        Args:
+            date: Week date, YYYY-MM-DD
+            week_data: Week content (analyzed_content shape)
+
+        Returns:
+            Path of the week file
+        """
+        datetime.strptime(date, "%Y-%m-%d")  # ValueError on anything else
+        path = self.archive_dir / f"{date}.json"
+        _write_json(path, week_data)
+        self.weeks[date] = self._row_for(path, path.read_bytes(), path.stat())
+        self.save()
+        return path
+
+    def rows(self) -> List[Dict]:
+        """All weeks, newest first."""
+        return [self.weeks[d] for d in sorted(self.weeks, reverse=True)]
+
+    def pages(self, per_page: int) -> List[List[Dict]]:
+        """rows() split into listing pages; always at least one (possibly empty) page."""
+        rows = self.rows()
+        return [rows[i:i + per_page] for i in range(0, len(rows), per_page)] or [[]]
+
+    def save(self):
+        _write_json(self.path, {"version": MANIFEST_VERSION, "weeks": self.rows()})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the archived-weeks manifest")
+    parser.add_argument(
+        "--archive-current", action="store_true",
+        help="Archive data/analyzed_content.json as a week before refreshing"
+    )
+    parser.add_argument(
+        "--date", default=None,
+        help="Week date for --archive-current (default: today, YYYY-MM-DD)"
+    )
+    args = parser.parse_args()
+
+    manifest = ArchiveManifest()
+    if args.archive_current:
+        source = BASE_DIR / "data" / "analyzed_content.json"
+        date = args.date or datetime.now().strftime("%Y-%m-%d")
+        path = manifest.archive_week(date, json.loads(source.read_text(encoding="utf-8")))
+        print(f"✓ Archived {source.name} → {path.relative_to(BASE_DIR)}")
+
+    changed = manifest.refresh()
+    for name, error in manifest.errors.items():
+        print(f"⚠ Could not read {name}: {error}")
+    print(f"✓ {len(manifest.weeks)} weeks in {manifest.path.relative_to(BASE_DIR)}"
+          f" ({len(changed)} changed)")
+    for row in manifest.rows():
+        print(f"   {row['date']}  {row['total_creators']:>3} creators  "
+              f"{row['total_videos']:>3} videos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Build manifest for incremental site generation (generate.py).
+
+daily_publish.py runs `generate.py --type all` every day, and every run
+re-rendered the homepage, archive listing, every archive week page, the
+channels page and the wiki updates even when none of their inputs had moved.
+
+BuildManifest remembers, for each output file, a digest of everything that
+produced it (template chain, data files, generator code and any extra
+values such as the site or run date) plus a hash of the output as written.
+On the next run an output is skipped when its input digest is unchanged and
+the file on disk still has the recorded content, so a hand-edited or deleted
+output is rebuilt. --force renders everything and refreshes the manifest.
+
+The manifest lives in data/build_manifest.json next to the data it
+describes, so it travels with the committed outputs and CI runs skip too.
+
+Typical use:
+
+    build = BuildManifest(force=args.force)
+    digest = build.digest(files=[template, data_file], values={"site": "cw"})
+    if build.is_current([output], digest):
+        build.skip([output])
+    else:
+        start = time.perf_counter()
+        render(output)
+        build.record([output], digest, time.perf_counter() - start)
+    build.save()
+    print(build.summary())
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from output_writer import OutputWriter
+
+try:
+    from jinja2 import meta
+except ImportError:
+    meta = None
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+MANIFEST_FILE = BASE_DIR / "data" / "build_manifest.json"
+
+MANIFEST_VERSION = 1
+
+
+def template_chain(env, name: str) -> List[Path]:
+    """
+    Files of a template and everything it extends, includes or imports
+
+    Args:
+        env: Jinja2 Environment with a filesystem loader
+        name: Template name as passed to get_template()
+
+    Returns:
+        Template file paths, the named template first. When a template
+        references others dynamically (a variable in {% include %}), every
+        file under the loader's search path is returned instead, since any
+        of them could be pulled in.
+    """
+    files = []
+    seen = set()
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        source, filename, _ = env.loader.get_source(env, current)
+        files.append(Path(filename))
+        if meta is None:
+            continue
+        for ref in meta.find_referenced_templates(env.parse(source)):
+            if ref is None:
+                return _all_templates(env)
+            pending.append(ref)
+    return files
+
+
+def _all_templates(env) -> List[Path]:
+    files = []
+    for root in getattr(env.loader, "searchpath", []):
+        files.extend(sorted(p for p in Path(root).rglob("*") if p.is_file()))
+    return files
+
+
+class BuildManifest:
+    """Per-output record of input digests, output hashes and render times."""
+
+    def __init__(self, manifest_file: Path = MANIFEST_FILE, root: Path = BASE_DIR,
+                 force: bool = False):
+        self.manifest_file = Path(manifest_file)
+        self.root = Path(root).resolve()
+        self.force = force
+        self.outputs: Dict[str, Dict] = self._load()
+        self.rendered: List[str] = []
+        self.skipped: List[str] = []
+        self.seconds_saved = 0.0
+        self._file_hashes: Dict[Path, tuple] = {}
+        self._dirty = False
+        # Generation types may run on parallel threads and share one manifest
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            data = json.loads(self.manifest_file.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("outputs", {})
+
+    def _key(self, path) -> str:
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def file_hash(self, path) -> Optional[str]:
+        """sha256 of a file's bytes, None if it doesn't exist (memoized per mtime/size)."""
+        path = Path(path).resolve()
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._file_hashes.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        h = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for block in iter(lambda: fh.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        self._file_hashes[path] = (stamp, digest)
+        return digest
+
+    def digest(self, files: Iterable = (), values: Optional[Dict] = None) -> str:
+        """
+        Digest of a set of input files and extra values
+
+        Args:
+            files: Input files; a missing file counts as an input too, so
+                creating it later invalidates the output
+            values: JSON-serialisable extras (site, run date, file listings)
+
+        Returns:
+            Hex digest, stable across processes and checkouts
+        """
+        inputs = {self._key(f): self.file_hash(f) for f in files}
+        blob = json.dumps({"files": inputs, "values": values or {}}, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def is_current(self, outputs: Iterable, digest: Optional[str]) -> bool:
+        """
+        True when every output was built from this digest and is untouched since
+
+        A None digest marks inputs that can't be fingerprinted (a live
+        database query, say); such outputs are never current.
+        """
+        if self.force or digest is None:
+            return False
+        outputs = list(outputs)
+        if not outputs:
+            return False
+        for output in outputs:
+            entry = self.outputs.get(self._key(output))
+            if not entry or entry.get("inputs") != digest:
+                return False
+            if self.file_hash(output) != entry.get("sha256"):
+                return False
+        return True
+
+    def is_recorded(self, path) -> bool:
+        """True if the file on disk is exactly the output this manifest last recorded."""
+        entry = self.outputs.get(self._key(path))
+        return bool(entry) and self.file_hash(path) == entry.get("sha256")
+
+    def skip(self, outputs: Iterable):
+        """Count outputs as skipped and credit their last render time as saved."""
+        with self._lock:
+            for output in outputs:
+                key = self._key(output)
+                self.skipped.append(key)
+                self.seconds_saved += self.outputs.get(key, {}).get("seconds", 0.0)
+
+    def record(self, outputs: Iterable, digest: Optional[str], seconds: float):
+        """
+        Remember freshly rendered outputs
+
+        Args:
+            outputs: Files just written (missing ones are not recorded)
+            digest: Input digest they were built from (None: don't record)
+            seconds: Render time, shared evenly between the outputs
+        """
+        outputs = list(outputs)
+        share = seconds / len(outputs) if outputs else 0.0
+        with self._lock:
+            for output in outputs:
+                key = self._key(output)
+                self.rendered.append(key)
+                sha = self.file_hash(output)
+                if digest is None or sha is None:
+                    if self.outputs.pop(key, None) is not None:
+                        self._dirty = True
+                    continue
+                self.outputs[key] = {"inputs": digest, "sha256": sha, "seconds": round(share, 3)}
+                self._dirty = True
+
+    def save(self):
+        """Write the manifest atomically if anything was recorded."""
+        if not self._dirty:
+            return
+        payload = {"version": MANIFEST_VERSION, "outputs": dict(sorted(self.outputs.items()))}
+        OutputWriter().write_text(self.manifest_file, json.dumps(payload, indent=2) + "\n")
+        self._dirty = False
+
+    def start_run(self):
+        """Reset the rendered / skipped counters (a long-running process builds many times)."""
+        with self._lock:
+            self.rendered = []
+            self.skipped = []
+            self.seconds_saved = 0.0
+
+    def summary(self) -> str:
+        line = f"Build: {len(self.rendered)} rendered, {len(self.skipped)} skipped"
+        if self.skipped:
+            line += f" (~{self.seconds_saved:.1f}s saved)"
+        if self.force:
+            line += " [--force]"
+        return line
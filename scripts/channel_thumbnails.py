@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Persistent channel avatar cache for the channels page.
+
+Every channels build used to call channels().list for each creator, one
+request per channel, on a freshly built API client, even though avatars
+rarely change and creator_history.json already remembered one per creator.
+ChannelThumbnailCache keeps the avatar URL per channel ID in
+data/channel_thumbnails.json with the date it was fetched. Only channels
+that are missing or older than the TTL are looked up again (the caller
+batches them, 50 IDs per request).
+
+Optionally (generation.mirror_channel_avatars in config/project.json) the
+avatars are downloaded to public/images/channels/<channel_id>.jpg and the
+page links to that copy instead of hot-linking googleusercontent / ggpht.
+A mirrored file is re-downloaded only when the channel's avatar URL changes.
+
+Typical use:
+
+    cache = ChannelThumbnailCache(data_dir / "channel_thumbnails.json")
+    cache.seed(history.values())
+    missing = cache.stale(channel_ids)
+    cache.store(missing, fetch_from_youtube(missing))
+    cache.save()
+    src = cache.src(channel_id, fallback=PLACEHOLDER)
+"""
+
+import json
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from output_writer import OutputWriter
+
+# Days before a cached avatar URL is looked up again
+THUMBNAIL_TTL_DAYS = 30
+
+# Mirrored avatars: public/images/channels/<channel_id>.jpg, served from /images/channels/
+AVATAR_URL_PREFIX = "/images/channels/"
+DOWNLOAD_WORKERS = 8
+
+
+def _download(url: str) -> bytes:
+    req = urllib.request.Request(url, headers={"User-Agent": "carnivore-weekly-generator"})
+    with urllib.request.urlopen(req, timeout=20) as resp:
+        return resp.read()
+
+
+def _is_remote(url) -> bool:
+    return isinstance(url, str) and url.startswith(("http://", "https://"))
+
+
+class ChannelThumbnailCache:
+    """Channel ID -> avatar URL, with fetch dates and optional local copies."""
+
+    def __init__(
+        self,
+        cache_file: Path,
+        ttl_days: int = THUMBNAIL_TTL_DAYS,
+        avatar_dir: Optional[Path] = None,
+        today: Optional[date] = None,
+    ):
+        """
+        Args:
+            cache_file: JSON file the cache persists to
+            ttl_days: Refresh avatars fetched longer ago than this
+            avatar_dir: Mirror avatars into this directory (None: hot-link)
+            today: Override the current date (tests)
+        """
+        self.cache_file = Path(cache_file)
+        self.ttl_days = ttl_days
+        self.avatar_dir = Path(avatar_dir) if avatar_dir else None
+        self.today = today or date.today()
+        self.fetched = 0
+        self.mirrored = 0
+        self.entries: Dict[str, Dict] = {}
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                self.entries = json.load(f).get("channels", {})
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+
+    def seed(self, creators: Iterable[Dict]):
+        """
+        Adopt avatars already recorded in creator_history.json
+
+        Channels the cache doesn't know yet take the history's thumbnail_url,
+        dated by the creator's last_seen, so the first cached build doesn't
+        re-fetch every channel. Placeholders and local paths are ignored.
+        """
+        for creator in creators:
+            channel_id = creator.get("channel_id")
+            url = creator.get("thumbnail_url")
+            if channel_id and channel_id not in self.entries and _is_remote(url):
+                if "placeholder" in url:
+                    continue
+                self.entries[channel_id] = {"url": url, "fetched": creator.get("last_seen", "")}
+
+    def _expired(self, entry: Dict) -> bool:
+        try:
+            fetched = date.fromisoformat(entry.get("fetched", ""))
+        except (TypeError, ValueError):
+            return True
+        return self.today - fetched > timedelta(days=self.ttl_days)
+
+    def stale(self, channel_ids: Iterable[str]) -> List[str]:
+        """Channel IDs that are missing from the cache or past the TTL, deduplicated"""
+        out = []
+        for channel_id in dict.fromkeys(c for c in channel_ids if c):
+            entry = self.entries.get(channel_id)
+            if entry is None or self._expired(entry):
+                out.append(channel_id)
+        return out
+
+    def store(self, requested: Iterable[str], images: Dict[str, str]):
+        """
+        Record a lookup
+
+        Args:
+            requested: Channel IDs that were looked up
+            images: channel ID -> avatar URL for those the API returned; the
+                rest are remembered as having none (until the TTL runs out)
+        """
+        stamp = self.today.isoformat()
+        for channel_id in requested:
+            entry = self.entries.setdefault(channel_id, {})
+            entry["url"] = images.get(channel_id) or entry.get("url")
+            entry["fetched"] = stamp
+        self.fetched += len(images)
+
+    def urls(self, channel_ids: Iterable[str]) -> Dict[str, str]:
+        """channel ID -> remote avatar URL for the channels that have one"""
+        return {
+            c: self.entries[c]["url"]
+            for c in channel_ids
+            if c in self.entries and self.entries[c].get("url")
+        }
+
+    def mirror(self, channel_ids: Iterable[str], download: Callable[[str], bytes] = _download):
+        """
+        Download avatars that have no local copy, or whose URL changed
+
+        A no-op unless the cache was created with an avatar_dir. Failed
+        downloads keep hot-linking and are retried on the next build.
+        """
+        if self.avatar_dir is None:
+            return
+        todo = []
+        for channel_id in dict.fromkeys(channel_ids):
+            entry = self.entries.get(channel_id)
+            if not entry or not _is_remote(entry.get("url")):
+                continue
+            path = self.avatar_dir / f"{channel_id}.jpg"
+            if entry.get("mirrored_from") != entry["url"] or not path.exists():
+                todo.append((channel_id, entry["url"], path))
+        if not todo:
+            return
+
+        self.avatar_dir.mkdir(parents=True, exist_ok=True)
+
+        def fetch(job):
+            channel_id, url, path = job
+            try:
+                body = download(url)
+            except Exception as e:
+                return channel_id, url, e
+            OutputWriter().write_bytes(path, body)
+            return channel_id, url, None
+
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            for channel_id, url, error in pool.map(fetch, todo):
+                if error is None:
+                    self.entries[channel_id]["mirrored_from"] = url
+                    self.mirrored += 1
+                else:
+                    print(f"   ⚠ Could not mirror avatar for {channel_id}: {error}")
+
+    def src(self, channel_id: str, fallback: str) -> str:
+        """What the page should link to: local copy, else remote URL, else fallback"""
+        entry = self.entries.get(channel_id) or {}
+        url = entry.get("url")
+        if (
+            self.avatar_dir is not None
+            and url
+            and entry.get("mirrored_from") == url
+            and (self.avatar_dir / f"{channel_id}.jpg").exists()
+        ):
+            return f"{AVATAR_URL_PREFIX}{channel_id}.jpg"
+        return url or fallback
+
+    def save(self):
+        """Atomically write the cache, skipping the write if nothing changed"""
+        OutputWriter().write_json(
+            self.cache_file,
+            {"ttl_days": self.ttl_days, "channels": self.entries},
+            indent=2,
+            sort_keys=True,
+        )
+
+    def report(self) -> str:
+        return (
+            f"Channel avatars: {len(self.entries)} cached, {self.fetched} fetched"
+            + (f", {self.mirrored} mirrored" if self.avatar_dir is not None else "")
+        )
@@ -26,6 +26,7 @@ from anthropic import Anthropic
 import sys as _sys
 _sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from blog_link_guard import sanitize_cw_blog_links
+from youtube_data_io import load_youtube_data  # noqa: E402
 
 # Load environment variables from project root
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -392,8 +393,7 @@ def main():
                 "Please run youtube_collector.py first!"
             )
 
-        with open(INPUT_FILE, "r", encoding="utf-8") as f:
-            youtube_data = json.load(f)
+        youtube_data = load_youtube_data(INPUT_FILE)
 
         print(f"✓ Loaded data for {len(youtube_data.get('top_creators', []))} creators")
 
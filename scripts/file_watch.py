@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Polling file watcher for `generate.py --watch`.
+
+Stats every file under a few directories and reports which ones were
+added, edited or removed since the last look. templates/, data/ and
+config/ hold a few dozen files, so a full scan costs well under a
+millisecond and a short polling interval is fine. That avoids an inotify /
+FSEvents dependency that would behave differently on each platform.
+
+Editor swap files and the .tmp files left by atomic writers are ignored.
+
+Typical use:
+
+    watcher = FileWatcher([templates_dir, data_dir])
+    while True:
+        for path in watcher.wait(interval=0.1):
+            print("changed:", path)
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+IGNORED_SUFFIXES = (".tmp", ".swp", ".swx", "~")
+
+
+def _ignored(name: str) -> bool:
+    return name.startswith(".") or name.endswith(IGNORED_SUFFIXES)
+
+
+class FileWatcher:
+    """Detects changed files under a set of roots by comparing (mtime, size)."""
+
+    def __init__(self, roots: Iterable):
+        self.roots = [Path(r) for r in roots]
+        self._state = self.scan()
+
+    def scan(self) -> Dict[Path, Tuple[int, int]]:
+        """(mtime_ns, size) for every watched file"""
+        state = {}
+        for root in self.roots:
+            if root.is_file():
+                st = root.stat()
+                state[root] = (st.st_mtime_ns, st.st_size)
+                continue
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                for name in filenames:
+                    if _ignored(name):
+                        continue
+                    path = Path(dirpath) / name
+                    try:
+                        st = path.stat()
+                    except FileNotFoundError:
+                        continue  # removed mid-scan
+                    state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def reset(self):
+        """Forget pending changes; the current tree becomes the baseline."""
+        self._state = self.scan()
+
+    def changes(self) -> List[Path]:
+        """Files added, modified or removed since the last call, sorted."""
+        state = self.scan()
+        changed = {p for p, stamp in state.items() if self._state.get(p) != stamp}
+        changed.update(p for p in self._state if p not in state)
+        self._state = state
+        return sorted(changed)
+
+    def wait(self, interval: float = 0.1, timeout: float = None) -> List[Path]:
+        """
+        Block until something changes
+
+        Args:
+            interval: Seconds between scans
+            timeout: Give up after this many seconds (None: wait forever)
+
+        Returns:
+            Changed files; empty only on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self.changes()
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+            time.sleep(interval)
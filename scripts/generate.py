@@ -13,10 +13,15 @@ Usage:
     python3 scripts/generate.py --type pages
     python3 scripts/generate.py --type newsletter
     python3 scripts/generate.py --type all
+    python3 scripts/generate.py --type all --force   # ignore the build manifest
+    python3 scripts/generate.py --type all --workers 1   # one type at a time
+    python3 scripts/generate.py --type all --watch       # rebuild on every edit
+    python3 scripts/generate.py --type pages --refresh-view-model   # weekly run
 
 Features:
 - Loads configuration from config/project.json
 - Unified data loading and caching
+- Incremental builds: outputs whose inputs are unchanged are skipped
 - Consistent output handling
 - Machine-readable results
 """
@@ -25,13 +30,37 @@ import sys
 import json
 import argparse
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 from datetime import datetime
 
 # Auto-linking for wiki keywords
+from archive_manifest import ArchiveManifest
 from auto_link_wiki_keywords import insert_wiki_links
 from blog_link_guard import sanitize_cw_blog_links
+from build_manifest import BuildManifest, template_chain
+from channel_thumbnails import ChannelThumbnailCache
+from file_watch import FileWatcher
+from generator_data import DataLayer, thaw
+from homepage_view_model import (
+    VIEW_MODEL_FILE,
+    VIEW_MODEL_INPUTS,
+    VIEW_MODEL_VERSION,
+    drop_dead_blog_links,
+    link_topics_to_wiki,
+    load_view_model,
+    parse_key_insights,
+    parse_trending_topics,
+    save_view_model,
+    sentiment_percentages,
+)
+from jinja_cache import bytecode_cache
+from output_writer import OutputWriter
+from stage_runner import run_stages
+from youtube_quota import YouTubeQuota
 from dotenv import load_dotenv
 import os
 
@@ -71,17 +100,56 @@ except ImportError:
 MAX_CHANNEL_CARDS = 60
 PLACEHOLDER_THUMBNAIL = "https://via.placeholder.com/150x150/8b4513/f4e4d4?text=Channel"
 
+# --type all runs the generation types side by side (1 = one after another).
+# A type listed here starts only after the types it depends on have finished.
+# None depend on each other today: each reads data/ and templates/ only and
+# writes files no other type reads.
+GENERATION_WORKERS = 5
+
+# --watch: seconds between scans of templates/, data/ and config/
+WATCH_INTERVAL = 0.1
+
+# Weeks per archive listing page; later pages are public/archive-2.html, ...
+ARCHIVE_PAGE_SIZE = 10
+STAGE_DEPENDENCIES: Dict[str, tuple] = {}
+
 
 class UnifiedGenerator:
     """Unified generation system for all content types"""
 
-    def __init__(self, config_path: str = "config/project.json", site: str = "cw"):
+    def __init__(
+        self,
+        config_path: str = "config/project.json",
+        site: str = "cw",
+        force: bool = False,
+        workers: int = 1,
+        refresh_view_model: bool = False,
+    ):
         """Initialize generator with configuration"""
         self.config_path = Path(config_path)
         self.config = self._load_config()
         self.project_root = Path(self.config["paths"]["project_root"])
         self.site = site
-        self.data_cache = {}
+        self.workers = max(1, int(workers))
+        # Every data file is parsed once per process and shared read-only
+        self.data_layer = DataLayer()
+        # Outputs whose inputs haven't changed since the last build are skipped
+        self.build = BuildManifest(
+            self.project_root / self.config["paths"]["data_dir"] / "build_manifest.json",
+            root=self.project_root,
+            force=force,
+        )
+        # Every output goes through here: unchanged files are not rewritten
+        self.writer = OutputWriter()
+        self._archive = None
+        # Re-assemble data/homepage_view_model.json even if current (weekly run)
+        self.refresh_view_model = refresh_view_model
+        self._view_model = None  # (fingerprint, view) last loaded or assembled
+        self._roundup_image = None  # (date, path): resolved once per day
+        self._youtube = None  # API client, built on first use and reused
+        self._thumbnails = None  # ChannelThumbnailCache, loaded on first use
+        # Stale outputs of the type being generated, per thread (see _needs_render)
+        self._local = threading.local()
         self._setup_jinja()
         self._setup_supabase()
 
@@ -97,7 +165,10 @@ class UnifiedGenerator:
     def _setup_jinja(self):
         """Setup Jinja2 environment"""
         templates_dir = self.project_root / self.config["paths"]["templates_dir"]
-        self.jinja_env = Environment(loader=FileSystemLoader(templates_dir))
+        # Compiled templates persist in .cache/jinja, so a cold start skips compilation
+        self.jinja_env = Environment(
+            loader=FileSystemLoader(templates_dir), bytecode_cache=bytecode_cache("site")
+        )
 
         # Add custom filters
         def format_date(date_str):
@@ -224,9 +295,8 @@ class UnifiedGenerator:
         # Load sentiment data from youtube_data.json
         sentiment_map = {}
         try:
-            youtube_path = self.project_root / "data" / "youtube_data.json"
-            if youtube_path.exists():
-                youtube_data = json.loads(youtube_path.read_text())
+            youtube_data = self.read_data_file("youtube_data.json")
+            if youtube_data:
                 for creator in youtube_data.get("top_creators", []):
                     for video in creator.get("videos", []):
                         video_id = video.get("video_id", "")
@@ -330,10 +400,6 @@ class UnifiedGenerator:
         Returns:
             Dictionary containing the data
         """
-        if data_type in self.data_cache:
-            return self.data_cache[data_type]
-
-        data = {}
         data_dir = self.project_root / self.config["paths"]["data_dir"]
 
         # For analyzed_content, always use JSON (has full markdown that can be parsed)
@@ -350,14 +416,25 @@ class UnifiedGenerator:
             return {}
 
         try:
-            with open(data_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            self.data_cache[data_type] = data
-            return data
+            return self.data_layer.read_json(data_file)
         except Exception as e:
             print(f"Error loading data from {data_file}: {e}")
             return {}
 
+    def read_data_file(self, name: str, default=None):
+        """
+        Shared read-only parse of a file in the data directory
+
+        Args:
+            name: Path relative to the data dir (e.g. "archive/2026-01-05.json")
+            default: Returned when the file does not exist
+
+        Returns:
+            Read-only view of the parsed JSON (copy with thaw() to edit)
+        """
+        data_dir = self.project_root / self.config["paths"]["data_dir"]
+        return self.data_layer.read_json(data_dir / name, default=default)
+
     def generate(self, generation_type: str) -> bool:
         """
         Generate content of specified type
@@ -379,28 +456,246 @@ class UnifiedGenerator:
             )
             return False
 
-        success = True
-        for gen_type in types:
-            if not self._generate_single(gen_type):
-                success = False
-
+        self.build.start_run()
+        start = time.perf_counter()
+        results = run_stages(
+            [(t, lambda t=t: self._generate_single(t)) for t in types],
+            STAGE_DEPENDENCIES,
+            workers=self.workers,
+        )
+        success = all(r.ok for r in results.values())
+
+        self.build.save()
+        print(f"\n📦 {self.data_layer.report()}")
+        if self.jinja_env.bytecode_cache is not None:
+            print(f"📦 {self.jinja_env.bytecode_cache.report()}")
+        print(f"📦 {self.build.summary()}")
+        print(f"📦 {self.writer.report()}")
+        if self.workers > 1 and len(types) > 1:
+            stages = ", ".join(f"{t} {r.seconds:.1f}s" for t, r in results.items())
+            print(f"⏱  {time.perf_counter() - start:.1f}s wall ({stages})")
         return success
 
+    def watch(self, generation_type: str = "all", interval: float = WATCH_INTERVAL):
+        """
+        Stay resident and rebuild whenever templates/, data/ or config/ change
+
+        The generator, its Jinja environment (which reloads edited
+        templates) and the parsed data layer (which re-parses changed files)
+        are kept between builds, and the build manifest limits each rebuild
+        to the outputs the changed files feed. Runs until Ctrl+C.
+
+        Args:
+            generation_type: Type to rebuild on change (or all)
+            interval: Seconds between scans for changes
+        """
+        paths = self.config["paths"]
+        data_dir = self.project_root / paths["data_dir"]
+        watcher = FileWatcher(
+            [self.project_root / paths["templates_dir"], data_dir, self.config_path.parent]
+        )
+        # Files the generator writes itself land in data/ too; they must not
+        # trigger another rebuild
+        bookkeeping = {
+            self.build.manifest_file.resolve(),
+            (data_dir / VIEW_MODEL_FILE).resolve(),
+            (data_dir / "archive" / "manifest.json").resolve(),
+            (data_dir / "channel_thumbnails.json").resolve(),
+        }
+
+        def own_write(path):
+            path = path.resolve()
+            return path in bookkeeping or self.build.is_recorded(path)
+
+        self.generate(generation_type)
+        watcher.reset()
+        print(f"\n👀 Watching {paths['templates_dir']}/, {paths['data_dir']}/ and "
+              f"{self.config_path.parent}/ (Ctrl+C to stop; restart after code changes)")
+
+        pending = []
+        try:
+            while True:
+                changed = pending or watcher.wait(interval)
+                start = time.perf_counter()
+                if self.config_path.resolve() in {p.resolve() for p in changed}:
+                    self.config = self._load_config()
+                success = self.generate(generation_type)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+
+                names = ", ".join(str(p) for p in changed[:3])
+                if len(changed) > 3:
+                    names += f" +{len(changed) - 3} more"
+                status = "⚡ Rebuilt" if success else "❌ Rebuild failed"
+                print(
+                    f"{status} in {elapsed_ms:.0f} ms after {names} changed "
+                    f"({len(self.build.rendered)} rendered, {len(self.build.skipped)} skipped)"
+                )
+                pending = [p for p in watcher.changes() if not own_write(p)]
+        except KeyboardInterrupt:
+            self.build.save()
+            print("\n👋 Stopped watching")
+
+    def _build_targets(self, generation_type: str) -> list:
+        """
+        Outputs of one generation type and a digest of the inputs behind them
+
+        Args:
+            generation_type: One of pages, archive, newsletter, channels, wiki
+
+        Returns:
+            List of (output paths, digest) pairs. Archive has one pair for the
+            listing and one per week page; a digest of None means an input
+            can't be fingerprinted and the outputs are always rendered.
+        """
+        mappings = self.config["generation"]["template_mappings"]
+        data_dir = self.project_root / self.config["paths"]["data_dir"]
+        public_dir = self.project_root / self.config["paths"]["public_dir"]
+        scripts_dir = Path(__file__).resolve().parent
+        # Generator code and config feed every output
+        code = [
+            scripts_dir / name
+            for name in (
+                "generate.py",
+                "generator_data.py",
+                "auto_link_wiki_keywords.py",
+                "blog_link_guard.py",
+            )
+        ] + [self.config_path]
+
+        def target(outputs, files=(), template=None, **values):
+            templates = template_chain(self.jinja_env, template) if template else []
+            digest = self.build.digest(
+                code + templates + [data_dir / f for f in files],
+                {"type": generation_type, "site": self.site, **values},
+            )
+            return [self.project_root / o for o in outputs], digest
+
+        if generation_type == "pages":
+            mapping = mappings["pages"]
+            # Bring the weekly view model up to date first, so the digest
+            # covers the artifact the page is rendered from (Supabase rows
+            # included)
+            self._homepage_view_model()
+            return [
+                target(
+                    [mapping["output"]],
+                    [VIEW_MODEL_FILE, "blog_posts.json"],
+                    mapping["template"],
+                    # Blog links are dropped unless the post is on disk, and the
+                    # roundup image is whichever one already exists
+                    blog_pages=sorted(p.name for p in (public_dir / "blog").glob("*.html")),
+                    roundup_images=sorted(p.name for p in (public_dir / "images").glob("roundup-*")),
+                )
+            ]
+
+        if generation_type == "archive":
+            manifest = self._archive_manifest()
+            pages = manifest.pages(ARCHIVE_PAGE_SIZE)
+            summary_keys = ("date", "total_creators", "total_videos", "summary_preview")
+            targets = [
+                target(
+                    [self._archive_listing_path(number)],
+                    template=mappings["archive"]["template"],
+                    page=number,
+                    total_pages=len(pages),
+                    total_weeks=len(manifest.weeks),
+                    weeks=[{k: row[k] for k in summary_keys} for row in weeks],
+                )
+                for number, weeks in enumerate(pages, 1)
+            ]
+            # A week page depends on its own week file (by the hash the
+            # manifest already took) and on the creator -> channel mapping it
+            # links with, so editing one week re-renders one page
+            creator_channels = self._creator_channels()
+            for row in manifest.rows():
+                targets.append(
+                    target(
+                        [f"public/archive/{row['date']}.html"],
+                        template=mappings["pages"]["template"],
+                        week_sha256=row["sha256"],
+                        creator_channels=creator_channels,
+                    )
+                )
+            return targets
+
+        if generation_type == "newsletter":
+            mapping = mappings["newsletter"]
+            content = self.read_data_file("newsletter_content.json", {})
+            date_str = content.get("date") or datetime.now().strftime("%Y-%m-%d")
+            return [
+                target(
+                    [f"newsletters/{date_str}.html", "public/newsletter-preview.html"],
+                    [
+                        "newsletter_content.json",
+                        "newsletter_affiliates.json",
+                        "youtube_data.json",
+                        "youtube_data.ndjson",
+                        scripts_dir / "generate_newsletter.py",
+                        scripts_dir / "youtube_data_io.py",
+                    ],
+                    mapping["template"],
+                    date=date_str,
+                )
+            ]
+
+        if generation_type == "channels":
+            mapping = mappings["channels"]
+            # creator_history and channel_rankings are read back as well as
+            # written; as outputs their recorded hash already guards them.
+            # The run date is an input: it stamps "last seen" on every card.
+            return [
+                target(
+                    [mapping["output"], "data/channel_rankings.json", "data/creator_history.json"],
+                    ["analyzed_content.json", "youtube_data.json", "creator_bios.json"],
+                    mapping["template"],
+                    run_date=datetime.now().strftime("%Y-%m-%d"),
+                )
+            ]
+
+        if generation_type == "wiki":
+            return [target([mappings["wiki"]["output"]], ["analyzed_content.json"])]
+
+        return []
+
+    def _needs_render(self, output_file) -> bool:
+        """False for an output the build manifest found up to date."""
+        stale = getattr(self._local, "stale_outputs", None)
+        if stale is None:
+            return True
+        return Path(output_file).resolve() in stale
+
     def _generate_single(self, generation_type: str) -> bool:
         """Generate a single content type"""
         print(f"\n🎨 Generating {generation_type}...")
 
+        try:
+            targets = self._build_targets(generation_type)
+        except Exception as e:
+            print(f"  ⚠ Could not check build manifest ({e}) — rendering everything")
+            targets = []
+
+        stale = [t for t in targets if not self.build.is_current(*t)]
+        for outputs, digest in targets:
+            if (outputs, digest) not in stale:
+                self.build.skip(outputs)
+        if targets and not stale:
+            print(f"⏭  {generation_type} inputs unchanged — skipped (--force to rebuild)")
+            return True
+        if targets:
+            self._local.stale_outputs = {p.resolve() for outputs, _ in stale for p in outputs}
+
+        start = time.perf_counter()
         try:
             if generation_type == "pages":
-                return self._generate_pages()
+                ok = self._generate_pages()
             elif generation_type == "archive":
-                return self._generate_archive()
+                ok = self._generate_archive()
             elif generation_type == "newsletter":
-                return self._generate_newsletter()
+                ok = self._generate_newsletter()
             elif generation_type == "channels":
-                return self._generate_channels()
+                ok = self._generate_channels()
             elif generation_type == "wiki":
-                return self._generate_wiki()
+                ok = self._generate_wiki()
             else:
                 print(f"Unknown generation type: {generation_type}")
                 return False
@@ -409,14 +704,22 @@ class UnifiedGenerator:
             print(f"Error generating {generation_type}: {e}")
             traceback.print_exc()
             return False
+        finally:
+            self._local.stale_outputs = None
+
+        if ok:
+            seconds = (time.perf_counter() - start) / max(len(stale), 1)
+            for outputs, digest in stale:
+                self.build.record(outputs, digest, seconds)
+        return ok
 
     def _generate_pages(self) -> bool:
         """Generate main pages from templates"""
         mapping = self.config["generation"]["template_mappings"]["pages"]
 
-        # Load data
-        data = self.load_data("analyzed_content")
-        if not data:
+        # Weekly content, assembled once per analysis run (see homepage_view_model.py)
+        view = self._homepage_view_model()
+        if view is None:
             print("Error: No data available for page generation")
             return False
 
@@ -427,240 +730,161 @@ class UnifiedGenerator:
             print(f"Error loading template {mapping['template']}: {e}")
             return False
 
-        # Prepare template variables
-        # Handle both flat and nested data structures
-        analysis = data.get("analysis", {})
-        source_data = data.get("source_data", {})
-
-        # Support both flat structure (from new analyzer) and nested structure
-        weekly_summary = analysis.get("weekly_summary", data.get("weekly_summary", ""))
+        # Blog posts publish daily, so links to them are checked against disk
+        # at render time rather than frozen into the weekly view model
+        public_dir = self.project_root / self.config["paths"]["public_dir"]
 
         # ISSUE-038 guard: strip any /blog/ link the editorial cites that isn't a
         # live CW post on disk (KD posts / hallucinated slugs 404 and block publish).
         weekly_summary, _dead_links = sanitize_cw_blog_links(
-            weekly_summary, str(self.project_root / "public")
+            view["weekly_summary"], str(public_dir)
         )
         if _dead_links:
             print(f"  ⚠️  ISSUE-038 guard stripped dead CW /blog/ links from weekly_summary: {_dead_links}")
 
-        # Handle trending_topics - parse markdown string to structured array
-        trending_topics_raw = analysis.get("trending_topics", data.get("trending_topics", []))
+        # Carry through topic blog_link only if target file exists
+        trending_topics = drop_dead_blog_links(view["trending_topics"], public_dir)
+
+        newest_blog_posts, popular_blog_posts, more_blog_posts = self._blog_post_lists()
+
+        # The lookup shells out to generate_roundup_image.py; a resident
+        # --watch process only needs it once a day
+        today = datetime.now().strftime("%Y-%m-%d")
+        if not self._roundup_image or self._roundup_image[0] != today:
+            self._roundup_image = (today, _get_roundup_image())
+        roundup_image = self._roundup_image[1]
+        roundup_image_width, roundup_image_height = _get_image_dims(roundup_image)
+
+        template_vars = {
+            **view,
+            "generation_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "weekly_summary": weekly_summary,
+            "trending_topics": trending_topics,
+            "newest_blog_posts": newest_blog_posts,  # 5 posts from last 7 days
+            "popular_blog_posts": popular_blog_posts,  # 3 most popular blog posts (older/established)
+            "more_blog_posts": more_blog_posts,  # Up to 60 additional posts for Load More section
+            "roundup_image": roundup_image,
+            "roundup_image_width": roundup_image_width,
+            "roundup_image_height": roundup_image_height,
+        }
+
+        # Render template
+        try:
+            html_content = template.render(**template_vars)
+        except Exception as e:
+            print(f"Error rendering template: {e}")
+            return False
+
+        # Write output
+        output_file = self.project_root / mapping["output"]
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            self._write_output(output_file, html_content)
+            return True
+        except Exception as e:
+            print(f"Error writing output file {output_file}: {e}")
+            return False
+
+    def _write_output(self, output_file: Path, content: str, note: str = ""):
+        """Write a generated file through the shared writer and say what happened"""
+        written = self.writer.write_text(output_file, content)
+        print(f"✓ {'Generated' if written else 'Unchanged'}: {output_file}{note}")
+
+    def _view_model_fingerprint(self) -> str:
+        """Digest of everything the homepage view model is assembled from"""
+        data_dir = self.project_root / self.config["paths"]["data_dir"]
+        scripts_dir = Path(__file__).resolve().parent
+        code = [
+            scripts_dir / name
+            for name in ("generate.py", "homepage_view_model.py", "auto_link_wiki_keywords.py")
+        ]
+        return self.build.digest(
+            code + [data_dir / name for name in VIEW_MODEL_INPUTS],
+            {"site": self.site, "version": VIEW_MODEL_VERSION},
+        )
+
+    def _homepage_view_model(self):
+        """
+        Weekly homepage content, from data/homepage_view_model.json when current
+
+        The artifact is re-assembled when its version or input fingerprint
+        no longer matches, and once per process with --refresh-view-model
+        (the weekly run, so fresh Supabase rows are picked up too).
+
+        Returns:
+            The view dict, or None when there is no analysis to build from
+        """
+        path = self.project_root / self.config["paths"]["data_dir"] / VIEW_MODEL_FILE
+        fingerprint = self._view_model_fingerprint()
+        if not self.refresh_view_model:
+            if self._view_model and self._view_model[0] == fingerprint:
+                return self._view_model[1]
+            view = load_view_model(path, fingerprint)
+            if view is not None:
+                print(f"  ✓ Homepage view model is current ({VIEW_MODEL_FILE})")
+                self._view_model = (fingerprint, view)
+                return view
+
+        start = time.perf_counter()
+        view = self._assemble_homepage_view_model()
+        if view is None:
+            return None
+        self.refresh_view_model = False
+        self._view_model = (fingerprint, view)
+        try:
+            save_view_model(path, view, fingerprint)
+            print(
+                f"  ✓ Assembled homepage view model in "
+                f"{(time.perf_counter() - start) * 1000:.0f} ms → {VIEW_MODEL_FILE}"
+            )
+        except OSError as e:
+            print(f"  ⚠ Could not save {VIEW_MODEL_FILE}: {e}")
+        return view
+
+    def _assemble_homepage_view_model(self):
+        """
+        Assemble the weekly homepage content from the analysis and video data
+
+        Returns:
+            JSON-serialisable dict of template variables, or None when
+            analyzed_content.json is missing
+        """
+        data = self.load_data("analyzed_content")
+        if not data:
+            return None
+
+        # Handle both flat and nested data structures
+        analysis = data.get("analysis", {})
+        source_data = data.get("source_data", {})
+
+        # Support both flat structure (from new analyzer) and nested structure
+        weekly_summary = analysis.get("weekly_summary", data.get("weekly_summary", ""))
 
         # Load wiki keywords for matching
         wiki_keyword_map = {}
-        wiki_keywords_path = self.project_root / "data" / "wiki-keywords.json"
-        if wiki_keywords_path.exists():
-            try:
-                wiki_data = json.loads(wiki_keywords_path.read_text())
-                wiki_keyword_map = wiki_data.get("keyword_map", {})
-            except Exception:
-                pass
-
-        if isinstance(trending_topics_raw, str):
-            # Clean up markdown code fences if present
-            clean_raw = trending_topics_raw.strip()
-            if clean_raw.startswith("```"):
-                clean_raw = clean_raw.replace("```json", "").replace("```", "").strip()
+        try:
+            wiki_keyword_map = self.read_data_file("wiki-keywords.json", {}).get("keyword_map", {})
+        except Exception:
+            pass
 
-            # First, try to parse as JSON array (new format)
-            try:
-                import json as json_lib
-
-                parsed_topics = json_lib.loads(clean_raw)
-                if isinstance(parsed_topics, list):
-                    # Handle both new format (objects with wiki_keyword) and old format (strings)
-                    trending_topics = []
-                    for topic in parsed_topics:
-                        if isinstance(topic, dict):
-                            # New format: {"topic": "...", "wiki_keyword": "..."}
-                            topic_obj = {
-                                "topic": topic.get("topic", ""),
-                                "description": "",
-                                "mentioned_by": ["Analysis"],
-                            }
-                            # Carry through blog_link only if target file exists
-                            if topic.get("blog_link"):
-                                blog_file = Path(__file__).parent.parent / "public" / topic["blog_link"].lstrip("/")
-                                if blog_file.exists():
-                                    topic_obj["blog_link"] = topic["blog_link"]
-                            # Add wiki link if keyword provided and exists in map
-                            wiki_kw = topic.get("wiki_keyword")
-                            if wiki_kw and wiki_kw in wiki_keyword_map:
-                                # Strip both /wiki/# and wiki.html# prefixes to get clean anchor
-                                anchor = (
-                                    wiki_keyword_map[wiki_kw]
-                                    .replace("/wiki/#", "")
-                                    .replace("wiki.html#", "")
-                                )
-                                topic_obj["wiki_links"] = [
-                                    {"anchor": anchor, "title": wiki_kw.title()}
-                                ]
-                            trending_topics.append(topic_obj)
-                        else:
-                            # Old format: simple string
-                            trending_topics.append(
-                                {
-                                    "topic": str(topic),
-                                    "description": "",
-                                    "mentioned_by": ["Analysis"],
-                                }
-                            )
-                else:
-                    raise ValueError("Not a list")
-            except (json_lib.JSONDecodeError, ValueError):
-                # Fall back to markdown parsing
-                trending_topics = []
-                lines = trending_topics_raw.split("\n")
-                current_topic = None
-
-                for line in lines:
-                    line_stripped = line.strip()
-
-                    # Look for h3 headers (### Topic Name)
-                    if line_stripped.startswith("### "):
-                        if current_topic and current_topic["description"]:
-                            trending_topics.append(current_topic)
-                        current_topic = {
-                            "topic": line_stripped.replace("### ", "")
-                            .replace("**", "")
-                            .replace("#", ""),
-                            "description": "",
-                            "mentioned_by": ["Analysis"],
-                        }
-                    # Look for description content
-                    elif current_topic and line_stripped:
-                        # Skip empty lines and markdown-only lines
-                        if line_stripped in ["---", "**", "##", "-", "*"]:
-                            continue
-                        # Skip header lines
-                        if line_stripped.startswith("#"):
-                            continue
-                        # Include bullet points and regular text
-                        if line_stripped.startswith("- "):
-                            # Remove bullet and add as description
-                            content = line_stripped[2:].strip()
-                            if current_topic["description"]:
-                                current_topic["description"] += " " + content
-                            else:
-                                current_topic["description"] = content
-                        elif line_stripped and not line_stripped.startswith("---"):
-                            # Add regular text
-                            if not line_stripped.startswith("**") or not line_stripped.endswith(
-                                "**"
-                            ):
-                                if current_topic["description"]:
-                                    current_topic["description"] += " " + line_stripped
-                                else:
-                                    current_topic["description"] = line_stripped
-
-                # Add last topic
-                if current_topic and current_topic["description"]:
-                    trending_topics.append(current_topic)
-
-                # If parsing failed, use defaults
-                if not trending_topics:
-                    trending_topics = [
-                        {
-                            "topic": "Content Opportunities",
-                            "description": trending_topics_raw[:100],
-                            "mentioned_by": ["Analysis"],
-                        }
-                    ]
-        elif isinstance(trending_topics_raw, list):
-            trending_topics = trending_topics_raw
-        else:
-            trending_topics = []
+        # Handle trending_topics - parse markdown string to structured array
+        trending_topics = parse_trending_topics(
+            analysis.get("trending_topics", data.get("trending_topics", [])), wiki_keyword_map
+        )
 
         # Add wiki_links to trending topics by matching keywords (fallback only)
         # Only apply if wiki_links wasn't already set during parsing
-        wiki_keywords_path = self.project_root / "data" / "wiki-keywords.json"
-        if wiki_keywords_path.exists():
+        if wiki_keyword_map:
             try:
-                wiki_data = json.loads(wiki_keywords_path.read_text())
-                keyword_map = wiki_data.get("keyword_map", {})
-
-                for topic in trending_topics:
-                    # Skip if wiki_links already set from explicit wiki_keyword
-                    if isinstance(topic, dict) and topic.get("wiki_links"):
-                        continue
-
-                    topic_name = topic.get("topic", "") if isinstance(topic, dict) else str(topic)
-                    topic_lower = topic_name.lower()
-
-                    # Try to find a matching wiki keyword based on topic name.
-                    # Require at least 2 meaningful words to overlap to avoid false matches
-                    # (e.g. single-word "coffee" matching "Ribeye Steak Preparation").
-                    wiki_links = []
-                    topic_words = set(w for w in topic_lower.split() if len(w) > 3)
-                    for keyword, wiki_url in keyword_map.items():
-                        keyword_words = set(w for w in keyword.lower().split() if len(w) > 3)
-                        overlap = topic_words & keyword_words
-                        if len(overlap) >= 2:
-                            anchor = wiki_url.replace("/wiki/#", "").replace("wiki.html#", "")
-                            wiki_links.append({"anchor": anchor, "title": keyword.title()})
-                            break  # Just need one match
-
-                    if isinstance(topic, dict) and wiki_links:
-                        topic["wiki_links"] = wiki_links
+                link_topics_to_wiki(trending_topics, wiki_keyword_map)
             except Exception as e:
                 print(f"  Warning: Could not load wiki keywords: {e}")
 
         # Handle key_insights - parse markdown string to structured array
-        key_insights_raw = analysis.get("key_insights", data.get("key_insights", []))
-        if isinstance(key_insights_raw, str):
-            # Parse markdown-formatted insights string into structured list
-            key_insights = []
-            lines = key_insights_raw.split("\n")
-            current_insight = None
-
-            for line in lines:
-                line_stripped = line.strip()
-
-                # Look for h3 headers (### Insight Title)
-                if line_stripped.startswith("### "):
-                    if current_insight and current_insight["description"]:
-                        key_insights.append(current_insight)
-                    current_insight = {
-                        "title": line_stripped.replace("### ", "")
-                        .replace("**", "")
-                        .replace("#", ""),
-                        "description": "",
-                    }
-                # Look for description content
-                elif current_insight and line_stripped:
-                    # Skip empty lines and markdown-only lines
-                    if line_stripped in ["---", "**", "##", "-", "*"]:
-                        continue
-                    # Skip header lines
-                    if line_stripped.startswith("#"):
-                        continue
-                    # Include bullet points and regular text
-                    if line_stripped.startswith("- "):
-                        # Remove bullet and add as description
-                        content = line_stripped[2:].strip()
-                        if current_insight["description"]:
-                            current_insight["description"] += " " + content
-                        else:
-                            current_insight["description"] = content
-                    elif line_stripped and not line_stripped.startswith("---"):
-                        # Add regular text
-                        if not line_stripped.startswith("**") or not line_stripped.endswith("**"):
-                            if current_insight["description"]:
-                                current_insight["description"] += " " + line_stripped
-                            else:
-                                current_insight["description"] = line_stripped
-
-            # Add last insight
-            if current_insight and current_insight["description"]:
-                key_insights.append(current_insight)
-
-            # If parsing failed, use defaults
-            if not key_insights:
-                key_insights = [{"title": "Key Insight", "description": key_insights_raw[:100]}]
-        elif isinstance(key_insights_raw, list):
-            key_insights = key_insights_raw
-        else:
-            key_insights = []
+        key_insights = parse_key_insights(
+            analysis.get("key_insights", data.get("key_insights", []))
+        )
 
         # Load editorial commentary from content-of-the-week.json
         # Priority 1: If curated videos exist, build top_videos directly from them.
@@ -668,9 +892,8 @@ class UnifiedGenerator:
         editorial_commentary = {}
         top_videos = []
         try:
-            content_week_path = self.project_root / "data" / "content-of-the-week.json"
-            if content_week_path.exists():
-                content_week_data = json.loads(content_week_path.read_text())
+            content_week_data = self.read_data_file("content-of-the-week.json")
+            if content_week_data:
                 for video in content_week_data.get("featured_videos", []):
                     vid_id = video["video_id"]
                     editorial_commentary[vid_id] = {
@@ -714,9 +937,8 @@ class UnifiedGenerator:
         # Priority 3: Load from JSON file (fresh data or fallback)
         if not top_videos:
             try:
-                youtube_path = self.project_root / "data" / "youtube_data.json"
-                if youtube_path.exists():
-                    youtube_data = json.loads(youtube_path.read_text())
+                youtube_data = self.read_data_file("youtube_data.json")
+                if youtube_data:
                     # Convert YouTube data to template format
                     for creator in youtube_data.get("top_creators", []):
                         for video in creator.get("videos", []):  # All videos (editorial filter trims later)
@@ -740,24 +962,9 @@ class UnifiedGenerator:
                             }
                             # Include sentiment scores if available
                             if video.get("comment_sentiment"):
-                                sentiment = video["comment_sentiment"]
-                                # Calculate percentages for sentiment bar
-                                total_comments = (
-                                    sentiment.get("positive_count", 0)
-                                    + sentiment.get("negative_count", 0)
-                                    + sentiment.get("neutral_count", 0)
+                                video_obj["comment_sentiment"] = sentiment_percentages(
+                                    video["comment_sentiment"]
                                 )
-                                if total_comments > 0:
-                                    sentiment["positive_percent"] = round(
-                                        (sentiment.get("positive_count", 0) / total_comments) * 100
-                                    )
-                                    sentiment["neutral_percent"] = round(
-                                        (sentiment.get("neutral_count", 0) / total_comments) * 100
-                                    )
-                                    sentiment["negative_percent"] = round(
-                                        (sentiment.get("negative_count", 0) / total_comments) * 100
-                                    )
-                                video_obj["comment_sentiment"] = sentiment
                             top_videos.append(video_obj)
                     if top_videos:
                         print("  ✓ Loaded YouTube data from JSON file")
@@ -781,17 +988,17 @@ class UnifiedGenerator:
         qa_section = analysis.get("qa_section", data.get("qa_section", []))
 
         # Load recommended_watching (use additional videos from youtube_data.json if available)
-        recommended_watching = analysis.get(
-            "recommended_watching", data.get("recommended_watching", [])
+        # Own copy: youtube_data videos may be appended below
+        recommended_watching = list(
+            analysis.get("recommended_watching", data.get("recommended_watching", [])) or []
         )
 
         # If recommended_watching is empty, use remaining videos from youtube_data.json
         if not recommended_watching and top_videos:
             # Take videos beyond the first set (if we loaded from JSON)
             try:
-                youtube_path = self.project_root / "data" / "youtube_data.json"
-                if youtube_path.exists():
-                    youtube_data = json.loads(youtube_path.read_text())
+                youtube_data = self.read_data_file("youtube_data.json")
+                if youtube_data:
                     # Collect all remaining videos (skip the first 2 from each creator already used in top_videos)
                     for creator in youtube_data.get("top_creators", []):
                         videos_to_recommend = creator.get("videos", [])[
@@ -849,13 +1056,35 @@ class UnifiedGenerator:
                         video["curator"] = commentary_data["curator"]
 
         # Build creator_channels mapping for JavaScript linking
-        creator_channels = {}
-        if youtube_path.exists():
-            youtube_data = json.loads(youtube_path.read_text())
-            for creator in youtube_data.get("top_creators", []):
-                creator_channels[creator["channel_name"]] = creator.get("channel_id", "")
+        creator_channels = self._creator_channels()
+
+        return thaw(
+            {
+                "analysis_date": data.get(
+                    "analysis_date", data.get("timestamp", datetime.now().isoformat())
+                ),
+                "search_query": source_data.get("search_query", "carnivore diet"),
+                "total_creators": source_data.get("total_creators", 10),
+                "total_videos": source_data.get("total_videos", 39),
+                "weekly_summary": weekly_summary,
+                "trending_topics": trending_topics,
+                "top_videos": top_videos,
+                "key_insights": key_insights,
+                "community_sentiment": community_sentiment,
+                "recommended_watching": recommended_watching,
+                "qa_section": qa_section,
+                "layout_metadata": data.get("layout_metadata"),
+                "creator_channels": creator_channels,  # Map of creator names to YouTube channel IDs
+            }
+        )
 
-        # Load blog posts for Featured Insights section (5 from last week + 3 popular)
+    def _blog_post_lists(self):
+        """
+        Blog posts for the Featured Insights section (5 from last week + 3 popular)
+
+        Returns:
+            (newest, popular, more) lists of post dicts
+        """
         newest_blog_posts = []
         popular_blog_posts = []
         more_blog_posts = []  # Additional posts for "More Insights" progressive-disclosure section
@@ -952,11 +1181,11 @@ class UnifiedGenerator:
             try:
                 from datetime import datetime, timedelta
 
-                blog_posts_path = self.project_root / "data" / "blog_posts.json"
-                if blog_posts_path.exists():
-                    blog_data = json.loads(blog_posts_path.read_text())
+                blog_data = self.read_data_file("blog_posts.json")
+                if blog_data:
                     all_posts = blog_data.get("blog_posts", [])
-                    published_posts = [p for p in all_posts if p.get("published", False)
+                    # Copies: author slugs are rewritten to display names below
+                    published_posts = [dict(p) for p in all_posts if p.get("published", False)
                                        and p.get("site", "cw") == self.site]
 
                     # Use scheduled_date (actual publish date) if available, else fall back to date
@@ -1003,56 +1232,32 @@ class UnifiedGenerator:
             except Exception as e:
                 print(f"  Warning: Could not load blog posts: {e}")
 
-        roundup_image = _get_roundup_image()
-        roundup_image_width, roundup_image_height = _get_image_dims(roundup_image)
+        return newest_blog_posts, popular_blog_posts, more_blog_posts
 
-        template_vars = {
-            "analysis_date": data.get(
-                "analysis_date", data.get("timestamp", datetime.now().isoformat())
-            ),
-            "generation_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "search_query": source_data.get("search_query", "carnivore diet"),
-            "total_creators": source_data.get("total_creators", 10),
-            "total_videos": source_data.get("total_videos", 39),
-            "weekly_summary": weekly_summary,
-            "trending_topics": trending_topics,
-            "top_videos": top_videos,
-            "key_insights": key_insights,
-            "community_sentiment": community_sentiment,
-            "recommended_watching": recommended_watching,
-            "qa_section": qa_section,
-            "layout_metadata": data.get("layout_metadata"),
-            "creator_channels": creator_channels,  # Map of creator names to YouTube channel IDs
-            "newest_blog_posts": newest_blog_posts,  # 5 posts from last 7 days
-            "popular_blog_posts": popular_blog_posts,  # 3 most popular blog posts (older/established)
-            "more_blog_posts": more_blog_posts,  # Up to 60 additional posts for Load More section
-            "roundup_image": roundup_image,
-            "roundup_image_width": roundup_image_width,
-            "roundup_image_height": roundup_image_height,
-        }
+    def _creator_channels(self) -> Dict[str, str]:
+        """Creator name -> YouTube channel ID from youtube_data.json, for JavaScript linking"""
+        creator_channels = {}
+        youtube_data = self.read_data_file("youtube_data.json")
+        if youtube_data:
+            for creator in youtube_data.get("top_creators", []):
+                creator_channels[creator["channel_name"]] = creator.get("channel_id", "")
+        return creator_channels
 
-        # Render template
-        try:
-            html_content = template.render(**template_vars)
-        except Exception as e:
-            print(f"Error rendering template: {e}")
-            return False
+    def _archive_manifest(self) -> ArchiveManifest:
+        """Week summaries for the archive, refreshed from data/archive/ (cheap when unchanged)"""
+        if self._archive is None:
+            archive_dir = self.project_root / self.config["paths"]["data_dir"] / "archive"
+            self._archive = ArchiveManifest(archive_dir)
+        self._archive.refresh()
+        return self._archive
 
-        # Write output
-        output_file = self.project_root / mapping["output"]
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
-            print(f"✓ Generated: {output_file}")
-            return True
-        except Exception as e:
-            print(f"Error writing output file {output_file}: {e}")
-            return False
+    def _archive_listing_path(self, page: int) -> Path:
+        """public/archive.html for page 1, public/archive-<n>.html after that"""
+        output = Path(self.config["generation"]["template_mappings"]["archive"]["output"])
+        return output if page == 1 else output.with_name(f"{output.stem}-{page}{output.suffix}")
 
     def _generate_archive(self) -> bool:
-        """Generate archive pages"""
+        """Generate archive listing pages and one page per archived week"""
         mapping = self.config["generation"]["template_mappings"]["archive"]
 
         # Load template
@@ -1062,168 +1267,120 @@ class UnifiedGenerator:
             print(f"Error loading template {mapping['template']}: {e}")
             return False
 
-        # Load all archive files
-        archive_dir = self.project_root / self.config["paths"]["data_dir"] / "archive"
-        weeks = []
-
-        if archive_dir.exists():
-            # Get all JSON files sorted by date (newest first)
-            archive_files = sorted(
-                [f for f in archive_dir.glob("*.json") if f.name[0].isdigit()],
-                key=lambda f: f.name,
-                reverse=True,
-            )
-
-            for archive_file in archive_files[:10]:  # Limit to 10 most recent weeks
-                try:
-                    with open(archive_file) as f:
-                        week_data = json.load(f)
-
-                    # Handle nested structure (analysis key) or flat structure
-                    analysis = week_data.get("analysis", week_data)
-
-                    # Extract week info, use actual data if available
-                    total_creators = analysis.get("top_creators_count", 0)
-                    total_videos = analysis.get("total_videos_found", 0)
-
-                    # If counts are 0, try to extract from creators data or trending topics
-                    if total_creators == 0:
-                        if "creators_data" in analysis:
-                            total_creators = len(analysis.get("creators_data", {}))
-                        elif "trending_topics" in analysis:
-                            total_creators = len(
-                                [t for t in analysis.get("trending_topics", []) if t]
-                            )
+        # The listing comes from the manifest's summary rows alone
+        manifest = self._archive_manifest()
+        for name, error in manifest.errors.items():
+            print(f"Warning: Could not load {name}: {error}")
+        rows = manifest.rows()
+        pages = manifest.pages(ARCHIVE_PAGE_SIZE)
 
-                    if total_videos == 0:
-                        if "trending_topics" in analysis:
-                            total_videos = len(analysis.get("trending_topics", []))
-                        elif "key_insights" in analysis:
-                            total_videos = len(analysis.get("key_insights", []))
+        for number, weeks in enumerate(pages, 1):
+            output_file = self.project_root / self._archive_listing_path(number)
+            if not self._needs_render(output_file):
+                continue
 
-                    # Get summary - first 150 chars of weekly_summary if available
-                    summary_preview = analysis.get("weekly_summary", "")
-                    if isinstance(summary_preview, str):
-                        summary_preview = summary_preview[:150]
-                    else:
-                        summary_preview = str(summary_preview)[:150]
-
-                    week_info = {
-                        "date": archive_file.stem,
-                        "total_creators": max(total_creators, 1),  # At least 1 creator
-                        "total_videos": max(total_videos, 1),  # At least 1 video
-                        "summary_preview": (
-                            summary_preview if summary_preview else f"Week of {archive_file.stem}"
-                        ),
-                    }
-                    weeks.append(week_info)
-                except (json.JSONDecodeError, KeyError, Exception) as e:
-                    print(f"Warning: Could not load {archive_file.name}: {e}")
-                    continue
+            template_vars = {
+                "weeks": weeks,
+                "total_weeks": len(rows),
+                "page": number,
+                "total_pages": len(pages),
+                "prev_url": f"/{self._archive_listing_path(number - 1).name}" if number > 1 else None,
+                "next_url": (
+                    f"/{self._archive_listing_path(number + 1).name}"
+                    if number < len(pages) else None
+                ),
+                "canonical_url": f"https://carnivoreweekly.com/{output_file.name}",
+                "generation_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
 
-        # Prepare template variables
-        template_vars = {
-            "weeks": weeks,
-            "total_weeks": len(weeks),
-            "generation_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        }
+            # Render template
+            try:
+                html_content = template.render(**template_vars)
+            except Exception as e:
+                print(f"Error rendering archive template: {e}")
+                return False
 
-        # Render template
-        try:
-            html_content = template.render(**template_vars)
-        except Exception as e:
-            print(f"Error rendering archive template: {e}")
-            return False
+            # Write output
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                self._write_output(output_file, html_content)
+            except Exception as e:
+                print(f"Error writing archive file {output_file}: {e}")
+                return False
 
-        # Write output
-        output_file = self.project_root / mapping["output"]
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        # Also generate individual week pages from archive data (using index template)
+        archive_week_dir = self.project_root / "public" / "archive"
+        stale_weeks = [
+            row["date"] for row in rows
+            if self._needs_render(archive_week_dir / f"{row['date']}.html")
+        ]
+        if not stale_weeks:
+            return True
+        archive_week_dir.mkdir(parents=True, exist_ok=True)
 
+        # Load the pages template (index_template.html) for individual week pages
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
-            print(f"✓ Generated: {output_file}")
+            pages_mapping = self.config["generation"]["template_mappings"]["pages"]
+            week_template = self.jinja_env.get_template(pages_mapping["template"])
         except Exception as e:
-            print(f"Error writing archive file {output_file}: {e}")
-            return False
-
-        # Also generate individual week pages from archive data (using index template)
-        if archive_dir.exists():
-            archive_files = sorted(
-                [f for f in archive_dir.glob("*.json") if f.name[0].isdigit()],
-                key=lambda f: f.name,
-                reverse=True,
-            )
+            print(f"Warning: Could not load pages template for archive weeks: {e}")
+            return True
 
-            archive_week_dir = self.project_root / "public" / "archive"
-            archive_week_dir.mkdir(parents=True, exist_ok=True)
+        # Extract creator channels mapping
+        creator_channels = self._creator_channels()
 
-            # Load the pages template (index_template.html) for individual week pages
+        def render_week(date):
+            week_output_file = archive_week_dir / f"{date}.html"
             try:
-                pages_mapping = self.config["generation"]["template_mappings"]["pages"]
-                week_template = self.jinja_env.get_template(pages_mapping["template"])
-            except Exception as e:
-                print(f"Warning: Could not load pages template for archive weeks: {e}")
-                week_template = None
-
-            if week_template:
-                for archive_file in archive_files[:10]:
-                    try:
-                        with open(archive_file) as f:
-                            week_data = json.load(f)
-
-                        # Handle nested structure
-                        analysis = week_data.get("analysis", week_data)
-
-                        # Extract creator channels mapping
-                        creator_channels = {}
-                        youtube_path = self.project_root / "data" / "youtube_data.json"
-                        if youtube_path.exists():
-                            youtube_data = json.loads(youtube_path.read_text())
-                            for creator in youtube_data.get("top_creators", []):
-                                creator_channels[creator["channel_name"]] = creator.get(
-                                    "channel_id", ""
-                                )
+                self._render_archive_week(
+                    manifest.archive_dir / f"{date}.json",
+                    week_output_file,
+                    week_template,
+                    creator_channels,
+                )
+                return f"✓ Generated: {week_output_file}"
+            except (json.JSONDecodeError, KeyError, Exception) as e:
+                return f"Warning: Could not generate week page for {date}.json: {e}"
 
-                        # Build template variables (based on _generate_pages but with correct canonical)
-                        archive_canonical = (
-                            f"https://carnivoreweekly.com/archive/{archive_file.stem}.html"
-                        )
-                        week_template_vars = {
-                            "canonical_url": archive_canonical,
-                            "analysis_date": week_data.get("analysis_date", ""),
-                            "generation_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            "search_query": week_data.get("source_data", {}).get(
-                                "search_query", "carnivore diet"
-                            ),
-                            "total_creators": week_data.get("source_data", {}).get(
-                                "total_creators", 0
-                            ),
-                            "total_videos": week_data.get("source_data", {}).get("total_videos", 0),
-                            "weekly_summary": analysis.get("weekly_summary", ""),
-                            "trending_topics": analysis.get("trending_topics", []),
-                            "top_videos": analysis.get("top_videos", []),
-                            "key_insights": analysis.get("key_insights", []),
-                            "community_sentiment": analysis.get("community_sentiment", {}),
-                            "recommended_watching": analysis.get("recommended_watching", []),
-                            "qa_section": analysis.get("qa_section", []),
-                            "layout_metadata": week_data.get("layout_metadata"),
-                            "creator_channels": creator_channels,
-                        }
+        # Printed here, in date order, rather than from the pool's threads
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(stale_weeks)))) as pool:
+            for message in pool.map(render_week, stale_weeks):
+                print(message)
 
-                        # Render week page
-                        week_html = week_template.render(**week_template_vars)
+        return True
 
-                        # Write week page
-                        week_output_file = archive_week_dir / f"{archive_file.stem}.html"
-                        week_output_file.write_text(week_html, encoding="utf-8")
-                        print(f"✓ Generated: {week_output_file}")
+    def _render_archive_week(self, archive_file: Path, output_file: Path, week_template,
+                             creator_channels: Dict):
+        """Render one archived week with the homepage template"""
+        week_data = self.data_layer.read_json(archive_file)
 
-                    except (json.JSONDecodeError, KeyError, Exception) as e:
-                        print(f"Warning: Could not generate week page for {archive_file.name}: {e}")
-                        continue
+        # Handle nested structure
+        analysis = week_data.get("analysis", week_data)
 
-        return True
+        # Build template variables (based on _generate_pages but with correct canonical)
+        archive_canonical = f"https://carnivoreweekly.com/archive/{archive_file.stem}.html"
+        week_template_vars = {
+            "canonical_url": archive_canonical,
+            "analysis_date": week_data.get("analysis_date", ""),
+            "generation_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "search_query": week_data.get("source_data", {}).get(
+                "search_query", "carnivore diet"
+            ),
+            "total_creators": week_data.get("source_data", {}).get("total_creators", 0),
+            "total_videos": week_data.get("source_data", {}).get("total_videos", 0),
+            "weekly_summary": analysis.get("weekly_summary", ""),
+            "trending_topics": analysis.get("trending_topics", []),
+            "top_videos": analysis.get("top_videos", []),
+            "key_insights": analysis.get("key_insights", []),
+            "community_sentiment": analysis.get("community_sentiment", {}),
+            "recommended_watching": analysis.get("recommended_watching", []),
+            "qa_section": analysis.get("qa_section", []),
+            "layout_metadata": week_data.get("layout_metadata"),
+            "creator_channels": creator_channels,
+        }
+
+        # Render and write week page
+        self.writer.write_text(output_file, week_template.render(**week_template_vars))
 
     def _generate_newsletter(self) -> bool:
         """Generate newsletter by delegating to scripts/generate_newsletter.py.
@@ -1255,44 +1412,82 @@ class UnifiedGenerator:
             return False
         return True
 
+    def _youtube_client(self):
+        """YouTube Data API client, or None without the library or an API key"""
+        if self._youtube is None and build:
+            youtube_api_key = os.getenv("YOUTUBE_API_KEY")
+            if not youtube_api_key:
+                print("⚠ Warning: YOUTUBE_API_KEY not set, using cached or placeholder images")
+                return None
+            self._youtube = build("youtube", "v3", developerKey=youtube_api_key)
+        return self._youtube
+
+    def _thumbnail_cache(self) -> ChannelThumbnailCache:
+        """Channel avatar cache, seeded from creator_history.json on first use"""
+        if self._thumbnails is None:
+            data_dir = self.project_root / self.config["paths"]["data_dir"]
+            avatar_dir = None
+            if self.config["generation"].get("mirror_channel_avatars"):
+                avatar_dir = self.project_root / self.config["paths"]["images_dir"] / "channels"
+            self._thumbnails = ChannelThumbnailCache(
+                data_dir / "channel_thumbnails.json", avatar_dir=avatar_dir
+            )
+            try:
+                history = self.read_data_file("creator_history.json", {}).get("creators", {})
+                self._thumbnails.seed(history.values())
+            except (json.JSONDecodeError, IOError):
+                pass
+        return self._thumbnails
+
     def _fetch_channel_profile_images(self, channel_ids: list) -> Dict[str, str]:
-        """Fetch channel profile images from YouTube API"""
-        channel_images = {}
+        """
+        Channel profile images, from the avatar cache where still fresh
 
-        if not build or not channel_ids:
-            return channel_images
+        Only channels missing from data/channel_thumbnails.json or past its
+        TTL are looked up, 50 IDs per channels().list request.
 
-        try:
-            youtube_api_key = os.getenv("YOUTUBE_API_KEY")
-            if not youtube_api_key:
-                print("⚠ Warning: YOUTUBE_API_KEY not set, using placeholder images")
-                return channel_images
+        Args:
+            channel_ids: YouTube channel IDs
 
-            youtube = build("youtube", "v3", developerKey=youtube_api_key)
+        Returns:
+            channel ID -> avatar URL for every channel that has one
+        """
+        cache = self._thumbnail_cache()
+        missing = cache.stale(channel_ids)
+        youtube = self._youtube_client() if missing else None
 
-            # Fetch channel info in batches (API limit is 50 per request)
-            for i in range(0, len(channel_ids), 50):
-                batch = channel_ids[i : i + 50]
-                request = youtube.channels().list(
-                    part="snippet", id=",".join(batch), fields="items(id,snippet(thumbnails))"
-                )
-                response = request.execute()
-
-                for item in response.get("items", []):
-                    channel_id = item.get("id", "")
-                    thumbnails = item.get("snippet", {}).get("thumbnails", {})
-                    # Prefer high quality, fallback to medium/default
-                    image_url = (
-                        thumbnails.get("high", {}).get("url")
-                        or thumbnails.get("medium", {}).get("url")
-                        or thumbnails.get("default", {}).get("url")
+        if youtube:
+            try:
+                quota = YouTubeQuota()
+                # Fetch channel info in batches (API limit is 50 per request)
+                for i in range(0, len(missing), 50):
+                    batch = missing[i : i + 50]
+                    channel_images = {}
+                    request = youtube.channels().list(
+                        part="snippet", id=",".join(batch), fields="items(id,snippet(thumbnails))"
                     )
-                    if image_url:
-                        channel_images[channel_id] = image_url
-        except Exception as e:
-            print(f"⚠ Warning: Failed to fetch channel profile images: {e}")
+                    response = quota.execute(request, "channels.list", script="generate")
+
+                    for item in response.get("items", []):
+                        channel_id = item.get("id", "")
+                        thumbnails = item.get("snippet", {}).get("thumbnails", {})
+                        # Prefer high quality, fallback to medium/default
+                        image_url = (
+                            thumbnails.get("high", {}).get("url")
+                            or thumbnails.get("medium", {}).get("url")
+                            or thumbnails.get("default", {}).get("url")
+                        )
+                        if image_url:
+                            channel_images[channel_id] = image_url
+                    cache.store(batch, channel_images)
+            except Exception as e:
+                print(f"⚠ Warning: Failed to fetch channel profile images: {e}")
 
-        return channel_images
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"⚠ Warning: Could not save channel avatar cache: {e}")
+        return cache.urls(channel_ids)
 
     def _update_creator_history(self, week_channels: list, run_date: str) -> list:
         """Merge this week's creators into the all-time roster and return it.
@@ -1318,9 +1513,8 @@ class UnifiedGenerator:
 
         history = {}
         try:
-            if os.path.exists(history_file):
-                with open(history_file) as f:
-                    history = json.load(f).get("creators", {})
+            # Own copy: the roster is merged into and written back below
+            history = thaw(self.read_data_file("creator_history.json", {}).get("creators", {}))
         except (json.JSONDecodeError, IOError) as e:
             print(f"   ⚠ Could not read creator history ({e}) — starting fresh")
             history = {}
@@ -1369,10 +1563,9 @@ class UnifiedGenerator:
             history[key] = entry
 
         try:
-            with open(history_file, "w") as f:
-                json.dump(
-                    {"last_updated": run_date, "creators": history}, f, indent=2
-                )
+            self.writer.write_json(
+                history_file, {"last_updated": run_date, "creators": history}, indent=2
+            )
         except IOError as e:
             print(f"   ⚠ Could not write creator history: {e}")
 
@@ -1417,17 +1610,17 @@ class UnifiedGenerator:
         if not videos:
             youtube_data = self.load_data("youtube_data")
             if youtube_data and "top_creators" in youtube_data:
+                # Profile images for every creator this week, in one cached lookup
+                channel_images = self._fetch_channel_profile_images(
+                    [c.get("channel_id", "") for c in youtube_data["top_creators"]]
+                )
+
                 # Convert top_creators format to video-like format for channels page
                 channels_list = []
                 for creator in youtube_data["top_creators"]:
                     channel_id = creator.get("channel_id", "")
                     videos_list = creator.get("videos", [])
 
-                    # Fetch profile image if we have it
-                    channel_images = (
-                        self._fetch_channel_profile_images([channel_id]) if channel_id else {}
-                    )
-
                     # Extract top 3 videos with proper structure
                     top_videos = []
                     for video in videos_list[:3]:
@@ -1511,12 +1704,10 @@ class UnifiedGenerator:
                 leaderboard_file = os.path.join(data_dir, "channel_rankings.json")
                 previous_rankings = {}
                 try:
-                    if os.path.exists(leaderboard_file):
-                        with open(leaderboard_file, "r") as f:
-                            previous_data = json.load(f)
-                            previous_rankings = {
-                                ch["name"]: ch["rank"] for ch in previous_data.get("leaderboard", [])
-                            }
+                    previous_data = self.read_data_file("channel_rankings.json", {})
+                    previous_rankings = {
+                        ch["name"]: ch["rank"] for ch in previous_data.get("leaderboard", [])
+                    }
                 except (json.JSONDecodeError, IOError):
                     pass
 
@@ -1538,11 +1729,8 @@ class UnifiedGenerator:
 
                 # Load creator bios
                 creator_bios = {}
-                bios_file = os.path.join(data_dir, "creator_bios.json")
                 try:
-                    if os.path.exists(bios_file):
-                        with open(bios_file) as f:
-                            creator_bios = json.load(f).get("bios", {})
+                    creator_bios = self.read_data_file("creator_bios.json", {}).get("bios", {})
                 except (json.JSONDecodeError, IOError):
                     pass
 
@@ -1570,20 +1758,34 @@ class UnifiedGenerator:
                     ch["appearances"] = roster_appearances.get(key, 1)
 
                 try:
-                    with open(leaderboard_file, "w") as f:
-                        json.dump({
-                            "last_updated": run_date,
-                            "leaderboard": [{
-                                "name": ch["name"],
-                                "rank": ch["rank"],
-                                "appearances": ch["appearances"],
-                                "channel_id": ch.get("channel_id", ""),
-                            } for ch in leaderboard],
-                        }, f, indent=2)
+                    self.writer.write_json(leaderboard_file, {
+                        "last_updated": run_date,
+                        "leaderboard": [{
+                            "name": ch["name"],
+                            "rank": ch["rank"],
+                            "appearances": ch["appearances"],
+                            "channel_id": ch.get("channel_id", ""),
+                        } for ch in leaderboard],
+                    }, indent=2)
                 except IOError:
                     pass
 
                 rendered = roster[:MAX_CHANNEL_CARDS]
+
+                # Link each card to its cached avatar (a local copy when
+                # generation.mirror_channel_avatars is on)
+                thumbnails = self._thumbnail_cache()
+                thumbnails.mirror(ch.get("channel_id") for ch in rendered if ch.get("channel_id"))
+                for ch in rendered:
+                    ch["thumbnail_url"] = thumbnails.src(
+                        ch.get("channel_id", ""), ch.get("thumbnail_url") or PLACEHOLDER_THUMBNAIL
+                    )
+                try:
+                    thumbnails.save()
+                except OSError as e:
+                    print(f"   ⚠ Could not save channel avatar cache: {e}")
+                print(f"   {thumbnails.report()}")
+
                 print(
                     f"   Roster: {len(roster)} creators all-time, "
                     f"{sum(1 for c in roster if c['active_this_week'])} active this week, "
@@ -1604,10 +1806,7 @@ class UnifiedGenerator:
                 try:
                     html_content = template.render(**template_vars)
                     output_file = self.project_root / mapping["output"]
-                    output_file.parent.mkdir(parents=True, exist_ok=True)
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(html_content)
-                    print(f"✓ Generated: {output_file} (using youtube_data.json)")
+                    self._write_output(output_file, html_content, " (using youtube_data.json)")
                     return True
                 except Exception as e:
                     print(f"Error rendering channels template: {e}")
@@ -1625,10 +1824,7 @@ class UnifiedGenerator:
                 try:
                     html_content = template.render(**template_vars)
                     output_file = self.project_root / mapping["output"]
-                    output_file.parent.mkdir(parents=True, exist_ok=True)
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(html_content)
-                    print(f"✓ Generated: {output_file} (empty channels)")
+                    self._write_output(output_file, html_content, " (empty channels)")
                     return True
                 except Exception as e:
                     print(f"Error rendering channels template: {e}")
@@ -1759,12 +1955,10 @@ class UnifiedGenerator:
         leaderboard_file = os.path.join(data_dir, "channel_rankings.json")
         previous_rankings = {}
         try:
-            if os.path.exists(leaderboard_file):
-                with open(leaderboard_file, "r") as f:
-                    previous_data = json.load(f)
-                    previous_rankings = {
-                        ch["name"]: ch["rank"] for ch in previous_data.get("leaderboard", [])
-                    }
+            previous_data = self.read_data_file("channel_rankings.json", {})
+            previous_rankings = {
+                ch["name"]: ch["rank"] for ch in previous_data.get("leaderboard", [])
+            }
         except (json.JSONDecodeError, IOError):
             pass
 
@@ -1789,15 +1983,10 @@ class UnifiedGenerator:
 
         # Save current rankings for next week's comparison
         try:
-            with open(leaderboard_file, "w") as f:
-                json.dump(
-                    {
-                        "leaderboard": [
-                            {"name": ch["name"], "rank": ch["rank"]} for ch in leaderboard
-                        ]
-                    },
-                    f,
-                )
+            self.writer.write_json(
+                leaderboard_file,
+                {"leaderboard": [{"name": ch["name"], "rank": ch["rank"]} for ch in leaderboard]},
+            )
         except IOError:
             pass
 
@@ -1845,9 +2034,7 @@ class UnifiedGenerator:
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
-            print(f"✓ Generated: {output_file}")
+            self._write_output(output_file, html_content)
             return True
         except Exception as e:
             print(f"Error writing channels file {output_file}: {e}")
@@ -1875,9 +2062,7 @@ class UnifiedGenerator:
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(wiki_updates, f, indent=2)
-            print(f"✓ Generated: {output_file}")
+            self._write_output(output_file, json.dumps(wiki_updates, indent=2))
             return True
         except Exception as e:
             print(f"Error writing wiki file {output_file}: {e}")
@@ -1942,6 +2127,24 @@ def main():
         "--site", choices=["cw", "kd"], default="cw",
         help="Which site to generate for (default: cw)"
     )
+    parser.add_argument(
+        "--workers", type=int, default=GENERATION_WORKERS,
+        help=f"Generation types run at once with --type all "
+        f"(default: {GENERATION_WORKERS}, 1 = serial)"
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Stay running and rebuild affected outputs when templates/, data/ or config/ change"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Render every output even if the build manifest says it is up to date"
+    )
+    parser.add_argument(
+        "--refresh-view-model", action="store_true",
+        help="Re-assemble data/homepage_view_model.json from this week's analysis "
+        "even if it looks current (run by the weekly pipeline)"
+    )
 
     args = parser.parse_args()
 
@@ -1959,7 +2162,16 @@ def main():
     print("=" * 70)
 
     # Run generator
-    generator = UnifiedGenerator(args.config, site=args.site)
+    generator = UnifiedGenerator(
+        args.config,
+        site=args.site,
+        force=args.force,
+        workers=args.workers,
+        refresh_view_model=args.refresh_view_model,
+    )
+    if args.watch:
+        generator.watch(args.type)
+        sys.exit(0)
     success = generator.generate(args.type)
 
     print("\n" + "=" * 70)
@@ -2,12 +2,26 @@
 """
 Generate blog HTML pages from templates and metadata.
 Creates individual post pages and blog index.
+
+Post pages are incremental: each one's render fingerprint (post fields,
+template chain, wiki keywords, related posts, generator code) is kept in
+data/blog_build_manifest.json, and only posts whose fingerprint changed
+are re-rendered and re-validated. --force renders every post.
+
+Rendering and validating a post is CPU-bound and independent of every other
+post. With --jobs N it runs in N worker processes, each with its own Jinja
+environment, wiki linker and validator. Results are merged back in post
+order, so console output, blocked/fixed counts and the pages written are
+the same as a serial run.
 """
 
 import argparse
+import io
 import json
 import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from jinja2 import Environment, FileSystemLoader, select_autoescape
@@ -19,16 +33,30 @@ except ImportError:
     HAS_PILLOW = False
 
 # Auto-linking for wiki keywords
-from auto_link_wiki_keywords import insert_wiki_links
+from auto_link_wiki_keywords import WikiKeywordLinker
 
 # Content validator with auto-fix
 from content_validator import ContentValidator
 
+# Compiled templates persist in .cache/jinja between runs
+from jinja_cache import bytecode_cache
+
+# Per-post render fingerprints: only posts whose inputs changed are re-rendered
+from build_manifest import BuildManifest, template_chain
+
+# Unchanged pages are not rewritten; the rest are written atomically
+from output_writer import OutputWriter
+
+# TF-IDF related posts, computed once per build and cached in data/
+from related_posts import RelatedPostsIndex
+
 PROJECT_ROOT = Path(__file__).parent.parent
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
 DATA_DIR = PROJECT_ROOT / "data"
 PUBLIC_DIR = PROJECT_ROOT / "public"
 BLOG_DIR = PUBLIC_DIR / "blog"
+BUILD_MANIFEST_FILE = DATA_DIR / "blog_build_manifest.json"
+POST_TEMPLATE = "blog_post_template_2026.html"
 
 # Ensure blog directory exists
 BLOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -36,6 +64,16 @@ BLOG_DIR.mkdir(parents=True, exist_ok=True)
 # Default OG-style ratio, used only when the real file can't be read
 DEFAULT_POST_IMAGE_DIMS = (1200, 630)
 
+# Full names from personas
+AUTHOR_FULL_NAMES = {
+    "sarah": "Sarah Whitfield",
+    "chloe": "Chloe Navarro",
+    "marcus": "Marcus Cole",
+}
+
+# Fields of a related post the Related Articles cards use (and that --jobs ships to workers)
+RELATED_CARD_FIELDS = ("slug", "title", "excerpt")
+
 
 def get_post_image_dims(image_url):
     """Read the actual pixel dimensions of a post's hero image so the
@@ -58,6 +96,8 @@ def get_post_image_dims(image_url):
 
 SITE_FILTER = None  # Set by --site flag; None means all posts (backwards compat)
 
+WRITER = OutputWriter()  # Every page, the RSS feed and the sitemap go through this
+
 
 def load_blog_posts():
     """Load blog posts from JSON, filtered by site if set."""
@@ -156,7 +196,9 @@ def markdown_to_html(markdown_text):
 def setup_jinja():
     """Set up Jinja2 environment."""
     env = Environment(
-        loader=FileSystemLoader(TEMPLATES_DIR), autoescape=select_autoescape(["html", "xml"])
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=bytecode_cache("blog"),
     )
 
     # Add custom filters
@@ -171,36 +213,168 @@ def setup_jinja():
     return env
 
 
-def find_related_posts(current_post, all_posts, n=3):
-    """Find n related posts by shared tags and category, excluding self."""
-    slug = current_post.get("slug", "")
-    tags = set(current_post.get("tags", []))
-    category = current_post.get("category", "")
+def post_fingerprint(build, shared_inputs, post, related_posts, image_dims):
+    """
+    Digest of everything one post page is rendered from
+
+    Args:
+        build: BuildManifest that hashes the files
+        shared_inputs: Files every post depends on (template chain, wiki
+            keywords, generator code)
+        post: The post's own fields
+        related_posts: Posts linked from its Related Articles block
+        image_dims: Hero image (width, height) baked into the page
+
+    Returns:
+        Hex digest; a post whose digest is unchanged renders identically
+    """
+    return build.digest(
+        shared_inputs,
+        {
+            "post": post,
+            # Only what the Related Articles cards show
+            "related": [
+                {k: rp.get(k) for k in RELATED_CARD_FIELDS} for rp in related_posts
+            ],
+            "image_dims": list(image_dims),
+        },
+    )
 
-    scored = []
-    for post in all_posts:
-        if not post.get("published", False):
-            continue
-        if post.get("slug", "") == slug:
-            continue
-        shared_tags = tags & set(post.get("tags", []))
-        score = len(shared_tags) * 2 + (1 if post.get("category") == category else 0)
-        if score > 0:
-            scored.append((score, post))
-
-    scored.sort(key=lambda x: x[0], reverse=True)
-    # Fill up to n with recent posts if not enough tag matches
-    result = [p for _, p in scored[:n]]
-    if len(result) < n:
-        recent = [p for p in sorted(all_posts, key=lambda x: x.get("date", ""), reverse=True)
-                  if p.get("published") and p.get("slug") != slug and p not in result]
-        result += recent[:n - len(result)]
-    return result[:n]
-
-
-def generate_blog_posts(env, posts, validator=None):
-    """Generate individual blog post HTML files."""
-    template = env.get_template("blog_post_template_2026.html")
+
+def wiki_linker():
+    """WikiKeywordLinker over data/wiki-keywords.json, loaded once per process."""
+    return WikiKeywordLinker(str(DATA_DIR / "wiki-keywords.json"))
+
+
+def render_post(template, validator, linker, post, related_posts, image_dims):
+    """
+    Render and validate one post page
+
+    Touches nothing outside its arguments, so it runs the same in-process or
+    in a --jobs worker.
+
+    Args:
+        template: Compiled post template
+        validator: ContentValidator (validate_only is used)
+        linker: WikiKeywordLinker from wiki_linker()
+        post: The post's fields
+        related_posts: Posts for the Related Articles cards
+        image_dims: Hero image (width, height)
+
+    Returns:
+        (notes, rendered, is_valid, log_messages, corrected_filename, seconds);
+        notes are console lines to print before the post's result
+    """
+    start = time.perf_counter()
+    notes = []
+    content = post.get("content", "")
+
+    # Convert markdown to HTML if content contains markdown syntax
+    # Check for common markdown patterns: ##, **, -
+    if "##" in content or "**" in content or re.search(r"^\s*-\s", content, re.MULTILINE):
+        notes.append(f"   🔄 Converting markdown to HTML: {post['title'][:50]}...")
+        content = markdown_to_html(content)
+
+    # Convert H1 tags to H2 in content (prevent multiple H1s per page)
+    content = re.sub(r"<h1([^>]*)>", r"<h2\1>", content)
+    content = re.sub(r"</h1>", r"</h2>", content)
+
+    # Apply auto-linking to blog content (max 5 links per post)
+    content = linker.sanitize_links(linker.insert_wiki_links(content, 5))
+
+    # Prepare SEO data
+    seo = post.get("seo", {})
+    meta_description = seo.get("meta_description", "")
+    keywords = ", ".join(post.get("tags", []))
+
+    author_slug = post.get("author", "marcus")
+    author_name = AUTHOR_FULL_NAMES.get(author_slug, author_slug.title())
+
+    # Render the template with post data
+    post_image_width, post_image_height = image_dims
+    rendered = template.render(
+        title=post.get("title"),
+        author=post.get("author"),
+        author_name=author_name,
+        author_title=post.get("author_title"),
+        date=post.get("date"),
+        publish_date=post.get("date"),
+        slug=post.get("slug"),
+        content=content,
+        post_image=post.get("image"),
+        post_image_width=post_image_width,
+        post_image_height=post_image_height,
+        tags=post.get("tags", []),
+        keywords=keywords,
+        meta_description=meta_description,
+        related_posts=related_posts,
+        sponsor_callout=post.get("sponsor_callout"),
+        comments_enabled=post.get("comments_enabled", True),
+        seo=seo,
+        # Optional per-post SEO extras: date_modified bumps the Article
+        # schema on content updates; faq ([{q, a}, ...]) must mirror a
+        # visible FAQ section in the post body (Google requirement)
+        date_modified=post.get("date_modified"),
+        faq=post.get("faq"),
+    )
+
+    # Validate content (warn-only — template output is source of truth)
+    filename = f"{post['slug']}.html"
+    is_valid, log_messages, corrected_filename = validator.validate_only(rendered, filename)
+    return (
+        notes, rendered, is_valid, list(log_messages), corrected_filename,
+        time.perf_counter() - start,
+    )
+
+
+# Per-process state of a --jobs worker, set up once by _init_render_worker
+_WORKER = {}
+
+
+def _init_render_worker():
+    env = setup_jinja()
+    _WORKER["template"] = env.get_template(POST_TEMPLATE)
+    _WORKER["validator"] = ContentValidator()
+    _WORKER["linker"] = wiki_linker()
+
+
+def _render_in_worker(job):
+    return render_post(_WORKER["template"], _WORKER["validator"], _WORKER["linker"], *job)
+
+
+def _render_all(template, validator, jobs, workers):
+    """Yield render_post() results for jobs, in order, on up to `workers` processes."""
+    if workers <= 1 or len(jobs) < 2:
+        linker = wiki_linker()
+        for job in jobs:
+            yield render_post(template, validator, linker, *job)
+        return
+    workers = min(workers, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as pool:
+        # A few chunks per worker: cheap to ship, still balanced across uneven posts
+        chunksize = max(1, len(jobs) // (workers * 4))
+        yield from pool.map(_render_in_worker, jobs, chunksize=chunksize)
+
+
+def generate_blog_posts(env, posts, validator=None, build=None, jobs=1, related_index=None):
+    """
+    Generate individual blog post HTML files
+
+    Args:
+        env: Jinja environment from setup_jinja()
+        posts: All posts
+        validator: ContentValidator to reuse (a new one if None)
+        build: BuildManifest of per-post fingerprints; posts whose
+            fingerprint and output are unchanged are skipped. None renders
+            every post.
+        jobs: Worker processes to render and validate posts on (1 = in-process)
+        related_index: RelatedPostsIndex over the published posts (built,
+            not saved, if None)
+
+    Returns:
+        (blocked_count, fixed_count)
+    """
+    template = env.get_template(POST_TEMPLATE)
     published_posts = [p for p in posts if p.get("published", False)]
 
     print(f"\n📄 Generating {len(published_posts)} blog post pages...")
@@ -209,80 +383,62 @@ def generate_blog_posts(env, posts, validator=None):
     if validator is None:
         validator = ContentValidator()
 
-    blocked_count = 0
-    fixed_count = 0
+    if build is None:
+        build = BuildManifest(BUILD_MANIFEST_FILE, root=PROJECT_ROOT, force=True)
+    if related_index is None:
+        related_index = RelatedPostsIndex(published_posts)
+    scripts_dir = Path(__file__).resolve().parent
+    shared_inputs = template_chain(env, POST_TEMPLATE) + [
+        DATA_DIR / "wiki-keywords.json",
+        scripts_dir / "generate_blog_pages.py",
+        scripts_dir / "auto_link_wiki_keywords.py",
+    ]
 
+    # Plan every post first (cheap), then render the stale ones, then walk the
+    # plan again in order so output matches a serial run whatever --jobs is
+    plan = []
+    render_jobs = []
     for post in published_posts:
-        # Get content directly from post data
-        content = post.get("content", "")
-
         # GUARD: Skip posts with empty or whitespace-only content
+        content = post.get("content", "")
         if not content or content.strip() == "":
+            plan.append(("empty", post, None, None))
+            continue
+
+        related_posts = [
+            {k: rp.get(k) for k in RELATED_CARD_FIELDS} for rp in related_index.related(post)
+        ]
+        image_dims = tuple(get_post_image_dims(post.get("image")))
+        post_file = BLOG_DIR / Path(f"{post['slug']}.html").name
+        digest = post_fingerprint(build, shared_inputs, post, related_posts, image_dims)
+        if build.is_current([post_file], digest):
+            plan.append(("current", post, post_file, None))
+            continue
+        plan.append(("render", post, post_file, digest))
+        render_jobs.append((post, related_posts, image_dims))
+
+    results = _render_all(template, validator, render_jobs, jobs)
+
+    blocked_count = 0
+    fixed_count = 0
+
+    for action, post, post_file, digest in plan:
+        if action == "empty":
             slug = post.get("slug", "UNKNOWN")
             print(f"⚠️  SKIPPED: {post['title'][:60]} - empty content (slug: {slug})")
             print(
                 f"   This post is marked published but has no content. Set published: false in blog_posts.json"
             )
             continue
+        if action == "current":
+            build.skip([post_file])
+            continue
 
-        # Convert markdown to HTML if content contains markdown syntax
-        # Check for common markdown patterns: ##, **, -
-        if "##" in content or "**" in content or re.search(r"^\s*-\s", content, re.MULTILINE):
-            print(f"   🔄 Converting markdown to HTML: {post['title'][:50]}...")
-            content = markdown_to_html(content)
-
-        # Convert H1 tags to H2 in content (prevent multiple H1s per page)
-        content = re.sub(r"<h1([^>]*)>", r"<h2\1>", content)
-        content = re.sub(r"</h1>", r"</h2>", content)
-
-        # Apply auto-linking to blog content (max 5 links per post)
-        content = insert_wiki_links(content, max_links=5)
-
-        # Prepare SEO data
-        seo = post.get("seo", {})
-        meta_description = seo.get("meta_description", "")
-        keywords = ", ".join(post.get("tags", []))
-
-        # Prepare author name (full names from personas)
-        author_slug = post.get("author", "marcus")
-        author_full_names = {
-            "sarah": "Sarah Whitfield",
-            "chloe": "Chloe Navarro",
-            "marcus": "Marcus Cole"
-        }
-        author_name = author_full_names.get(author_slug, author_slug.title())
-
-        # Render the template with post data
-        post_image_width, post_image_height = get_post_image_dims(post.get("image"))
-        rendered = template.render(
-            title=post.get("title"),
-            author=post.get("author"),
-            author_name=author_name,
-            author_title=post.get("author_title"),
-            date=post.get("date"),
-            publish_date=post.get("date"),
-            slug=post.get("slug"),
-            content=content,
-            post_image=post.get("image"),
-            post_image_width=post_image_width,
-            post_image_height=post_image_height,
-            tags=post.get("tags", []),
-            keywords=keywords,
-            meta_description=meta_description,
-            related_posts=find_related_posts(post, posts),
-            sponsor_callout=post.get("sponsor_callout"),
-            comments_enabled=post.get("comments_enabled", True),
-            seo=seo,
-            # Optional per-post SEO extras: date_modified bumps the Article
-            # schema on content updates; faq ([{q, a}, ...]) must mirror a
-            # visible FAQ section in the post body (Google requirement)
-            date_modified=post.get("date_modified"),
-            faq=post.get("faq"),
-        )
-
-        # Validate content (warn-only — template output is source of truth)
-        filename = f"{post['slug']}.html"
-        is_valid, log_messages, corrected_filename = validator.validate_only(rendered, filename)
+        notes, rendered, is_valid, log_messages, corrected_filename, seconds = next(results)
+        for note in notes:
+            print(note)
+        # The run's validation report covers the last post validated, as it always has
+        validator.log_messages = log_messages
 
         if not is_valid:
             # Content blocked — template vars, bad JSON-LD, or insufficient content
@@ -299,11 +455,14 @@ def generate_blog_posts(env, posts, validator=None):
         # Pipeline Lockdown: one-way flow — template → disk, validator only warns
         final_filename = Path(corrected_filename).name
         post_file = BLOG_DIR / final_filename
-        with open(post_file, "w") as f:
-            f.write(rendered)
+        WRITER.write_text(post_file, rendered)
+        build.record([post_file], digest, seconds)
 
         print(f"✅ {post['title']}")
 
+    results.close()  # shuts the worker pool down
+    return blocked_count, fixed_count
+
 
 def generate_blog_index(env, posts):
     """Generate blog index/listing page."""
@@ -319,8 +478,7 @@ def generate_blog_index(env, posts):
     blog_dir = PUBLIC_DIR / "blog"
     blog_dir.mkdir(exist_ok=True)
     blog_index = blog_dir / "index.html"
-    with open(blog_index, "w") as f:
-        f.write(rendered)
+    WRITER.write_text(blog_index, rendered)
 
     print(f"✅ Blog index page generated ({len(published_posts)} posts)")
 
@@ -509,9 +667,10 @@ def update_sitemap(posts):
     new_tree = ET.ElementTree(new_root)
 
     # Write to file
-    with open(sitemap_file, "wb") as f:
-        f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
-        new_tree.write(f, encoding="utf-8", xml_declaration=False)
+    buf = io.BytesIO()
+    buf.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
+    new_tree.write(buf, encoding="utf-8", xml_declaration=False)
+    WRITER.write_bytes(sitemap_file, buf.getvalue())
 
     # Count blog posts
     blog_count = len([url for url in url_data.keys() if "/blog/" in url])
@@ -539,8 +698,7 @@ def generate_rss_feed(env, posts):
 
     # Write RSS feed
     feed_file = PUBLIC_DIR / "feed.xml"
-    with open(feed_file, "w") as f:
-        f.write(rendered)
+    WRITER.write_text(feed_file, rendered)
 
     print(f"✅ RSS feed generated ({len(published_posts)} posts)")
 
@@ -551,6 +709,10 @@ def main():
     parser = argparse.ArgumentParser(description="Generate blog HTML pages")
     parser.add_argument("--site", choices=["cw", "kd"], default=None,
                         help="Filter to a specific site (default: all)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-render every post, even those whose fingerprint is unchanged")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for rendering and validating posts (default: 1)")
     args = parser.parse_args()
     SITE_FILTER = args.site
 
@@ -571,8 +733,14 @@ def main():
     # Initialize validator once for all operations
     validator = ContentValidator()
 
-    # Generate individual post pages (with validation)
-    generate_blog_posts(env, posts, validator)
+    # Generate individual post pages (with validation); unchanged posts are skipped
+    build = BuildManifest(BUILD_MANIFEST_FILE, root=PROJECT_ROOT, force=args.force)
+    related_index = RelatedPostsIndex([p for p in posts if p.get("published", False)])
+    generate_blog_posts(
+        env, posts, validator, build=build, jobs=args.jobs, related_index=related_index
+    )
+    build.save()
+    related_index.save()
 
     # Blog index, RSS, and sitemap are CW-specific (hardcoded carnivoreweekly.com paths).
     # Skip them for non-CW sites to prevent overwriting CW's live files.
@@ -584,6 +752,12 @@ def main():
         generate_rss_feed(env, posts)
         update_sitemap(posts)
 
+    print(f"\n📦 {build.summary()}")
+    print(f"📦 {related_index.report()}")
+    if env.bytecode_cache is not None:
+        print(f"📦 {env.bytecode_cache.report()}")
+    print(f"📦 {WRITER.report()}")
+
     print("\n" + "=" * 50)
     print("✅ Blog generation complete!")
     print("=" * 50)
@@ -21,6 +21,7 @@ load_dotenv(PROJECT_ROOT / ".env", override=True)
 
 # Add scripts/ to path for fetch_writer_context import
 sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+import youtube_data_io  # noqa: E402
 
 # Initialize Claude
 client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
@@ -220,9 +221,8 @@ def save_seen_video_ids(newly_featured):
 
 
 def load_youtube_data():
-    """Load current YouTube data"""
-    with open(YOUTUBE_DATA_PATH, "r") as f:
-        return json.load(f)
+    """Load current YouTube data (from its NDJSON copy if that still matches)"""
+    return youtube_data_io.load_youtube_data(YOUTUBE_DATA_PATH)
 
 
 # Function words that are strong signals of a non-English (but Latin-script)
@@ -46,6 +46,11 @@ except ImportError:
     print("Error: pip3 install jinja2")
     sys.exit(1)
 
+from output_writer import OutputWriter  # noqa: E402
+from youtube_data_io import load_youtube_data  # noqa: E402
+
+WRITER = OutputWriter()  # Identical re-renders leave both files untouched
+
 
 # ---------------------------------------------------------------------------
 # Data loaders
@@ -74,7 +79,8 @@ def load_featured_videos(limit=2):
     if not yt_path.exists():
         return {}
 
-    data = json.loads(yt_path.read_text())
+    # Comments and descriptions aren't shown, so don't parse them
+    data = load_youtube_data(yt_path, skip_heavy=True)
 
     # Collect all videos across creators, sort by views
     all_videos = []
@@ -235,11 +241,9 @@ def generate_newsletter(date_str=None):
     print("\n\U0001f4be Writing output files...")
 
     # newsletters/{date}.html
-    newsletters_dir = PROJECT_ROOT / "newsletters"
-    newsletters_dir.mkdir(parents=True, exist_ok=True)
-    newsletter_path = newsletters_dir / f"{date_str}.html"
-    newsletter_path.write_text(html_output, encoding="utf-8")
-    print(f"  \u2713 {newsletter_path}")
+    newsletter_path = PROJECT_ROOT / "newsletters" / f"{date_str}.html"
+    written = WRITER.write_text(newsletter_path, html_output)
+    print(f"  \u2713 {newsletter_path}" + ("" if written else " (unchanged)"))
 
     # public/newsletter-preview.html (sanitized for public web)
     preview_path = PROJECT_ROOT / "public" / "newsletter-preview.html"
@@ -248,8 +252,9 @@ def generate_newsletter(date_str=None):
         '<meta http-equiv="X-UA-Compatible" content="IE=edge">',
         '<meta http-equiv="X-UA-Compatible" content="IE=edge">\n    <meta name="robots" content="noindex, nofollow">',
     )
-    preview_path.write_text(preview_html, encoding="utf-8")
-    print(f"  \u2713 {preview_path} (sanitized)")
+    written = WRITER.write_text(preview_path, preview_html)
+    print(f"  \u2713 {preview_path} (sanitized" + (")" if written else ", unchanged)"))
+    print(f"  \U0001f4e6 {WRITER.report()}")
 
     # Summary
     print(f"\n{'='*60}")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Shared, memoized JSON data layer for UnifiedGenerator (generate.py).
+
+A --type all build reads the same handful of data files over and over:
+youtube_data.json is parsed in several places while rendering the homepage
+and again for every archive week, and wiki-keywords.json twice in one
+method. DataLayer parses each file once per process and hands back the same
+object on every later read, until the file changes on disk (the cache key is
+path + mtime + size, so a file the generator rewrites itself, such as
+creator_history.json, is re-read on the next access).
+
+Because one parsed object is shared by every generation type, it is handed
+out as a read-only view: dicts and lists that raise TypeError on mutation
+but are otherwise ordinary dicts and lists (json.dumps, Jinja, slicing and
+.copy() all work). Callers that need to edit data take a copy with thaw().
+
+Typical use:
+
+    layer = DataLayer()
+    youtube = layer.read_json(data_dir / "youtube_data.json", default={})
+    history = thaw(layer.read_json(data_dir / "creator_history.json", default={}))
+    print(layer.report())
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+_MISSING = object()
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        f"{type(self).__name__} is a shared read-only view; copy it with thaw() to edit"
+    )
+
+
+class FrozenDict(dict):
+    """dict that refuses in-place changes. .copy() returns a plain dict."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Rebuild through dict.__init__, which never calls __setitem__
+        return (FrozenDict, (dict(self),))
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+class FrozenList(list):
+    """list that refuses in-place changes. Slices and + return plain lists."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON into read-only views."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively copy a (possibly frozen) JSON value into plain dicts and lists."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
+class DataLayer:
+    """Per-process cache of parsed JSON files keyed by (path, mtime, size)."""
+
+    def __init__(self):
+        self._entries: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "parses": 0, "reparses": 0, "parse_seconds": 0.0}
+        self.parsed_files: Dict[str, int] = {}
+
+    def read_json(self, path, default: Any = _MISSING) -> Any:
+        """
+        Parsed contents of a JSON file, shared and read-only
+
+        Args:
+            path: File to read
+            default: Returned (as given, not frozen) when the file does not
+                exist. Without it a missing file raises FileNotFoundError.
+
+        Returns:
+            FrozenDict / FrozenList view of the file
+
+        Raises:
+            FileNotFoundError: File missing and no default
+            json.JSONDecodeError: File is not valid JSON (not cached)
+        """
+        path = Path(path).resolve()
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            if default is _MISSING:
+                raise
+            return default
+        key = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == key:
+                self.stats["hits"] += 1
+                return entry[1]
+
+            start = time.perf_counter()
+            with open(path, "r", encoding="utf-8") as f:
+                value = freeze(json.load(f))
+            self.stats["parse_seconds"] += time.perf_counter() - start
+            self.stats["reparses" if entry is not None else "parses"] += 1
+            self.parsed_files[path.name] = self.parsed_files.get(path.name, 0) + 1
+            self._entries[path] = (key, value)
+            return value
+
+    def invalidate(self, path=None):
+        """Forget one file (or everything) so the next read re-parses it."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(path).resolve(), None)
+
+    def report(self) -> str:
+        s = self.stats
+        reads = s["hits"] + s["parses"] + s["reparses"]
+        line = (
+            f"Data layer: {reads} reads, {s['parses']} files parsed"
+            f" ({s['parse_seconds'] * 1000:.1f} ms), {s['hits']} cache hits"
+        )
+        if s["reparses"]:
+            line += f", {s['reparses']} re-parsed after changing on disk"
+        return line
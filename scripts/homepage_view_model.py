@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Versioned homepage view model: the weekly half of `generate.py --type pages`.
+
+Everything the homepage shows from the weekly analysis (trending topics and
+key insights parsed out of the analyzer's markdown/JSON, wiki links fuzzily
+matched to topics, editorial commentary merged into the top videos,
+sentiment percentages, the Supabase / YouTube video lists) only changes
+when the weekly pipeline runs. It used to be re-assembled on every daily
+publish anyway. It is now assembled once into data/homepage_view_model.json,
+and the daily render just loads that file.
+
+The artifact records VIEW_MODEL_VERSION and a fingerprint of the inputs it
+was built from (data files, generator code, site). A different version or
+fingerprint means it is rebuilt on the next render; the weekly pipeline
+rebuilds it unconditionally with `generate.py --refresh-view-model` so
+fresh Supabase rows are picked up even when no file changed.
+
+Things that change between weekly runs stay at render time: the blog post
+lists, the guards that drop links to blog posts not on disk, the roundup
+image and the generation timestamp.
+
+Typical use:
+
+    view = load_view_model(path, fingerprint)
+    if view is None:
+        view = assemble()  # UnifiedGenerator._assemble_homepage_view_model
+        save_view_model(path, view, fingerprint)
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from generator_data import thaw
+from output_writer import OutputWriter
+
+VIEW_MODEL_FILE = "homepage_view_model.json"
+
+# Bump when the shape of "view" changes so older artifacts are rebuilt
+VIEW_MODEL_VERSION = 1
+
+# Data files the view model is assembled from (relative to data/)
+VIEW_MODEL_INPUTS = (
+    "analyzed_content.json",
+    "wiki-keywords.json",
+    "content-of-the-week.json",
+    "youtube_data.json",
+)
+
+
+def _wiki_anchor(wiki_url: str) -> str:
+    """Strip both /wiki/# and wiki.html# prefixes to get a clean anchor"""
+    return wiki_url.replace("/wiki/#", "").replace("wiki.html#", "")
+
+
+def _parse_markdown_sections(raw: str, title_key: str, extra: Dict) -> List[Dict]:
+    """
+    Split analyzer markdown into one entry per ### heading
+
+    Bullets and plain lines under a heading are joined into its description;
+    rules, bare markdown and **bold-only** lines are skipped. Headings with
+    no description are dropped.
+    """
+    sections = []
+    current = None
+
+    for line in raw.split("\n"):
+        line_stripped = line.strip()
+
+        # Look for h3 headers (### Topic Name)
+        if line_stripped.startswith("### "):
+            if current and current["description"]:
+                sections.append(current)
+            current = {
+                title_key: line_stripped.replace("### ", "").replace("**", "").replace("#", ""),
+                "description": "",
+                **extra,
+            }
+        # Look for description content
+        elif current and line_stripped:
+            # Skip empty lines and markdown-only lines
+            if line_stripped in ["---", "**", "##", "-", "*"]:
+                continue
+            # Skip header lines
+            if line_stripped.startswith("#"):
+                continue
+            # Include bullet points and regular text
+            if line_stripped.startswith("- "):
+                content = line_stripped[2:].strip()
+            elif not line_stripped.startswith("---") and (
+                not line_stripped.startswith("**") or not line_stripped.endswith("**")
+            ):
+                content = line_stripped
+            else:
+                continue
+            if current["description"]:
+                current["description"] += " " + content
+            else:
+                current["description"] = content
+
+    # Add last section
+    if current and current["description"]:
+        sections.append(current)
+    return sections
+
+
+def parse_trending_topics(raw, wiki_keyword_map: Dict) -> List[Dict]:
+    """
+    Structured trending topics from the analyzer's output
+
+    Args:
+        raw: JSON-encoded list (objects with topic / wiki_keyword / blog_link,
+            or plain strings), optionally in a ```json fence; markdown with
+            ### headings; or an already-structured list
+        wiki_keyword_map: keyword -> wiki URL from wiki-keywords.json
+
+    Returns:
+        List of {"topic", "description", "mentioned_by"} dicts, with
+        "wiki_links" when an explicit wiki_keyword is in the map and
+        "blog_link" as given (checked against disk at render time)
+    """
+    if isinstance(raw, list):
+        # Own copy: wiki_links are added to these dicts later
+        return thaw(raw)
+    if not isinstance(raw, str):
+        return []
+
+    # Clean up markdown code fences if present
+    clean_raw = raw.strip()
+    if clean_raw.startswith("```"):
+        clean_raw = clean_raw.replace("```json", "").replace("```", "").strip()
+
+    # First, try to parse as JSON array (new format)
+    try:
+        parsed_topics = json.loads(clean_raw)
+    except json.JSONDecodeError:
+        parsed_topics = None
+
+    if isinstance(parsed_topics, list):
+        trending_topics = []
+        for topic in parsed_topics:
+            if not isinstance(topic, dict):
+                # Old format: simple string
+                trending_topics.append(
+                    {"topic": str(topic), "description": "", "mentioned_by": ["Analysis"]}
+                )
+                continue
+            # New format: {"topic": "...", "wiki_keyword": "..."}
+            topic_obj = {
+                "topic": topic.get("topic", ""),
+                "description": "",
+                "mentioned_by": ["Analysis"],
+            }
+            if topic.get("blog_link"):
+                topic_obj["blog_link"] = topic["blog_link"]
+            # Add wiki link if keyword provided and exists in map
+            wiki_kw = topic.get("wiki_keyword")
+            if wiki_kw and wiki_kw in wiki_keyword_map:
+                topic_obj["wiki_links"] = [
+                    {"anchor": _wiki_anchor(wiki_keyword_map[wiki_kw]), "title": wiki_kw.title()}
+                ]
+            trending_topics.append(topic_obj)
+        return trending_topics
+
+    # Fall back to markdown parsing
+    trending_topics = _parse_markdown_sections(raw, "topic", {"mentioned_by": ["Analysis"]})
+    if not trending_topics:
+        trending_topics = [
+            {
+                "topic": "Content Opportunities",
+                "description": raw[:100],
+                "mentioned_by": ["Analysis"],
+            }
+        ]
+    return trending_topics
+
+
+def link_topics_to_wiki(trending_topics: List[Dict], keyword_map: Dict) -> None:
+    """
+    Fuzzy-match topics without explicit wiki links to a wiki keyword, in place
+
+    At least 2 meaningful words (longer than 3 letters) must overlap, to
+    avoid false matches such as single-word "coffee" matching "Ribeye Steak
+    Preparation". The first matching keyword wins.
+    """
+    for topic in trending_topics:
+        # Skip if wiki_links already set from explicit wiki_keyword
+        if not isinstance(topic, dict) or topic.get("wiki_links"):
+            continue
+
+        topic_words = set(w for w in topic.get("topic", "").lower().split() if len(w) > 3)
+        for keyword, wiki_url in keyword_map.items():
+            keyword_words = set(w for w in keyword.lower().split() if len(w) > 3)
+            if len(topic_words & keyword_words) >= 2:
+                topic["wiki_links"] = [{"anchor": _wiki_anchor(wiki_url), "title": keyword.title()}]
+                break  # Just need one match
+
+
+def parse_key_insights(raw) -> List:
+    """
+    Structured key insights from the analyzer's output
+
+    Args:
+        raw: Markdown with ### headings, or an already-structured list
+
+    Returns:
+        List of {"title", "description"} dicts (lists are passed through)
+    """
+    if isinstance(raw, list):
+        return raw
+    if not isinstance(raw, str):
+        return []
+    key_insights = _parse_markdown_sections(raw, "title", {})
+    if not key_insights:
+        key_insights = [{"title": "Key Insight", "description": raw[:100]}]
+    return key_insights
+
+
+def sentiment_percentages(sentiment: Dict) -> Dict:
+    """
+    Copy of a comment_sentiment dict with percentages for the sentiment bar
+
+    Adds positive_percent / neutral_percent / negative_percent when there
+    is at least one counted comment.
+    """
+    sentiment = dict(sentiment)
+    counts = {k: sentiment.get(f"{k}_count", 0) for k in ("positive", "neutral", "negative")}
+    total_comments = sum(counts.values())
+    if total_comments > 0:
+        for kind, count in counts.items():
+            sentiment[f"{kind}_percent"] = round((count / total_comments) * 100)
+    return sentiment
+
+
+def drop_dead_blog_links(trending_topics: List[Dict], public_dir: Path) -> List[Dict]:
+    """
+    Trending topics with any blog_link whose page isn't on disk removed
+
+    Runs at render time: a post published after the weekly run makes its
+    link live without rebuilding the view model.
+    """
+    live = []
+    for topic in trending_topics:
+        link = topic.get("blog_link") if isinstance(topic, dict) else None
+        if link and not (Path(public_dir) / link.lstrip("/")).exists():
+            topic = {k: v for k, v in topic.items() if k != "blog_link"}
+        live.append(topic)
+    return live
+
+
+def load_view_model(path: Path, fingerprint: str) -> Optional[Dict]:
+    """
+    The stored view, or None when it must be (re)built
+
+    Args:
+        path: Artifact file
+        fingerprint: Digest of the current inputs
+
+    Returns:
+        The "view" dict when the file exists, parses, and matches both
+        VIEW_MODEL_VERSION and fingerprint
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            artifact = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(artifact, dict):
+        return None
+    if artifact.get("version") != VIEW_MODEL_VERSION:
+        return None
+    if artifact.get("inputs") != fingerprint or not isinstance(artifact.get("view"), dict):
+        return None
+    return artifact["view"]
+
+
+def save_view_model(path: Path, view: Dict, fingerprint: str) -> None:
+    """Atomically write the artifact"""
+    artifact = {
+        "version": VIEW_MODEL_VERSION,
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+        "inputs": fingerprint,
+        "view": view,
+    }
+    OutputWriter().write_json(path, artifact, indent=2, ensure_ascii=False, default=str)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Write-if-changed, atomic output writer shared by the site generators.
+
+generate.py, generate_blog_pages.py and ketodial/scripts/generate_kd_blog.py
+used to rewrite every output on every run, sitemap and RSS feed included.
+That bumped mtimes on unchanged pages, added noise to git diffs and made
+the deploy re-upload files that hadn't changed. OutputWriter hashes the new
+content and compares it with the file on disk. An identical file is left
+alone, mtime included. Everything else is written to a temp file in the
+same directory and renamed over the target, so a crash or a concurrent
+reader never sees a half-written page.
+
+Each writer counts files and bytes written versus skipped; report() gives
+the one-line summary the generators print at the end of a run. It is safe
+to share between threads.
+
+Typical use:
+
+    writer = OutputWriter()
+    writer.write_text(PUBLIC_DIR / "feed.xml", rendered)
+    writer.write_json(DATA_DIR / "channel_rankings.json", rankings, indent=2)
+    print(writer.report())
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+
+def _format_bytes(n: int) -> str:
+    if n < 1024:
+        return f"{n} B"
+    if n < 1024 * 1024:
+        return f"{n / 1024:.1f} KB"
+    return f"{n / (1024 * 1024):.1f} MB"
+
+
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once: os.umask can only be queried by setting it, which isn't thread-safe
+_UMASK = _current_umask()
+
+
+class OutputWriter:
+    """Skips writes whose content matches the file on disk; writes the rest atomically."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.written = 0
+        self.bytes_written = 0
+        self.skipped = 0
+        self.bytes_skipped = 0
+
+    @staticmethod
+    def _unchanged(path: Path, data: bytes) -> bool:
+        try:
+            if path.stat().st_size != len(data):
+                return False
+            with open(path, "rb") as f:
+                on_disk = hashlib.sha256(f.read()).digest()
+        except OSError:
+            return False
+        return on_disk == hashlib.sha256(data).digest()
+
+    def write_bytes(self, path, data: bytes) -> bool:
+        """
+        Write data to path unless the file already holds exactly that
+
+        Args:
+            path: Output file; parent directories are created as needed
+            data: Complete new content
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        path = Path(path)
+        if self._unchanged(path, data):
+            with self._lock:
+                self.skipped += 1
+                self.bytes_skipped += len(data)
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            mode = path.stat().st_mode & 0o777
+        except OSError:
+            mode = 0o666 & ~_UMASK
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # mkstemp creates 0600; keep the permissions a plain open() would give
+            os.chmod(tmp, mode)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            self.written += 1
+            self.bytes_written += len(data)
+        return True
+
+    def write_text(self, path, text: str, encoding: str = "utf-8") -> bool:
+        """write_bytes() for text"""
+        return self.write_bytes(path, text.encode(encoding))
+
+    def write_json(self, path, value, **dump_kwargs) -> bool:
+        """write_text() of json.dumps(value, **dump_kwargs)"""
+        return self.write_text(path, json.dumps(value, **dump_kwargs))
+
+    def report(self) -> str:
+        return (
+            f"Output: {self.written} files written ({_format_bytes(self.bytes_written)}), "
+            f"{self.skipped} unchanged ({_format_bytes(self.bytes_skipped)} not rewritten)"
+        )
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Related-posts index shared by the CW and KD blog generators.
+
+generate_blog_pages.py used to call find_related_posts() once per post.
+Each call scanned every post, rebuilt its tag set, and re-sorted the whole
+corpus by date when fewer than three posts matched: O(N² log N) per
+build, scored on tag and category overlap only. RelatedPostsIndex is built
+once per run. Each post becomes a TF-IDF vector over its title, tags,
+category and excerpt. Every pair's cosine similarity comes from one matrix
+product (NumPy; a pure-Python fallback ranks identically), and each post
+keeps its top k. Posts only relate to posts on the same site. A post with
+fewer than k similar posts is topped up with the most recent ones, as
+before.
+
+The index is cached in data/related_posts_index.json with one section per
+site, keyed by a hash of that site's corpus. If the corpus is unchanged,
+the stored lists load with no scoring at all. When posts are added or
+edited, only their term counts are recomputed and the rest come from the
+cache. The similarity matrix is always rebuilt, because IDF depends on
+the whole corpus.
+
+Typical use:
+
+    index = RelatedPostsIndex([p for p in posts if p.get("published")])
+    for post in posts:
+        related = index.related(post)   # list of post dicts, best first
+    index.save()
+    print(index.report())
+"""
+
+import hashlib
+import json
+import math
+import re
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from output_writer import OutputWriter
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python scoring, same ranking
+    np = None
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+RELATED_INDEX_FILE = BASE_DIR / "data" / "related_posts_index.json"
+
+# Bump when tokenizing or scoring changes, so cached lists are recomputed
+INDEX_VERSION = 1
+RELATED_POSTS_K = 3
+
+# Term weight per occurrence, by where the term appears
+FIELD_WEIGHTS = {"title": 2.0, "excerpt": 1.0, "tag": 3.0, "tag_word": 1.0, "category": 1.0}
+
+# Scores are rounded before ranking so NumPy and pure Python break ties alike
+SCORE_DECIMALS = 9
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by can do does for from has have how i if in into is it its "
+    "my not of on or our so than that the their them they this to vs was we what when which "
+    "who why will with you your".split()
+)
+
+
+def _words(text) -> List[str]:
+    return [
+        w for w in _WORD_RE.findall(str(text or "").lower()) if len(w) > 1 and w not in STOPWORDS
+    ]
+
+
+def _excerpt(post: Dict) -> str:
+    return post.get("excerpt") or (post.get("seo") or {}).get("meta_description") or ""
+
+
+def _date(post: Dict) -> str:
+    return post.get("date") or post.get("publish_date") or post.get("scheduled_date") or ""
+
+
+def post_terms(post: Dict) -> Dict[str, float]:
+    """
+    Weighted term counts for one post
+
+    Whole tags ("#tag") and the category ("@category") are terms of their
+    own, on top of the words they contain.
+    """
+    counts = Counter()
+    for word in _words(post.get("title")):
+        counts[word] += FIELD_WEIGHTS["title"]
+    for word in _words(_excerpt(post)):
+        counts[word] += FIELD_WEIGHTS["excerpt"]
+    for tag in post.get("tags") or []:
+        tag = str(tag).strip().lower()
+        if tag:
+            counts["#" + tag] += FIELD_WEIGHTS["tag"]
+            for word in _words(tag):
+                counts[word] += FIELD_WEIGHTS["tag_word"]
+    category = str(post.get("category") or "").strip().lower()
+    if category:
+        counts["@" + category] += FIELD_WEIGHTS["category"]
+    return dict(counts)
+
+
+def _post_hash(post: Dict) -> str:
+    source = [post.get("title"), _excerpt(post), post.get("tags") or [], post.get("category")]
+    return hashlib.sha256(json.dumps(source, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _tfidf(term_counts: List[Dict[str, float]]) -> List[Dict[str, float]]:
+    """L2-normalised TF-IDF vectors (sublinear tf, smoothed idf), as sparse dicts."""
+    n = len(term_counts)
+    df = Counter(term for counts in term_counts for term in counts)
+    idf = {term: math.log((1 + n) / (1 + d)) + 1.0 for term, d in df.items()}
+    vectors = []
+    for counts in term_counts:
+        vec = {t: (1.0 + math.log(c)) * idf[t] for t, c in counts.items()}
+        norm = math.sqrt(sum(w * w for w in vec.values()))
+        vectors.append({t: w / norm for t, w in vec.items()} if norm else {})
+    return vectors
+
+
+def _top_k_numpy(vectors, recency, k) -> List[List[int]]:
+    vocab = {t: i for i, t in enumerate(sorted({t for vec in vectors for t in vec}))}
+    matrix = np.zeros((len(vectors), max(1, len(vocab))))
+    for row, vec in enumerate(vectors):
+        for term, weight in vec.items():
+            matrix[row, vocab[term]] = weight
+    scores = np.round(matrix @ matrix.T, SCORE_DECIMALS)
+    np.fill_diagonal(scores, 0.0)
+    # Best score first, most recent first among equal scores
+    ties = np.broadcast_to(np.asarray(recency), scores.shape)
+    order = np.lexsort((ties, -scores), axis=1)[:, :k]
+    return [
+        [int(j) for j in order[i] if scores[i, j] > 0] for i in range(len(vectors))
+    ]
+
+
+def _top_k_python(vectors, recency, k) -> List[List[int]]:
+    # Inverted index: a post is only scored against posts that share a term with it
+    postings = defaultdict(list)
+    for j, vec in enumerate(vectors):
+        for term, weight in vec.items():
+            postings[term].append((j, weight))
+    out = []
+    for i, vec in enumerate(vectors):
+        acc = defaultdict(float)
+        for term, weight in vec.items():
+            for j, other in postings[term]:
+                acc[j] += weight * other
+        acc.pop(i, None)
+        scored = sorted(
+            (-score, recency[j], j)
+            for j, score in ((j, round(s, SCORE_DECIMALS)) for j, s in acc.items())
+            if score > 0
+        )
+        out.append([j for _, _, j in scored[:k]])
+    return out
+
+
+class RelatedPostsIndex:
+    """Top-k related posts per post, by TF-IDF cosine similarity within each site."""
+
+    def __init__(
+        self,
+        posts: Iterable[Dict],
+        cache_file: Optional[Path] = RELATED_INDEX_FILE,
+        k: int = RELATED_POSTS_K,
+    ):
+        """
+        Args:
+            posts: Posts that may be linked as related (usually the published ones)
+            cache_file: JSON file the index persists to (None: don't cache)
+            k: Related posts per post
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.k = k
+        self.built_sites: List[str] = []
+        self.cached_sites: List[str] = []
+        self.tokenized = 0
+        self.seconds = 0.0
+        self._dirty = False
+        self._posts: Dict[tuple, Dict] = {}
+        self._related: Dict[tuple, List[str]] = {}
+        self.sites: Dict[str, Dict] = self._load()
+
+        by_site: Dict[str, List[Dict]] = {}
+        for post in posts:
+            if post.get("slug"):
+                site = post.get("site", "cw")
+                by_site.setdefault(site, []).append(post)
+                self._posts[(site, post["slug"])] = post
+        for site, group in sorted(by_site.items()):
+            self._index_site(site, group)
+
+    def _load(self) -> Dict[str, Dict]:
+        if self.cache_file is None:
+            return {}
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != INDEX_VERSION or data.get("k") != self.k:
+            return {}
+        return data.get("sites", {})
+
+    def _index_site(self, site: str, group: List[Dict]):
+        # Most recent first; slug breaks date ties so the order never depends on input order
+        group = sorted(group, key=lambda p: p["slug"])
+        group.sort(key=_date, reverse=True)
+        hashes = [_post_hash(p) for p in group]
+        corpus = hashlib.sha256(
+            json.dumps([[p["slug"], _date(p), h] for p, h in zip(group, hashes)]).encode()
+        ).hexdigest()
+
+        section = self.sites.get(site) or {}
+        if section.get("corpus") == corpus:
+            self.cached_sites.append(site)
+        else:
+            start = time.perf_counter()
+            known = section.get("posts", {})
+            entries = {}
+            for post, h in zip(group, hashes):
+                entry = known.get(post["slug"])
+                if not entry or entry.get("hash") != h:
+                    entry = {"hash": h, "terms": post_terms(post)}
+                    self.tokenized += 1
+                entries[post["slug"]] = entry
+
+            vectors = _tfidf([entries[p["slug"]]["terms"] for p in group])
+            recency = list(range(len(group)))
+            top_k = (_top_k_numpy if np is not None else _top_k_python)(vectors, recency, self.k)
+
+            related = {}
+            for i, post in enumerate(group):
+                picks = [group[j]["slug"] for j in top_k[i]]
+                # Fill up to k with recent posts if not enough similar ones
+                for other in group:
+                    if len(picks) >= self.k:
+                        break
+                    if other["slug"] != post["slug"] and other["slug"] not in picks:
+                        picks.append(other["slug"])
+                related[post["slug"]] = picks
+
+            section = {"corpus": corpus, "posts": entries, "related": related}
+            self.sites[site] = section
+            self.built_sites.append(site)
+            self.seconds += time.perf_counter() - start
+            self._dirty = True
+
+        for slug, picks in section["related"].items():
+            self._related[(site, slug)] = picks
+
+    def related(self, post: Dict) -> List[Dict]:
+        """The post's related posts, best match first (empty if it isn't indexed)"""
+        site = post.get("site", "cw")
+        return [
+            self._posts[(site, slug)]
+            for slug in self._related.get((site, post.get("slug")), [])
+            if (site, slug) in self._posts
+        ]
+
+    def save(self):
+        """Atomically write the index if anything was rebuilt"""
+        if self.cache_file is None or not self._dirty:
+            return
+        OutputWriter().write_json(
+            self.cache_file,
+            {"version": INDEX_VERSION, "k": self.k, "sites": self.sites},
+            indent=2,
+            sort_keys=True,
+        )
+        self._dirty = False
+
+    def report(self) -> str:
+        parts = []
+        if self.built_sites:
+            parts.append(
+                f"rebuilt {', '.join(self.built_sites)} ({self.tokenized} posts re-tokenized, "
+                f"{self.seconds * 1000:.0f} ms, {'numpy' if np is not None else 'pure Python'})"
+            )
+        if self.cached_sites:
+            parts.append(f"{', '.join(self.cached_sites)} from cache")
+        return "Related posts: " + ("; ".join(parts) or "no posts")
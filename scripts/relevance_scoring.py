@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Keyword relevance scoring for carnivore diet videos.
+
+Used by youtube_collector.py to decide which search results are on-topic.
+Every keyword class is compiled once, at import, into a single regex
+alternation, so scoring a video is a handful of C-level scans rather than
+dozens of Python substring checks and a fresh re.compile per keyword per
+title. The language checks take a str.isascii() fast path, which covers
+almost every title we see, and only fall back to per-character counting for
+text that actually contains non-ASCII characters.
+
+Scores are identical to the original per-keyword implementation; see
+benchmarks/bench_relevance.py for the parity check and throughput numbers.
+
+Typical use:
+
+    from relevance_scoring import score_many
+
+    for video, (score, reason) in zip(videos, score_many(videos)):
+        ...
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+# Title keyword blocklist — videos whose titles contain these are dropped
+# regardless of channel. Catches off-topic uploads from legit creators.
+BLOCKED_TITLE_KEYWORDS = [
+    "vegan", "plant-based", "plant based",          # anti-carnivore stance
+    "vegetarian", "veggie", "veg", "meatless",      # not carnivore content
+]
+
+# Unambiguously carnivore / lion diet
+STRONG_KEYWORDS = [
+    "carnivore diet", "carnivore", "animal-based", "animal based",
+    "zero carb", "no carb", "meat diet", "meat only", "beef only",
+    "lion diet", "nose to tail",
+    # Natural phrasings creators actually use in titles
+    "only meat", "all meat", "meat and salt", "beef and salt",
+]
+
+# Carnivore-adjacent foods — enough on their own to keep a video
+MEAT_KEYWORDS = [
+    "steak", "ribeye", "organ meat", "beef tallow", "brisket",
+    "beef liver", "bone broth", "ground beef",
+]
+
+# Low-carb baking markers. Carnivore food doesn't involve flour or baked
+# goods, so these mean a keto/low-carb recipe channel — unless the title
+# explicitly says carnivore, since "Carnivore Bread" is a real thing.
+# Catches titles like "ZERO FLOUR and almost ZERO CARBS", which otherwise
+# score as carnivore off the substring "zero carb".
+LOWCARB_BAKING_KEYWORDS = [
+    "flour", "bread", "tortilla", "brownie", "muffin", "pancake",
+    "cookie", "bun", "buns", "dessert", "sweetener", "sugar-free",
+]
+EXPLICIT_CARNIVORE_KEYWORDS = [
+    "carnivore", "lion diet", "animal-based", "animal based", "nose to tail",
+]
+
+# Non-ASCII symbols that show up in English titles and should not count
+# towards the non-English ratio
+ENGLISH_TITLE_SYMBOLS = '™''""–—•…&♥️💪🍓'
+
+
+def _alternation(keywords: Iterable[str], word_boundary: bool = False) -> "re.Pattern":
+    """One compiled regex matching any keyword; longest first so overlaps don't matter."""
+    body = "|".join(re.escape(kw) for kw in sorted(set(keywords), key=len, reverse=True))
+    return re.compile(rf"\b(?:{body})\b" if word_boundary else f"(?:{body})")
+
+
+BLOCKED_TITLE_RE = _alternation(BLOCKED_TITLE_KEYWORDS, word_boundary=True)
+STRONG_RE = _alternation(STRONG_KEYWORDS)
+MEAT_RE = _alternation(MEAT_KEYWORDS)
+LOWCARB_BAKING_RE = _alternation(LOWCARB_BAKING_KEYWORDS, word_boundary=True)
+EXPLICIT_CARNIVORE_RE = _alternation(EXPLICIT_CARNIVORE_KEYWORDS)
+NON_ENGLISH_CHAR_RE = re.compile(
+    "[^\x00-\x7f" + "".join(re.escape(c) for c in set(ENGLISH_TITLE_SYMBOLS)) + "]"
+)
+
+
+def is_non_english_title(title: str) -> bool:
+    """Detect non-English titles by checking for high ratio of non-ASCII chars."""
+    if not title or title.isascii():
+        return False
+    non_ascii = len(NON_ENGLISH_CHAR_RE.findall(title))
+    # If more than 20% of chars are non-ASCII, likely non-English
+    return len(title) > 10 and non_ascii / len(title) > 0.15
+
+
+def is_blocked_title(title: str) -> bool:
+    """Return True if the video title contains a blocked keyword.
+
+    Matched on word boundaries so short tokens like "veg" catch "Veg Dinners"
+    without firing on unrelated words.
+    """
+    return BLOCKED_TITLE_RE.search(title.lower()) is not None
+
+
+def is_likely_english(text: str) -> bool:
+    """
+    Check if text is likely English by detecting non-Latin characters.
+
+    Filters out videos with titles containing:
+    - Japanese (Hiragana, Katakana, Kanji)
+    - Chinese (Hanzi)
+    - Korean (Hangul)
+    - Arabic, Thai, Devanagari, etc.
+
+    Args:
+        text: Video title or description to check
+
+    Returns:
+        True if text appears to be English (Latin characters), False otherwise
+    """
+    # Pure ASCII has no non-Latin or accented characters to count
+    if not text or text.isascii():
+        return True  # Empty text is fine
+
+    # Count non-Latin and accented-Latin characters
+    non_latin_count = 0
+    accented_latin_count = 0
+    total_chars = 0
+
+    for char in text:
+        if char.isspace() or char.isdigit() or not char.isalnum():
+            continue
+        total_chars += 1
+        cp = ord(char)
+        if cp > 0x024F:
+            # Non-Latin script (Arabic, CJK, Cyrillic, etc.)
+            non_latin_count += 1
+        elif cp > 0x007F:
+            # Accented Latin (0x0080-0x024F): é, ã, ç, ñ, etc.
+            # Common in Portuguese, Spanish, French — rare in English titles
+            accented_latin_count += 1
+
+    if total_chars == 0:
+        return True
+
+    # Reject if >15% non-Latin script (Arabic, CJK, etc.)
+    if non_latin_count / total_chars > 0.15:
+        return False
+
+    # Reject if >8% accented Latin — catches Portuguese/Spanish/French titles
+    # English titles almost never exceed this threshold
+    if accented_latin_count / total_chars > 0.08:
+        return False
+
+    return True
+
+
+def score_relevance(title: str, description: str) -> Tuple[int, str]:
+    """
+    Score video relevance to carnivore diet content using keyword matching.
+
+    Returns:
+        (score, reason) tuple; score >= MIN_RELEVANCE_SCORE keeps the video
+    """
+    title_l = title.lower()
+    if BLOCKED_TITLE_RE.search(title_l):
+        return (0, "Title contains blocked keyword")
+    if not EXPLICIT_CARNIVORE_RE.search(title_l) and LOWCARB_BAKING_RE.search(title_l):
+        return (3, "Low-carb baking content, not carnivore")
+    text = (title + " " + description).lower()
+    if STRONG_RE.search(text):
+        return (9, "Contains carnivore keywords")
+    if MEAT_RE.search(text):
+        return (7, "Contains carnivore-adjacent meat keywords")
+    # "keto" and "low carb" on their own are competing diets, not carnivore.
+    # These used to score 7 — exactly the pass threshold — which is how
+    # low-carb recipe videos reached the homepage.
+    return (4, "No carnivore keywords found")
+
+
+def score_many(videos: Iterable[Dict]) -> List[Tuple[int, str]]:
+    """
+    Score a batch of videos in one call
+
+    Args:
+        videos: Dicts with "title" and "description" keys (missing = "")
+
+    Returns:
+        One (score, reason) tuple per video, in input order
+    """
+    return [
+        score_relevance(v.get("title") or "", v.get("description") or "") for v in videos
+    ]
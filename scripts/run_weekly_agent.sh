@@ -41,7 +41,7 @@ python3 scripts/extract_wiki_keywords.py
 python3 scripts/generate_blog_pages.py --site cw
 python3 scripts/sync_blog_posts_to_supabase.py || echo "⚠️  Supabase sync failed (non-fatal)"
 
-python3 scripts/generate.py --type pages --site cw
+python3 scripts/generate.py --type pages --site cw --refresh-view-model
 python3 scripts/generate.py --type archive --site cw
 python3 scripts/generate.py --type channels --site cw
 python3 scripts/generate.py --type wiki --site cw
@@ -226,7 +226,7 @@ set -e  # Re-enable exit-on-error for generation steps
 
 # Step 5: Generate Website Pages (unified generator)
 echo "🎨 Step 5/9: Generating website..."
-python3 scripts/generate.py --type pages
+python3 scripts/generate.py --type pages --refresh-view-model
 echo ""
 
 # Step 6: Generate Archive (unified generator)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Run generation stages concurrently with buffered, non-interleaved output.
+
+UnifiedGenerator.generate("all") used to run pages, archive, newsletter,
+channels and wiki one after another, although they only share read-only
+inputs and two of them spend most of their time waiting on subprocesses
+(the newsletter renderer, the roundup image). run_stages() runs them on a
+thread pool instead, so a full build takes about as long as its slowest
+stage.
+
+Each stage's stdout and stderr are captured into its own buffer while it
+runs and printed as one block, in the declared stage order, once it and
+every stage before it have finished, so the log reads the same as a serial
+run. A stage can declare dependencies; it is only started after they have
+finished (whether or not they succeeded, as in a serial run).
+
+Threads rather than processes: the stages share the generator's parsed
+data, Jinja environment and build manifest, none of which pickle cheaply,
+and the slow parts release the GIL.
+
+Typical use:
+
+    results = run_stages(
+        [("pages", build_pages), ("archive", build_archive)],
+        dependencies={"archive": ("pages",)},
+        workers=4,
+    )
+    success = all(r.ok for r in results.values())
+"""
+
+import io
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+
+class StageResult(NamedTuple):
+    ok: bool
+    seconds: float
+
+
+class _ThreadRoutedStream:
+    """Stand-in for sys.stdout/stderr that sends each thread's writes to its own buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer):
+        self._local.buffer = buffer
+
+    def release(self):
+        self._local.buffer = None
+
+    def write(self, text):
+        return (getattr(self._local, "buffer", None) or self._stream).write(text)
+
+    def flush(self):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _run_serial(stages) -> Dict[str, StageResult]:
+    results = {}
+    for name, fn in stages:
+        start = time.perf_counter()
+        ok = bool(fn())
+        results[name] = StageResult(ok, time.perf_counter() - start)
+    return results
+
+
+def run_stages(
+    stages: Iterable[Tuple[str, Callable[[], bool]]],
+    dependencies: Dict[str, Iterable[str]] = None,
+    workers: int = 4,
+) -> Dict[str, StageResult]:
+    """
+    Run named stages, concurrently where their dependencies allow
+
+    Args:
+        stages: (name, fn) pairs in display order; fn returns True on success
+        dependencies: name -> names that must finish first. Names not in
+            stages are ignored, so a partial build needs no special casing.
+        workers: Max stages running at once (1 = serial, output unbuffered)
+
+    Returns:
+        name -> StageResult(ok, seconds), in display order. A stage that
+        raises is reported with its traceback and counts as failed.
+    """
+    stages: List[Tuple[str, Callable[[], bool]]] = list(stages)
+    if workers <= 1 or len(stages) <= 1:
+        return _run_serial(stages)
+
+    names = [name for name, _ in stages]
+    fns = dict(stages)
+    deps = {
+        name: [d for d in (dependencies or {}).get(name, ()) if d in fns and d != name]
+        for name in names
+    }
+    buffers = {name: io.StringIO() for name in names}
+    results: Dict[str, StageResult] = {}
+
+    stdout, stderr = _ThreadRoutedStream(sys.stdout), _ThreadRoutedStream(sys.stderr)
+
+    def run(name):
+        stdout.capture(buffers[name])
+        stderr.capture(buffers[name])
+        start = time.perf_counter()
+        try:
+            ok = bool(fns[name]())
+        except Exception:
+            traceback.print_exc()
+            ok = False
+        finally:
+            stdout.release()
+            stderr.release()
+        return StageResult(ok, time.perf_counter() - start)
+
+    sys.stdout, sys.stderr = stdout, stderr
+    try:
+        with ThreadPoolExecutor(max_workers=min(workers, len(stages))) as pool:
+            running = {}
+            flushed = 0
+            while len(results) < len(names):
+                for name in names:
+                    if name in results or name in running.values():
+                        continue
+                    if all(d in results for d in deps[name]):
+                        running[pool.submit(run, name)] = name
+                if not running:
+                    stuck = sorted(set(names) - set(results))
+                    raise ValueError(f"Stage dependency cycle among: {stuck}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+                # Print finished stages in display order, never ahead of an earlier one
+                while flushed < len(names) and names[flushed] in results:
+                    stdout._stream.write(buffers[names[flushed]].getvalue())
+                    stdout._stream.flush()
+                    flushed += 1
+    finally:
+        sys.stdout, sys.stderr = stdout._stream, stderr._stream
+
+    return {name: results[name] for name in names}
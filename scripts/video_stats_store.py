@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Append-only time series of YouTube video statistics.
+
+Every collection run records one (video, timestamp, views, likes, comments)
+snapshot per video it fetched fresh statistics for. youtube_data.json only
+ever holds the latest numbers; this keeps the history so rankings can use
+how fast a video is growing instead of how big it already is.
+
+Storage is columnar: one flat binary file per column under
+data/video_stats/, written with the stdlib array module (8-byte signed ints,
+4-byte video index), plus videos.json mapping the index to a video ID and
+its publish time. Appending a run is one write per column; reading months
+of snapshots is one array.fromfile per column, and the velocity pass walks
+the columns once without building per-row objects.
+
+The store is local to the machine running the collector: data/video_stats/
+is gitignored so the weekly `git add data/` doesn't commit ever-growing
+binaries. Velocity ranking (youtube_collector.py --rank-by velocity) falls
+back to views over hours since publish for videos it has no history for.
+
+Typical use:
+
+    from video_stats_store import VideoStatsStore
+
+    store = VideoStatsStore()
+    store.append(videos)                       # after a collection run
+    ranked = store.velocities(["abc123", ...])  # views/hour, acceleration
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from output_writer import OutputWriter
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_STORE_DIR = BASE_DIR / "data" / "video_stats"
+
+# column name -> array typecode. "q" = int64, "I" = uint32 (>= 4 bytes)
+COLUMNS = {
+    "video": "I",
+    "ts": "q",
+    "views": "q",
+    "likes": "q",
+    "comments": "q",
+}
+
+# Videos younger than this are treated as this old so a first snapshot taken
+# minutes after upload doesn't report an absurd views/hour
+MIN_AGE_HOURS = 1.0
+
+
+def parse_timestamp(value) -> Optional[int]:
+    """RFC 3339 string ("2026-01-05T12:00:00Z") or epoch number to epoch seconds."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+class VideoStatsStore:
+    """Columnar, append-only store of per-video statistics snapshots."""
+
+    def __init__(self, store_dir=None):
+        self.store_dir = Path(store_dir) if store_dir else DEFAULT_STORE_DIR
+        self.index_file = self.store_dir / "videos.json"
+        self._columns: Optional[Dict[str, array]] = None
+        self._ids: List[str] = []
+        self._published: List[Optional[int]] = []
+        self._index: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _column_path(self, name: str) -> Path:
+        return self.store_dir / f"{name}.{COLUMNS[name]}"
+
+    def _load(self):
+        """Read every column into memory once; later appends keep it current."""
+        if self._columns is not None:
+            return
+
+        try:
+            index = json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            index = {"ids": [], "published": []}
+        self._ids = list(index.get("ids", []))
+        self._published = list(index.get("published", []))
+        self._published += [None] * (len(self._ids) - len(self._published))
+        self._index = {vid: i for i, vid in enumerate(self._ids)}
+
+        columns = {}
+        for name, code in COLUMNS.items():
+            col = array(code)
+            path = self._column_path(name)
+            if path.exists():
+                with open(path, "rb") as fh:
+                    col.fromfile(fh, path.stat().st_size // col.itemsize)
+            columns[name] = col
+
+        # An interrupted append can leave columns of unequal length; the
+        # shortest one marks the last complete row
+        rows = min(len(c) for c in columns.values())
+        for name, col in columns.items():
+            if len(col) > rows:
+                del col[rows:]
+                with open(self._column_path(name), "r+b") as fh:
+                    fh.truncate(rows * col.itemsize)
+        self._columns = columns
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._columns["ts"])
+
+    @property
+    def video_count(self) -> int:
+        self._load()
+        return len(self._ids)
+
+    def append(self, videos: Iterable[Dict], timestamp=None) -> int:
+        """
+        Record one snapshot per video
+
+        Args:
+            videos: Collector video dicts: "video_id", "published_at" and
+                either a "statistics" dict or top-level view/like/comment counts
+            timestamp: Observation time (epoch or RFC 3339); default now
+
+        Returns:
+            Number of snapshots written
+        """
+        ts = parse_timestamp(timestamp) if timestamp is not None else int(time.time())
+        rows = {name: array(code) for name, code in COLUMNS.items()}
+
+        with self._lock:
+            self._load()
+            new_ids = False
+            for video in videos:
+                vid = video.get("video_id")
+                if not vid:
+                    continue
+                stats = video.get("statistics") or video
+                idx = self._index.get(vid)
+                if idx is None:
+                    idx = len(self._ids)
+                    self._index[vid] = idx
+                    self._ids.append(vid)
+                    self._published.append(parse_timestamp(video.get("published_at")))
+                    new_ids = True
+                elif self._published[idx] is None and video.get("published_at"):
+                    self._published[idx] = parse_timestamp(video["published_at"])
+                    new_ids = True
+
+                rows["video"].append(idx)
+                rows["ts"].append(ts)
+                rows["views"].append(int(stats.get("view_count", 0) or 0))
+                rows["likes"].append(int(stats.get("like_count", 0) or 0))
+                rows["comments"].append(int(stats.get("comment_count", 0) or 0))
+
+            count = len(rows["ts"])
+            if not count:
+                return 0
+
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            # Index first: a column row must never point past the index
+            if new_ids:
+                OutputWriter().write_json(
+                    self.index_file, {"ids": self._ids, "published": self._published}
+                )
+            for name, col in rows.items():
+                with open(self._column_path(name), "ab") as fh:
+                    col.tofile(fh)
+                self._columns[name].extend(col)
+
+        return count
+
+    def history(self, video_id: str) -> List[Dict]:
+        """Every snapshot of one video, oldest first."""
+        self._load()
+        idx = self._index.get(video_id)
+        if idx is None:
+            return []
+        c = self._columns
+        return [
+            {
+                "ts": c["ts"][i],
+                "views": c["views"][i],
+                "likes": c["likes"][i],
+                "comments": c["comments"][i],
+            }
+            for i, v in enumerate(c["video"]) if v == idx
+        ]
+
+    def velocities(self, video_ids: Iterable[str] = None, now=None) -> Dict[str, Dict]:
+        """
+        Growth metrics from the stored snapshots, one pass over the columns
+
+        views_per_hour is latest views over hours since publish. recent_velocity
+        is views/hour between the last two snapshots, and acceleration is the
+        change in that rate per hour across the last three (0 until a video
+        has enough snapshots).
+
+        Args:
+            video_ids: Restrict to these videos (default: every stored video)
+            now: Reference time for age (epoch or RFC 3339); default latest snapshot
+
+        Returns:
+            {video_id: {"views", "views_per_hour", "recent_velocity",
+                        "acceleration", "snapshots"}}
+        """
+        self._load()
+        c = self._columns
+        if video_ids is None:
+            wanted = set(range(len(self._ids)))
+        else:
+            wanted = {self._index[v] for v in video_ids if v in self._index}
+        if not wanted or not c["ts"]:
+            return {}
+
+        # Last three (ts, views) per video; rows are appended in time order
+        last = {idx: [] for idx in wanted}
+        counts = dict.fromkeys(wanted, 0)
+        for vid, ts, views in zip(c["video"], c["ts"], c["views"]):
+            tail = last.get(vid)
+            if tail is not None:
+                counts[vid] += 1
+                tail.append((ts, views))
+                if len(tail) > 3:
+                    del tail[0]
+
+        ref = parse_timestamp(now) if now is not None else max(c["ts"])
+        result = {}
+        for idx, tail in last.items():
+            if not tail:
+                continue
+            ts, views = tail[-1]
+            published = self._published[idx]
+            age_hours = max((ref - published) / 3600.0, MIN_AGE_HOURS) if published else None
+
+            recent = acceleration = 0.0
+            if len(tail) >= 2:
+                (t1, v1), (t2, v2) = tail[-2], tail[-1]
+                recent = (v2 - v1) / max((t2 - t1) / 3600.0, 1e-9)
+                if len(tail) == 3:
+                    (t0, v0) = tail[0]
+                    prior = (v1 - v0) / max((t1 - t0) / 3600.0, 1e-9)
+                    acceleration = (recent - prior) / max((t2 - t1) / 3600.0, 1e-9)
+
+            result[self._ids[idx]] = {
+                "views": views,
+                "views_per_hour": views / age_hours if age_hours else float(recent),
+                "recent_velocity": recent,
+                "acceleration": acceleration,
+                "snapshots": counts[idx],
+            }
+        return result
+
+    def summary(self) -> str:
+        self._load()
+        if not len(self):
+            return f"Video stats store: empty ({self.store_dir})"
+        first = datetime.fromtimestamp(min(self._columns["ts"]), timezone.utc)
+        last = datetime.fromtimestamp(max(self._columns["ts"]), timezone.utc)
+        return (
+            f"Video stats store: {len(self):,} snapshots of {self.video_count:,} videos, "
+            f"{first:%Y-%m-%d} to {last:%Y-%m-%d}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Video statistics time-series store")
+    parser.add_argument("--dir", help="Store directory (default: data/video_stats)")
+    parser.add_argument("--top", type=int, default=0,
+                        help="Print the N fastest-growing videos by views per hour")
+    args = parser.parse_args()
+
+    store = VideoStatsStore(args.dir)
+    print(store.summary())
+    if args.top:
+        start = time.perf_counter()
+        ranked = sorted(
+            store.velocities().items(), key=lambda kv: kv[1]["views_per_hour"], reverse=True
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        for vid, m in ranked[:args.top]:
+            print(
+                f"  {vid:<12} {m['views_per_hour']:>10,.1f} views/h  "
+                f"{m['acceleration']:>+9.2f} accel  {m['views']:>10,} views"
+            )
+        print(f"  ({elapsed:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,12 +10,16 @@ Author: Created with Claude Code
 Date: 2024-12-25
 """
 
+import argparse
 import os
 import json
-import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List
 from collections import defaultdict
 
 # Third-party imports
@@ -24,6 +28,18 @@ from dotenv import load_dotenv
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from relevance_scoring import (
+    is_blocked_title,
+    is_likely_english,
+    score_many,
+    score_relevance,
+)
+from youtube_quota import QuotaBlocked, YouTubeQuota
+from youtube_response_cache import ResponseCache
+from video_stats_store import MIN_AGE_HOURS, VideoStatsStore, parse_timestamp
+from youtube_data_io import save_youtube_data
+from output_writer import OutputWriter
+
 # Supabase for caching API responses
 try:
     from supabase import create_client
@@ -51,9 +67,13 @@ YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 OUTPUT_FILE = DATA_DIR / "youtube_data.json"
+SEEN_IDS_FILE = DATA_DIR / "seen_video_ids.json"  # Written by generate_commentary.py
+CREATOR_HISTORY_FILE = DATA_DIR / "creator_history.json"  # Written by generate.py --type channels
+WATCHLIST_STATE_FILE = DATA_DIR / "channel_watchlist.json"  # Uploads playlists + poll state
 
 # Search parameters
 SEARCH_QUERIES = ["carnivore diet", "animal-based diet", "meat only diet", "zero carb diet"]
+SEARCH_RESULTS_PER_QUERY = 30  # maxResults per search().list call
 DAYS_BACK = 7  # How many days back to search (7 = fresh content only, avoids repeats across 2x/week runs)
 CACHE_RETENTION_DAYS = 14  # Supabase cache window: covers current + prior week as API-failure failsafe
 REJECTED_RETENTION_DAYS = 30  # Prune rejected_videos log entries older than this
@@ -62,6 +82,21 @@ TOP_CREATORS_COUNT = 12  # How many top creators to analyze (increased for diver
 MAX_VIDEOS_PER_CREATOR = 3  # Max videos per creator (3 gives more chances to find long-form)
 COMMENTS_PER_VIDEO = 20  # Top comments per video
 MIN_RELEVANCE_SCORE = 7  # Minimum keyword relevance score (1-10)
+COLLECTION_WORKERS = 4  # Concurrent API requests on a cold-cache run (1 = fully serial)
+SUPABASE_SYNC_CHUNK = 100  # Rows per bulk upsert when syncing the youtube_videos cache
+STATS_STALENESS_HOURS = 24  # Incremental mode: refresh cached stats older than this
+CACHE_PAGE_SIZE = 500  # Rows per page when reading the youtube_videos cache
+REJECTION_BATCH_SIZE = 50  # rejected_videos rows per background bulk insert
+REJECTION_MAX_PENDING = 2000  # Rejections buffered before new ones are dropped
+WATCHLIST_POLL_SIZE = 10  # Newest uploads read per channel per poll (1 quota unit)
+RANK_BY = "views"  # "views" = raw view count, "velocity" = views/hour since publish (opt-in)
+# Columns the cache filters and page generator actually read. comment_sentiment
+# is not a youtube_videos column (add_sentiment.py fills it in the JSON later),
+# so cached videos always carry None for it.
+CACHE_COLUMNS = (
+    "youtube_id,channel_id,channel_name,title,description,thumbnail_url,published_at,"
+    "view_count,like_count,comment_count,topic_tags,top_comments,stats_fetched_at"
+)
 
 # PERMANENT BLOCKLIST - Channels that should NEVER appear
 BLOCKED_CHANNELS = {
@@ -83,38 +118,13 @@ BLOCKED_CHANNELS = {
     ],
 }
 
-# Title keyword blocklist — videos whose titles contain these are dropped
-# regardless of channel. Catches off-topic uploads from legit creators.
-BLOCKED_TITLE_KEYWORDS = [
-    "vegan", "plant-based", "plant based",          # anti-carnivore stance
-    "vegetarian", "veggie", "veg", "meatless",      # not carnivore content
-]
-
 # Bumping this re-scores videos already sitting in the Supabase cache. Without
-# it, tightening the keyword rules below would only affect newly collected
-# videos and stale keto/low-carb entries would keep their old passing scores.
+# it, tightening the keyword rules in relevance_scoring.py would only affect
+# newly collected videos and stale keto/low-carb entries would keep their old
+# passing scores.
 SCORING_VERSION = 2
 
 
-def is_non_english_title(title: str) -> bool:
-    """Detect non-English titles by checking for high ratio of non-ASCII chars."""
-    if not title:
-        return False
-    non_ascii = sum(1 for c in title if ord(c) > 127 and c not in '™''""–—•…&♥️💪🍓')
-    # If more than 20% of chars are non-ASCII, likely non-English
-    return len(title) > 10 and non_ascii / len(title) > 0.15
-
-
-def is_blocked_title(title: str) -> bool:
-    """Return True if the video title contains a blocked keyword.
-
-    Matched on word boundaries so short tokens like "veg" catch "Veg Dinners"
-    without firing on unrelated words.
-    """
-    t = title.lower()
-    return any(re.search(rf"\b{re.escape(kw)}\b", t) for kw in BLOCKED_TITLE_KEYWORDS)
-
-
 def is_blocked_channel(channel_name):
     """Check if channel is on any blocklist. Returns (blocked, reason) tuple."""
     for reason, names in BLOCKED_CHANNELS.items():
@@ -154,8 +164,9 @@ def get_date_filter() -> str:
     # Get current time
     now = datetime.utcnow()
 
-    # Subtract 7 days
-    past_date = now - timedelta(days=DAYS_BACK)
+    # Subtract 7 days, truncated to the hour so repeated runs issue identical
+    # search requests and can be replayed from the response cache
+    past_date = (now - timedelta(days=DAYS_BACK)).replace(minute=0, second=0, microsecond=0)
 
     # Format as RFC 3339 (Z means UTC timezone)
     return past_date.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -188,56 +199,196 @@ def is_less_than_24_hours_old(timestamp_str: str) -> bool:
         return False
 
 
-def is_likely_english(text: str) -> bool:
+def load_featured_video_ids() -> set:
+    """
+    Video IDs the pipeline has already featured (data/seen_video_ids.json)
+
+    Returns:
+        Set of video IDs, empty if the file is missing or unreadable
+    """
+    try:
+        return {e["video_id"] for e in json.loads(SEEN_IDS_FILE.read_text())}
+    except (OSError, ValueError, KeyError, TypeError):
+        return set()
+
+
+def load_watchlist_channels() -> List[str]:
+    """
+    Channel IDs of every creator we have ever featured (data/creator_history.json)
+
+    Returns:
+        Sorted list of channel IDs, empty if the roster is missing or unreadable
+    """
+    try:
+        creators = json.loads(CREATOR_HISTORY_FILE.read_text()).get("creators", {})
+    except (OSError, ValueError, AttributeError):
+        return []
+    return sorted(
+        {
+            c.get("channel_id") for c in creators.values()
+            if str(c.get("channel_id", "")).startswith("UC")
+        }
+    )
+
+
+def load_watchlist_state() -> Dict:
+    """
+    Uploads-playlist cache and poll bookkeeping for watchlist mode
+
+    Returns:
+        {"uploads_playlists": {channel_id: playlist_id},
+         "last_polled": {channel_id: RFC 3339 timestamp},
+         "recent_uploads": {video_id: search-style video dict}}
+    """
+    state = {"uploads_playlists": {}, "last_polled": {}, "recent_uploads": {}}
+    try:
+        state.update(json.loads(WATCHLIST_STATE_FILE.read_text()))
+    except (OSError, ValueError):
+        pass
+    return state
+
+
+def save_watchlist_state(state: Dict):
+    """Persist watchlist state, dropping uploads older than the search window."""
+    cutoff = get_date_filter()
+    state["recent_uploads"] = {
+        vid: v for vid, v in state.get("recent_uploads", {}).items()
+        if v.get("published_at", "") >= cutoff
+    }
+    try:
+        # Atomic: a crash mid-write must not leave a truncated file to be committed
+        OutputWriter().write_json(WATCHLIST_STATE_FILE, state, indent=2, ensure_ascii=False)
+    except OSError as e:
+        print(f"   ⚠ Could not save watchlist state: {e}")
+
+
+def plan_quota_usage(quota: YouTubeQuota, watchlist: bool = False) -> Dict:
     """
-    Check if text is likely English by detecting non-Latin characters.
+    Predict the quota a cold-cache collection run will spend, without calling the API
 
-    Filters out videos with titles containing:
-    - Japanese (Hiragana, Katakana, Kanji)
-    - Chinese (Hanzi)
-    - Korean (Hangul)
-    - Arabic, Thai, Devanagari, etc.
+    Worst case: every search returns SEARCH_RESULTS_PER_QUERY unique videos and
+    all of them pass the relevance filter. A fresh Supabase cache costs at most
+    a few videos.list units for duration backfills. With the watchlist, every
+    channel without a cached uploads playlist may need the channel-scoped
+    search.list fallback (100 units each) if channels.list fails.
 
     Args:
-        text: Video title or description to check
+        quota: Ledger supplying unit costs and today's remaining allowance
+        watchlist: Include polling every creator_history.json channel's uploads
 
     Returns:
-        True if text appears to be English (Latin characters), False otherwise
+        Dictionary with per-method call counts and units, total and remaining
     """
-    if not text:
-        return True  # Empty text is fine
-
-    # Count non-Latin and accented-Latin characters
-    non_latin_count = 0
-    accented_latin_count = 0
-    total_chars = 0
-
-    for char in text:
-        if char.isspace() or char.isdigit() or not char.isalnum():
-            continue
-        total_chars += 1
-        cp = ord(char)
-        if cp > 0x024F:
-            # Non-Latin script (Arabic, CJK, Cyrillic, etc.)
-            non_latin_count += 1
-        elif cp > 0x007F:
-            # Accented Latin (0x0080-0x024F): é, ã, ç, ñ, etc.
-            # Common in Portuguese, Spanish, French — rare in English titles
-            accented_latin_count += 1
-
-    if total_chars == 0:
-        return True
-
-    # Reject if >15% non-Latin script (Arabic, CJK, etc.)
-    if non_latin_count / total_chars > 0.15:
-        return False
+    max_candidates = len(SEARCH_QUERIES) * SEARCH_RESULTS_PER_QUERY
+    calls = {
+        "search.list": len(SEARCH_QUERIES),
+        "videos.list": -(-max_candidates // 50),
+        "commentThreads.list": max_candidates,
+    }
+    if watchlist:
+        channels = load_watchlist_channels()
+        known = load_watchlist_state()["uploads_playlists"]
+        unresolved = sum(1 for c in channels if c not in known)
+        calls["channels.list"] = -(-unresolved // 50)
+        # Per-channel search.list fallback for channels that don't resolve
+        calls["search.list"] += unresolved
+        calls["playlistItems.list"] = len(channels)
+        # Every polled upload could be new: details + comments for each
+        calls["videos.list"] += -(-len(channels) * WATCHLIST_POLL_SIZE // 50)
+        calls["commentThreads.list"] += len(channels) * WATCHLIST_POLL_SIZE
+
+    print("\n📐 Quota plan for a cold-cache run (worst case, no API calls made)")
+    lines = {}
+    for method, count in calls.items():
+        unit = quota.unit_cost(method)
+        units = count * unit if unit is not None else None
+        lines[method] = {"calls": count, "units": units}
+        shown = f"{units:,}" if units is not None else "UNPRICED"
+        print(f"   {method:<22} {count:>4} calls  {shown:>7} units")
+
+    total = sum(v["units"] or 0 for v in lines.values())
+    print(f"   {'total':<22} {sum(calls.values()):>4} calls  {total:>7,} units")
+    if quota.available:
+        print(f"   Remaining today: {quota.remaining:,} of {quota.cap:,} units")
+        if total > quota.remaining:
+            print("   ⚠ This run could hit the daily cap before it finishes")
+    else:
+        print(f"   ⚠ Quota ledger BLOCKED: {quota.blocked_reason}")
+
+    return {"calls": lines, "total_units": total, "remaining": quota.remaining}
+
+
+class RejectionLogWriter:
+    """
+    Buffers rejected_videos rows and bulk-inserts them from a background thread
 
-    # Reject if >8% accented Latin — catches Portuguese/Spanish/French titles
-    # English titles almost never exceed this threshold
-    if accented_latin_count / total_chars > 0.08:
-        return False
+    The filtering loops call add() for every rejected video; it only appends
+    to an in-memory list, so a slow Supabase never stalls filtering. Rows are
+    flushed as one insert when the buffer reaches batch_size, when a phase
+    ends (flush()), and on close(). Rows that cannot be written, or that
+    arrive while max_pending rows are already waiting, are counted in dropped.
+    """
 
-    return True
+    def __init__(self, supabase, batch_size: int = REJECTION_BATCH_SIZE,
+                 max_pending: int = REJECTION_MAX_PENDING):
+        self.supabase = supabase
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.written = 0
+        self.dropped = 0
+        self._pending: List[Dict] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closing = False
+        self._thread = threading.Thread(
+            target=self._run, name="rejection-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def add(self, record: Dict):
+        """Queue one rejected_videos row. Never blocks on the network."""
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return
+            self._pending.append(record)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        """Ask the background thread to write everything queued so far."""
+        self._wake.set()
+
+    def close(self, timeout: float = 30.0):
+        """Flush what is left and wait for the background thread to finish."""
+        self._closing = True
+        self._wake.set()
+        self._thread.join(timeout)
+        with self._lock:
+            # Anything the thread could not reach in time is lost
+            self.dropped += len(self._pending)
+            self._pending = []
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if batch:
+                try:
+                    self.supabase.table("rejected_videos").insert(batch).execute()
+                    self.written += len(batch)
+                except Exception:
+                    # Logging is not critical - count the loss and move on
+                    with self._lock:
+                        self.dropped += len(batch)
+            if self._closing:
+                with self._lock:
+                    if not self._pending:
+                        return
+                self._wake.set()
 
 
 # ============================================================================
@@ -253,29 +404,60 @@ class YouTubeCollector:
     including searching for videos, getting channel info, and fetching comments.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, workers: int = COLLECTION_WORKERS, quota=None,
+                 response_cache=None, stats_staleness_hours: float = STATS_STALENESS_HOURS,
+                 client_factory: Callable = None, stats_store=None, rank_by: str = RANK_BY):
         """
         Initialize the YouTube API client
 
         Args:
             api_key: Your YouTube Data API v3 key
+            workers: Max concurrent search/comment requests (1 = serial)
+            quota: YouTubeQuota ledger to meter calls against (default: shared ledger)
+            response_cache: ResponseCache for raw API responses (default: .cache/youtube);
+                an offline cache lets the collector run without an API key
+            stats_staleness_hours: Incremental mode refreshes cached stats older than this
+            client_factory: Zero-argument callable returning a YouTube service; called
+                once per thread. Defaults to googleapiclient's build(); benchmarks
+                pass a youtube_fake_backend service instead
+            stats_store: VideoStatsStore receiving one snapshot per fresh stats
+                fetch (default: data/video_stats)
+            rank_by: "velocity" ranks videos and creators by views per hour since
+                publish; "views" by raw view count
 
         Raises:
             ValueError: If API key is missing or invalid
         """
-        if not api_key:
+        self.response_cache = response_cache or ResponseCache()
+        if not api_key and not self.response_cache.offline:
             raise ValueError(
                 "YouTube API key not found! " "Please set YOUTUBE_API_KEY in your .env file"
             )
 
         # Build the YouTube service object
         # This is our connection to YouTube's API
+        self.client_factory = client_factory or (
+            lambda: build("youtube", "v3", developerKey=api_key, cache_discovery=False)
+        )
         try:
-            self.youtube = build("youtube", "v3", developerKey=api_key)
+            self.youtube = self.client_factory()
             print("✓ YouTube API client initialized")
         except Exception as e:
             raise ValueError(f"Failed to initialize YouTube API: {e}")
 
+        self.api_key = api_key
+        self.workers = max(1, int(workers))
+        self._local = threading.local()
+        self.phase_timings: Dict[str, float] = {}
+        # Raw videos().list items memoized per video ID for this run
+        self._facts: Dict[str, Dict] = {}
+        self._facts_lock = threading.Lock()
+        self._rejections = None
+        self.quota = quota or YouTubeQuota()
+        self.stats_staleness_hours = stats_staleness_hours
+        self.stats_store = stats_store if stats_store is not None else VideoStatsStore()
+        self.rank_by = rank_by
+
         # Initialize Supabase client for caching
         self.supabase = None
         try:
@@ -290,6 +472,71 @@ class YouTubeCollector:
             print(f"⚠ Warning: Could not initialize Supabase: {e}")
 
         print("✓ Relevance filtering: keyword matching")
+        if self.workers > 1:
+            print(f"✓ Concurrent collection: {self.workers} workers")
+        if self.quota.available:
+            print(
+                f"✓ Quota ledger: {self.quota.used_today:,} of {self.quota.cap:,} units used today"
+            )
+        else:
+            print(f"⚠ Quota ledger BLOCKED: {self.quota.blocked_reason}")
+
+    def _execute(self, request, method: str):
+        """
+        Run one API request, replaying it from the response cache when possible
+
+        Only real network calls are charged to the quota ledger. In offline
+        mode a cache miss is served as an empty result rather than a call.
+        """
+        cached = self.response_cache.get(method, request)
+        if cached is not None:
+            return cached
+        if self.response_cache.offline:
+            print(f"   ⚠ Offline: no cached {method} response, treating as empty")
+            return {"items": []}
+        response = self.quota.execute(request, method, script="youtube_collector")
+        self.response_cache.put(method, request, response)
+        return response
+
+    def _client(self):
+        """
+        YouTube service object for the calling thread
+
+        googleapiclient services sit on an httplib2.Http, which is not
+        thread-safe, so each worker thread gets its own client from
+        client_factory. The main thread keeps using self.youtube.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self.youtube
+        client = getattr(self._local, "youtube", None)
+        if client is None:
+            client = self.client_factory()
+            self._local.youtube = client
+        return client
+
+    def _fan_out(self, fn: Callable, items: List) -> List:
+        """
+        Run fn over items with up to self.workers threads
+
+        Results come back in input order regardless of which request finishes
+        first, so downstream dedupe and sorting behave exactly like the serial
+        loop.
+        """
+        if self.workers <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    @contextmanager
+    def _timed_phase(self, name: str):
+        """Record and print wall-clock time for one collection phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phase_timings[name] = round(elapsed, 3)
+            print(f"   ⏱ {name}: {elapsed:.2f}s")
 
     def load_from_cache(self) -> Dict:
         """
@@ -307,10 +554,10 @@ class YouTubeCollector:
         try:
             print("\n🔍 Checking Supabase for recent cached data...")
 
-            # Query for most recent collection timestamp
+            # Freshness check reads a single column of a single row
             response = (
                 self.supabase.table("youtube_videos")
-                .select("*")
+                .select("updated_at")
                 .order("updated_at", desc=True)
                 .limit(1)
                 .execute()
@@ -332,22 +579,11 @@ class YouTubeCollector:
             print(f"   ✓ Found recent data (updated: {updated_at})")
             print("   Loading full dataset from cache...")
 
-            cache_cutoff = (
-                datetime.utcnow() - timedelta(days=CACHE_RETENTION_DAYS)
-            ).strftime("%Y-%m-%dT%H:%M:%SZ")
-            all_videos_response = (
-                self.supabase.table("youtube_videos")
-                .select("*")
-                .gte("added_at", cache_cutoff)
-                .execute()
-            )
-
-            if not all_videos_response.data:
-                return {}
-
             # Convert Supabase data back to our JSON format
             videos_by_channel = defaultdict(list)
-            for video in all_videos_response.data:
+            total_rows = 0
+            for video in self._iter_cached_videos():
+                total_rows += 1
                 channel_id = video.get("channel_id")
                 if channel_id:
                     videos_by_channel[channel_id].append(
@@ -366,9 +602,14 @@ class YouTubeCollector:
                             "tags": video.get("topic_tags") or [],
                             "top_comments": video.get("top_comments") or [],
                             "comment_sentiment": video.get("comment_sentiment"),
+                            # Carried through so re-saving doesn't reset it
+                            "stats_fetched_at": video.get("stats_fetched_at"),
                         }
                     )
 
+            if not total_rows:
+                return {}
+
             # Reconstruct top_creators structure
             top_creators = []
             for channel_id, videos in videos_by_channel.items():
@@ -392,68 +633,58 @@ class YouTubeCollector:
                 "collection_timestamp": datetime.now().isoformat(),
                 "search_queries": SEARCH_QUERIES,
                 "days_back": DAYS_BACK,
-                "total_videos_found": len(all_videos_response.data),
+                "total_videos_found": total_rows,
                 "top_creators_count": len(top_creators),
                 "top_creators": top_creators,
                 "source": "cache",
             }
 
-            print(f"   ✓ Loaded {len(all_videos_response.data)} videos from cache")
+            print(f"   ✓ Loaded {total_rows} videos from cache")
             return cached_data
 
         except Exception as e:
             print(f"   ⚠ Error loading from cache: {e}")
             return {}
 
+    def _iter_cached_videos(self, page_size: int = CACHE_PAGE_SIZE) -> Iterator[Dict]:
+        """
+        Stream cached youtube_videos rows inside the retention window, page by page
+
+        Only CACHE_COLUMNS are selected, and rows are ordered by youtube_id so
+        range() pages are stable. Transfer per request stays flat however
+        large the cache grows.
+
+        Args:
+            page_size: Rows per request
+
+        Yields:
+            One row dictionary per cached video
+        """
+        cache_cutoff = (
+            datetime.utcnow() - timedelta(days=CACHE_RETENTION_DAYS)
+        ).strftime("%Y-%m-%dT%H:%M:%SZ")
+        start = 0
+        while True:
+            page = (
+                self.supabase.table("youtube_videos")
+                .select(CACHE_COLUMNS)
+                .gte("added_at", cache_cutoff)
+                .order("youtube_id")
+                .range(start, start + page_size - 1)
+                .execute()
+            ).data or []
+            yield from page
+            if len(page) < page_size:
+                return
+            start += page_size
+
     def score_video_relevance(self, title: str, description: str) -> tuple:
         """
         Score video relevance to carnivore diet content using keyword matching.
         Claude scoring removed — all AI analysis handled by the weekly agent.
+        Rules and keyword lists live in relevance_scoring.py.
         """
-        text = (title + " " + description).lower()
-
-        # Unambiguously carnivore / lion diet
-        strong_keywords = [
-            "carnivore diet", "carnivore", "animal-based", "animal based",
-            "zero carb", "no carb", "meat diet", "meat only", "beef only",
-            "lion diet", "nose to tail",
-            # Natural phrasings creators actually use in titles
-            "only meat", "all meat", "meat and salt", "beef and salt",
-        ]
-        # Carnivore-adjacent foods — enough on their own to keep a video
-        meat_keywords = [
-            "steak", "ribeye", "organ meat", "beef tallow", "brisket",
-            "beef liver", "bone broth", "ground beef",
-        ]
-
-        # Low-carb baking markers. Carnivore food doesn't involve flour or baked
-        # goods, so these mean a keto/low-carb recipe channel — unless the title
-        # explicitly says carnivore, since "Carnivore Bread" is a real thing.
-        # Catches titles like "ZERO FLOUR and almost ZERO CARBS", which otherwise
-        # score as carnivore off the substring "zero carb".
-        lowcarb_baking = [
-            "flour", "bread", "tortilla", "brownie", "muffin", "pancake",
-            "cookie", "bun", "buns", "dessert", "sweetener", "sugar-free",
-        ]
-        explicit_carnivore = [
-            "carnivore", "lion diet", "animal-based", "animal based", "nose to tail",
-        ]
-
-        if is_blocked_title(title):
-            return (0, "Title contains blocked keyword")
-        title_l = title.lower()
-        if not any(kw in title_l for kw in explicit_carnivore) and any(
-            re.search(rf"\b{kw}\b", title_l) for kw in lowcarb_baking
-        ):
-            return (3, "Low-carb baking content, not carnivore")
-        if any(kw in text for kw in strong_keywords):
-            return (9, "Contains carnivore keywords")
-        if any(kw in text for kw in meat_keywords):
-            return (7, "Contains carnivore-adjacent meat keywords")
-        # "keto" and "low carb" on their own are competing diets, not carnivore.
-        # These used to score 7 — exactly the pass threshold — which is how
-        # low-carb recipe videos reached the homepage.
-        return (4, "No carnivore keywords found")
+        return score_relevance(title, description)
 
     def enforce_creator_diversity(self, videos: List[Dict]) -> List[Dict]:
         """
@@ -472,22 +703,55 @@ class YouTubeCollector:
             if creator_id:
                 videos_by_creator[creator_id].append(video)
 
-        # Take top MAX_VIDEOS_PER_CREATOR videos per creator, sorted by views
+        # Take top MAX_VIDEOS_PER_CREATOR videos per creator, by the ranking metric
+        self._attach_velocity(videos)
         diverse_videos = []
         for creator_id, creator_videos in videos_by_creator.items():
-            # Sort by view count (descending)
-            sorted_videos = sorted(
-                creator_videos,
-                key=lambda v: v.get("statistics", {}).get("view_count", 0),
-                reverse=True,
-            )
+            sorted_videos = sorted(creator_videos, key=self._rank_key, reverse=True)
             diverse_videos.extend(sorted_videos[:MAX_VIDEOS_PER_CREATOR])
 
         return diverse_videos
 
+    def _record_snapshots(self, videos: List[Dict]):
+        """Append this run's statistics to the time-series store."""
+        try:
+            written = self.stats_store.append(videos)
+        except OSError as e:
+            print(f"   ⚠ Could not record stats snapshots: {e}")
+            return
+        if written:
+            print(f"   ✓ Recorded {written} stats snapshots ({self.stats_store.summary()})")
+
+    def _attach_velocity(self, videos: List[Dict]):
+        """
+        Set views_per_hour and view_acceleration on each video from the store
+
+        Videos with no stored snapshots fall back to their current view count
+        over hours since publish, so ranking never needs an extra API call.
+        """
+        now = time.time()
+        metrics = self.stats_store.velocities([v["video_id"] for v in videos], now=now)
+        for video in videos:
+            m = metrics.get(video["video_id"])
+            if m is None:
+                published = parse_timestamp(video.get("published_at"))
+                views = video.get("statistics", {}).get("view_count", 0)
+                hours = max((now - published) / 3600.0, MIN_AGE_HOURS) if published else None
+                m = {"views_per_hour": views / hours if hours else 0.0, "acceleration": 0.0}
+            video["views_per_hour"] = round(m["views_per_hour"], 2)
+            video["view_acceleration"] = round(m["acceleration"], 4)
+
+    def _rank_key(self, video: Dict) -> float:
+        if self.rank_by == "velocity":
+            return video.get("views_per_hour", 0)
+        return video.get("statistics", {}).get("view_count", 0)
+
     def log_rejected_video(self, video: Dict, score: int, reason: str):
         """
-        Log rejected video to Supabase for analysis
+        Queue a rejected video for the Supabase rejected_videos log
+
+        Rows are buffered and bulk-inserted by a RejectionLogWriter thread, so
+        this returns immediately.
 
         Args:
             video: Video metadata
@@ -497,20 +761,32 @@ class YouTubeCollector:
         if not self.supabase:
             return
 
-        try:
-            self.supabase.table("rejected_videos").insert(
-                {
-                    "video_id": video.get("video_id"),
-                    "title": video.get("title"),
-                    "channel_name": video.get("channel_title"),
-                    "relevance_score": score,
-                    "rejection_reason": reason,
-                    "published_at": video.get("published_at"),
-                }
-            ).execute()
-        except Exception as e:
-            # Silent fail - logging is not critical
-            pass
+        if self._rejections is None:
+            self._rejections = RejectionLogWriter(self.supabase)
+        self._rejections.add(
+            {
+                "video_id": video.get("video_id"),
+                "title": video.get("title"),
+                "channel_name": video.get("channel_title"),
+                "relevance_score": score,
+                "rejection_reason": reason,
+                "published_at": video.get("published_at"),
+            }
+        )
+
+    def _flush_rejections(self):
+        """End of a filtering phase: hand queued rejections to the writer thread."""
+        if self._rejections is not None:
+            self._rejections.flush()
+
+    def _close_rejection_log(self):
+        """Drain the rejection writer and report what was logged or dropped."""
+        if self._rejections is None:
+            return
+        self._rejections.close()
+        writer = self._rejections
+        self._rejections = None
+        print(f"   📝 Rejection log: {writer.written} written, {writer.dropped} dropped")
 
     def search_videos(self, query: str, max_results: int = 50) -> List[Dict]:
         """
@@ -531,7 +807,7 @@ class YouTubeCollector:
         try:
             # Build the search request
             # part='snippet' means we want video metadata (title, description, etc.)
-            request = self.youtube.search().list(
+            request = self._client().search().list(
                 part="snippet",
                 q=query,
                 type="video",  # Only search for videos (not channels or playlists)
@@ -544,7 +820,7 @@ class YouTubeCollector:
             )
 
             # Execute the API request
-            response = request.execute()
+            response = self._execute(request, "search.list")
 
             # Extract video items from response
             videos = response.get("items", [])
@@ -580,12 +856,49 @@ class YouTubeCollector:
             print(f"✗ YouTube API error: {e}")
             return []
 
+    def _fetch_video_facts(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get raw videos().list items, fetching each video at most once per run
+
+        Every helper that needs per-video data reads from here. One request
+        per 50-ID chunk asks for snippet, statistics and contentDetails
+        together (a videos.list call costs 1 unit whatever the parts), and the
+        items are memoized by video ID so later lookups are free.
+
+        Args:
+            video_ids: List of YouTube video IDs
+
+        Returns:
+            Dictionary mapping video_id -> raw API item (missing = not returned)
+
+        Raises:
+            HttpError: If a chunk request fails; earlier chunks stay memoized
+        """
+        with self._facts_lock:
+            missing = list(dict.fromkeys(v for v in video_ids if v not in self._facts))
+
+        # YouTube API allows max 50 IDs per request — batch in chunks
+        for i in range(0, len(missing), 50):
+            chunk = missing[i:i + 50]
+            request = self._client().videos().list(
+                part="snippet,statistics,contentDetails", id=",".join(chunk)
+            )
+            response = self._execute(request, "videos.list")
+            items = {item["id"]: item for item in response.get("items", [])}
+            with self._facts_lock:
+                # Remember IDs YouTube didn't return (deleted/private) as None
+                for vid in chunk:
+                    self._facts[vid] = items.get(vid)
+
+        with self._facts_lock:
+            return {v: self._facts[v] for v in video_ids if self._facts.get(v)}
+
     def get_video_statistics(self, video_ids: List[str]) -> Dict[str, Dict]:
         """
         Get detailed statistics for multiple videos
 
-        YouTube API allows batch requests (up to 50 video IDs at once)
-        This is more efficient than requesting one video at a time
+        Reads from the shared per-video facts (see _fetch_video_facts), so
+        videos already fetched this run cost no extra requests.
 
         Args:
             video_ids: List of YouTube video IDs
@@ -598,35 +911,26 @@ class YouTubeCollector:
 
         print(f"   Fetching statistics for {len(video_ids)} videos...")
 
-        stats_dict = {}
-
         try:
-            # YouTube API allows max 50 IDs per request — batch in chunks
-            for i in range(0, len(video_ids), 50):
-                chunk = video_ids[i:i + 50]
-                video_ids_str = ",".join(chunk)
-
-                request = self.youtube.videos().list(
-                    part="statistics", id=video_ids_str
-                )
-                response = request.execute()
-
-                # Build dictionary of video_id -> stats
-                for item in response.get("items", []):
-                    video_id = item["id"]
-                    stats = item["statistics"]
-
-                    stats_dict[video_id] = {
-                        "view_count": int(stats.get("viewCount", 0)),
-                        "like_count": int(stats.get("likeCount", 0)),
-                        "comment_count": int(stats.get("commentCount", 0)),
-                    }
-
-            return stats_dict
-
+            facts = self._fetch_video_facts(video_ids)
         except HttpError as e:
             print(f"   ✗ Error fetching statistics: {e}")
             return {}
+        except QuotaBlocked as e:
+            print(f"   ⚠ Skipped statistics (quota): {e}")
+            return {}
+
+        # Build dictionary of video_id -> stats
+        stats_dict = {}
+        for video_id, item in facts.items():
+            stats = item.get("statistics", {})
+            stats_dict[video_id] = {
+                "view_count": int(stats.get("viewCount", 0)),
+                "like_count": int(stats.get("likeCount", 0)),
+                "comment_count": int(stats.get("commentCount", 0)),
+            }
+
+        return stats_dict
 
     def calculate_channel_rankings(self, videos: List[Dict]) -> List[Dict]:
         """
@@ -639,7 +943,7 @@ class YouTubeCollector:
             videos: List of video dictionaries from search
 
         Returns:
-            List of top channels sorted by total views (descending)
+            List of top channels sorted by the ranking metric (descending)
         """
         print(f"\n📊 Calculating channel rankings...")
 
@@ -649,55 +953,57 @@ class YouTubeCollector:
         # Get statistics for all videos
         stats = self.get_video_statistics(video_ids)
 
+        # Filter out live/upcoming videos that report 0 views; these are
+        # broadcasts that haven't accumulated real engagement data yet
+        counted = []
+        for video in videos:
+            video_stats = stats.get(video["video_id"], {})
+            if video_stats.get("view_count", 0) == 0:
+                continue
+            counted.append({**video, "statistics": video_stats})
+
+        filtered_count = len(videos) - len(counted)
+        if filtered_count > 0:
+            print(f"   Filtered {filtered_count} live/upcoming videos (0 views)")
+
+        # Same per-video metrics as the live ranking in collect_all_data
+        self._attach_velocity(counted)
+
         # Dictionary to accumulate views per channel
         # defaultdict creates missing keys automatically with default value (0)
         channel_views = defaultdict(int)
+        channel_velocity = defaultdict(float)
         channel_names = {}  # Store channel names
-
-        # Sum up total views for each channel
-        # Filter out live/upcoming videos that report 0 views
-        filtered_count = 0
-        for video in videos:
-            video_id = video["video_id"]
+        for video in counted:
             channel_id = video["channel_id"]
-
-            # Get view count from stats (default to 0 if not found)
-            views = stats.get(video_id, {}).get("view_count", 0)
-
-            # Skip videos with 0 views — these are live/upcoming broadcasts
-            # that haven't accumulated real engagement data yet
-            if views == 0:
-                filtered_count += 1
-                continue
-
-            # Add to channel's total
-            channel_views[channel_id] += views
-
-            # Remember channel name
+            channel_views[channel_id] += video["statistics"]["view_count"]
+            channel_velocity[channel_id] += video["views_per_hour"]
             channel_names[channel_id] = video["channel_title"]
 
-        if filtered_count > 0:
-            print(f"   Filtered {filtered_count} live/upcoming videos (0 views)")
-
-        # Convert to list of dictionaries and sort by views
+        # Convert to list of dictionaries and sort by the ranking metric
         ranked_channels = [
             {
                 "channel_id": channel_id,
                 "channel_name": channel_names[channel_id],
                 "total_views_week": views,
+                "views_per_hour": round(channel_velocity[channel_id], 2),
             }
             for channel_id, views in channel_views.items()
         ]
-
-        # Sort by total views (highest first)
-        ranked_channels.sort(key=lambda x: x["total_views_week"], reverse=True)
+        ranked_channels.sort(
+            key=lambda x: (
+                x["views_per_hour"] if self.rank_by == "velocity" else x["total_views_week"]
+            ),
+            reverse=True,
+        )
 
         # Print top channels
-        print(f"\n   Top {TOP_CREATORS_COUNT} Channels by Views (past {DAYS_BACK} days):")
+        print(f"\n   Top {TOP_CREATORS_COUNT} Channels by {self.rank_by} (past {DAYS_BACK} days):")
         for i, channel in enumerate(ranked_channels[:TOP_CREATORS_COUNT], 1):
             print(
                 f"   {i}. {channel['channel_name']}: "
-                f"{format_number(channel['total_views_week'])} views"
+                f"{format_number(channel['total_views_week'])} views, "
+                f"{channel['views_per_hour']:.0f}/h"
             )
 
         return ranked_channels[:TOP_CREATORS_COUNT]
@@ -706,6 +1012,10 @@ class YouTubeCollector:
         """
         Get recent videos from a specific channel
 
+        Reads the channel's uploads playlist (1 quota unit) instead of a
+        channel-scoped search.list (100 units). The search is only used when
+        channels.list fails and the playlist can't be resolved.
+
         Args:
             channel_id: YouTube channel ID
             max_results: Number of recent videos to fetch
@@ -713,32 +1023,230 @@ class YouTubeCollector:
         Returns:
             List of video dictionaries with full details
         """
+        failed = []
+        playlist = self._resolve_uploads_playlists([channel_id], failed=failed).get(channel_id)
         try:
-            # Search for videos from this channel only
-            request = self.youtube.search().list(
+            if playlist:
+                uploads = self._poll_uploads(playlist, get_date_filter(), max_results)
+            elif failed:
+                uploads = self._search_channel_uploads(channel_id, get_date_filter(), max_results)
+            else:
+                return []
+        except QuotaBlocked as e:
+            print(f"   ⚠ Skipped channel videos (quota): {e}")
+            return []
+
+        video_ids = [u["video_id"] for u in uploads]
+        if not video_ids:
+            return []
+
+        # Get detailed information for each video
+        return self._get_detailed_video_info(video_ids)
+
+    def _resolve_uploads_playlists(self, channel_ids: List[str],
+                                   known: Dict[str, str] = None,
+                                   failed: List[str] = None) -> Dict[str, str]:
+        """
+        Map channel IDs to their uploads playlist IDs
+
+        Args:
+            channel_ids: Channels to resolve
+            known: Already-resolved mapping; only channels missing from it are fetched
+            failed: If given, channels whose channels.list call errored are appended
+
+        Returns:
+            {channel_id: uploads_playlist_id} for every channel that resolved;
+            if the quota runs out, only those resolved before it did
+        """
+        resolved = dict(known or {})
+        missing = [c for c in dict.fromkeys(channel_ids) if c not in resolved]
+
+        # channels.list takes up to 50 IDs per call
+        for i in range(0, len(missing), 50):
+            chunk = missing[i:i + 50]
+            try:
+                request = self._client().channels().list(
+                    part="contentDetails", id=",".join(chunk), maxResults=50
+                )
+                response = self._execute(request, "channels.list")
+            except HttpError as e:
+                print(f"   ⚠ Could not resolve uploads playlists: {e}")
+                if failed is not None:
+                    failed.extend(chunk)
+                continue
+            except QuotaBlocked as e:
+                # The remaining channels just aren't polled this run
+                print(f"   ⚠ Skipped resolving uploads playlists (quota): {e}")
+                break
+            for item in response.get("items", []):
+                uploads = item.get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+                if uploads:
+                    resolved[item["id"]] = uploads
+
+        return resolved
+
+    def _poll_uploads(self, playlist_id: str, since: str,
+                      max_results: int = WATCHLIST_POLL_SIZE) -> List[Dict]:
+        """
+        Newest uploads in a playlist published after `since`
+
+        Args:
+            playlist_id: Uploads playlist ID ("UU...")
+            since: RFC 3339 timestamp; older uploads are dropped
+            max_results: Playlist items to read (newest first, max 50)
+
+        Returns:
+            List of {"video_id", "published_at"} dicts
+
+        Raises:
+            QuotaBlocked: If the quota ledger refuses the call
+        """
+        try:
+            request = self._client().playlistItems().list(
+                part="contentDetails", playlistId=playlist_id, maxResults=max_results
+            )
+            response = self._execute(request, "playlistItems.list")
+        except HttpError as e:
+            print(f"   ⚠ Could not poll uploads for {playlist_id}: {e}")
+            return []
+
+        uploads = []
+        for item in response.get("items", []):
+            details = item.get("contentDetails", {})
+            published = details.get("videoPublishedAt", "")
+            if details.get("videoId") and published > since:
+                uploads.append({"video_id": details["videoId"], "published_at": published})
+        return uploads
+
+    def _search_channel_uploads(self, channel_id: str, since: str,
+                                max_results: int = WATCHLIST_POLL_SIZE) -> List[Dict]:
+        """
+        Channel-scoped search.list fallback for a channel whose uploads
+        playlist could not be resolved (100 units instead of 1)
+
+        Returns:
+            List of {"video_id", "published_at"} dicts, like _poll_uploads()
+
+        Raises:
+            QuotaBlocked: If the quota ledger refuses the call
+        """
+        try:
+            request = self._client().search().list(
                 part="snippet",
                 channelId=channel_id,
                 type="video",
                 order="date",  # Most recent first
-                publishedAfter=get_date_filter(),
+                publishedAfter=since,
                 maxResults=max_results,
             )
+            response = self._execute(request, "search.list")
+        except HttpError as e:
+            print(f"   ⚠ Could not search uploads for {channel_id}: {e}")
+            return []
 
-            response = request.execute()
-            videos = response.get("items", [])
+        return [
+            {"video_id": item["id"]["videoId"], "published_at": item["snippet"]["publishedAt"]}
+            for item in response.get("items", [])
+            if item.get("id", {}).get("videoId")
+        ]
 
-            # Get video IDs
-            video_ids = [v["id"]["videoId"] for v in videos]
+    def poll_watchlist(self) -> List[Dict]:
+        """
+        Poll every creator we have ever featured for uploads since the last run
 
-            if not video_ids:
-                return []
+        Uploads playlists are resolved once and cached in
+        data/channel_watchlist.json; each run then costs one playlistItems.list
+        unit per channel, fanned out across workers. Only uploads not seen by
+        an earlier poll go through videos.list.
 
-            # Get detailed information for each video
-            return self._get_detailed_video_info(video_ids)
+        If the quota runs out mid-poll, the run falls back to keyword search
+        plus the uploads earlier polls already found, and last_polled is left
+        alone so the next run picks up where this one stopped.
 
+        Returns:
+            Search-style video dicts for every watchlist upload inside the
+            search window, newest first
+        """
+        channels = load_watchlist_channels()
+        if not channels:
+            print("   ⚠ No channels in creator_history.json - watchlist empty")
+            return []
+
+        state = load_watchlist_state()
+        failed = []
+        state["uploads_playlists"] = self._resolve_uploads_playlists(
+            channels, state["uploads_playlists"], failed
+        )
+        playlists = [(c, state["uploads_playlists"][c]) for c in channels
+                     if c in state["uploads_playlists"]]
+        # channels.list errored for these: fall back to a channel-scoped search
+        playlists += [(c, None) for c in failed]
+
+        window = get_date_filter()
+        polled_at = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        def poll(channel_playlist):
+            channel_id, playlist = channel_playlist
+            since = max(state["last_polled"].get(channel_id, ""), window)
+            if playlist is None:
+                return self._search_channel_uploads(channel_id, since)
+            return self._poll_uploads(playlist, since)
+
+        recent = state["recent_uploads"]
+        try:
+            results = self._fan_out(poll, playlists)
+            new_ids = [u["video_id"] for uploads in results for u in uploads
+                       if u["video_id"] not in recent]
+            print(f"   Polled {len(playlists)} channels: {len(new_ids)} new uploads")
+            facts = self._fetch_video_facts(new_ids) if new_ids else {}
         except HttpError as e:
-            print(f"   ✗ Error fetching videos for channel: {e}")
+            # Leave last_polled alone so the next run retries these uploads
+            print(f"   ✗ Error fetching watchlist video details: {e}")
             return []
+        except QuotaBlocked as e:
+            # Keep the playlists resolved so far, but not last_polled
+            print(f"   ⚠ Skipped watchlist polling (quota): {e}")
+            save_watchlist_state(state)
+            return self._recent_watchlist_uploads(state, window)
+
+        for vid in new_ids:
+            item = facts.get(vid)
+            if not item:
+                continue
+            snippet = item["snippet"]
+            duration = self._parse_duration_seconds(
+                item.get("contentDetails", {}).get("duration", "")
+            )
+            if 0 < duration < 300:
+                continue
+            thumbnails = snippet.get("thumbnails", {})
+            recent[vid] = {
+                "video_id": vid,
+                "channel_id": snippet["channelId"],
+                "channel_title": snippet["channelTitle"],
+                "title": snippet["title"],
+                "published_at": snippet["publishedAt"],
+                "thumbnail_url": (
+                    thumbnails.get("medium", {}).get("url")
+                    or thumbnails.get("default", {}).get("url")
+                    or ""
+                ),
+                "description": snippet.get("description", ""),
+            }
+
+        for channel_id, _ in playlists:
+            state["last_polled"][channel_id] = polled_at
+        save_watchlist_state(state)
+        return self._recent_watchlist_uploads(state, window)
+
+    @staticmethod
+    def _recent_watchlist_uploads(state: Dict, window: str) -> List[Dict]:
+        """Uploads found by any poll so far that are inside the search window, newest first"""
+        return sorted(
+            (v for v in state["recent_uploads"].values() if v["published_at"] >= window),
+            key=lambda v: v["published_at"],
+            reverse=True,
+        )
 
     @staticmethod
     def _parse_duration_seconds(duration_str: str) -> int:
@@ -755,18 +1263,13 @@ class YouTubeCollector:
         return h * 3600 + m * 60 + s
 
     def _get_video_durations(self, video_ids: List[str]) -> Dict[str, int]:
-        """Fetch durations for videos missing duration_seconds."""
+        """Durations for videos missing duration_seconds, from the shared video facts."""
         durations = {}
         try:
-            for i in range(0, len(video_ids), 50):
-                chunk = video_ids[i:i + 50]
-                resp = self.youtube.videos().list(
-                    part="contentDetails", id=",".join(chunk)
-                ).execute()
-                for item in resp.get("items", []):
-                    dur = item.get("contentDetails", {}).get("duration", "")
-                    durations[item["id"]] = self._parse_duration_seconds(dur)
-        except HttpError as e:
+            for vid, item in self._fetch_video_facts(video_ids).items():
+                dur = item.get("contentDetails", {}).get("duration", "")
+                durations[vid] = self._parse_duration_seconds(dur)
+        except (HttpError, QuotaBlocked) as e:
             print(f"   ⚠ Could not fetch durations: {e}")
         return durations
 
@@ -784,74 +1287,62 @@ class YouTubeCollector:
             List of detailed video dictionaries
         """
         try:
-            detailed_videos = []
-
-            # Batch in chunks of 50 (YouTube API limit)
-            for i in range(0, len(video_ids), 50):
-                chunk = video_ids[i:i + 50]
-                video_ids_str = ",".join(chunk)
-
-                # Include contentDetails for duration (shorts filter)
-                request = self.youtube.videos().list(
-                    part="snippet,statistics,contentDetails",
-                    id=video_ids_str,
-                )
-                response = request.execute()
-
-                for item in response.get("items", []):
-                    snippet = item["snippet"]
-                    stats = item["statistics"]
-                    content = item.get("contentDetails", {})
+            facts = self._fetch_video_facts(video_ids)
+        except HttpError as e:
+            print(f"   ✗ Error fetching video details: {e}")
+            return []
+        except QuotaBlocked as e:
+            print(f"   ⚠ Skipped video details (quota): {e}")
+            return []
 
-                    # Filter shorts and short-form content (< 5 minutes)
-                    duration_sec = self._parse_duration_seconds(
-                        content.get("duration", "")
-                    )
-                    if 0 < duration_sec < 300:
-                        print(
-                            f"   ✗ Skipped short ({duration_sec}s):"
-                            f" {snippet['title'][:50]}..."
-                        )
-                        continue
+        detailed_videos = []
 
-                    thumbnails = snippet.get("thumbnails", {})
-                    thumbnail_url = (
-                        thumbnails.get("medium", {}).get("url")
-                        or thumbnails.get("default", {}).get("url")
-                        or ""
-                    )
-
-                    view_count = int(stats.get("viewCount", 0))
+        for vid in dict.fromkeys(video_ids):
+            item = facts.get(vid)
+            if not item:
+                continue
+            snippet = item["snippet"]
+            stats = item["statistics"]
+            content = item.get("contentDetails", {})
+
+            # Filter shorts and short-form content (< 5 minutes)
+            duration_sec = self._parse_duration_seconds(content.get("duration", ""))
+            if 0 < duration_sec < 300:
+                print(f"   ✗ Skipped short ({duration_sec}s): {snippet['title'][:50]}...")
+                continue
 
-                    # Skip live/upcoming videos with 0 views
-                    if view_count == 0:
-                        continue
+            thumbnails = snippet.get("thumbnails", {})
+            thumbnail_url = (
+                thumbnails.get("medium", {}).get("url")
+                or thumbnails.get("default", {}).get("url")
+                or ""
+            )
 
-                    video_data = {
-                        "video_id": item["id"],
-                        "title": snippet["title"],
-                        "description": snippet["description"],
-                        "thumbnail_url": thumbnail_url,
-                        "published_at": snippet["publishedAt"],
-                        "duration_seconds": duration_sec,
-                        "statistics": {
-                            "view_count": view_count,
-                            "like_count": int(stats.get("likeCount", 0)),
-                            "comment_count": int(
-                                stats.get("commentCount", 0)
-                            ),
-                        },
-                        "tags": snippet.get("tags", []),
-                        "top_comments": [],
-                    }
+            view_count = int(stats.get("viewCount", 0))
 
-                    detailed_videos.append(video_data)
+            # Skip live/upcoming videos with 0 views
+            if view_count == 0:
+                continue
 
-            return detailed_videos
+            detailed_videos.append(
+                {
+                    "video_id": item["id"],
+                    "title": snippet["title"],
+                    "description": snippet["description"],
+                    "thumbnail_url": thumbnail_url,
+                    "published_at": snippet["publishedAt"],
+                    "duration_seconds": duration_sec,
+                    "statistics": {
+                        "view_count": view_count,
+                        "like_count": int(stats.get("likeCount", 0)),
+                        "comment_count": int(stats.get("commentCount", 0)),
+                    },
+                    "tags": snippet.get("tags", []),
+                    "top_comments": [],
+                }
+            )
 
-        except HttpError as e:
-            print(f"   ✗ Error fetching video details: {e}")
-            return []
+        return detailed_videos
 
     def get_video_comments(self, video_id: str, max_results: int = 20) -> List[Dict]:
         """
@@ -866,7 +1357,7 @@ class YouTubeCollector:
         """
         try:
             # Request comment threads (top-level comments only, not replies)
-            request = self.youtube.commentThreads().list(
+            request = self._client().commentThreads().list(
                 part="snippet",
                 videoId=video_id,
                 order="relevance",  # YouTube's algorithm for "best" comments
@@ -874,7 +1365,7 @@ class YouTubeCollector:
                 textFormat="plainText",  # Get text without HTML formatting
             )
 
-            response = request.execute()
+            response = self._execute(request, "commentThreads.list")
 
             comments = []
 
@@ -904,8 +1395,84 @@ class YouTubeCollector:
                 return []
             print(f"   ⚠ Could not fetch comments: {e}")
             return []
+        except QuotaBlocked as e:
+            # Comments are enrichment; keep the video rather than abort the run
+            print(f"   ⚠ Skipped comments (quota): {e}")
+            return []
+
+    def _load_known_videos(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Look up cached stats and comments for videos already in Supabase
+
+        Args:
+            video_ids: Candidate video IDs from this run's search
+
+        Returns:
+            Dictionary mapping video_id -> {"statistics", "top_comments", "stats_fetched_at"}
+        """
+        if not self.supabase or not video_ids:
+            return {}
+
+        known = {}
+        try:
+            for i in range(0, len(video_ids), 100):
+                response = (
+                    self.supabase.table("youtube_videos")
+                    .select(
+                        "youtube_id,view_count,like_count,comment_count,top_comments,"
+                        "stats_fetched_at"
+                    )
+                    .in_("youtube_id", video_ids[i:i + 100])
+                    .execute()
+                )
+                for row in response.data or []:
+                    # updated_at is bumped by every upsert, cached stats included,
+                    # so staleness is keyed on when videos.list last ran instead
+                    try:
+                        stats_fetched_at = datetime.fromisoformat(
+                            (row.get("stats_fetched_at") or "").replace("Z", "+00:00")
+                        ).replace(tzinfo=None)
+                    except ValueError:
+                        stats_fetched_at = datetime.min
+                    known[row["youtube_id"]] = {
+                        "statistics": {
+                            "view_count": row.get("view_count") or 0,
+                            "like_count": row.get("like_count") or 0,
+                            "comment_count": row.get("comment_count") or 0,
+                        },
+                        "top_comments": row.get("top_comments") or [],
+                        "stats_fetched_at": stats_fetched_at,
+                    }
+        except Exception as e:
+            # Without the lookup every video is simply treated as new
+            print(f"   ⚠ Could not read known videos from cache: {e}")
+        return known
+
+    def _plan_delta(self, videos: List[Dict]) -> tuple:
+        """
+        Split this run's candidates for incremental collection
+
+        - Already featured (data/seen_video_ids.json): dropped entirely
+        - Known (in the Supabase cache): cached comments, stats refreshed only
+          when older than stats_staleness_hours
+        - New: full statistics and comments
 
-    def collect_all_data(self) -> Dict:
+        Returns:
+            (videos_to_keep, known_by_id) tuple
+        """
+        featured = load_featured_video_ids()
+        kept = [v for v in videos if v["video_id"] not in featured]
+        known = self._load_known_videos([v["video_id"] for v in kept])
+
+        stale_cutoff = datetime.utcnow() - timedelta(hours=self.stats_staleness_hours)
+        stale = sum(1 for k in known.values() if k["stats_fetched_at"] < stale_cutoff)
+        print(
+            f"\n🔁 Incremental: {len(kept) - len(known)} new, {len(known)} known "
+            f"({stale} stale stats), {len(videos) - len(kept)} already featured skipped"
+        )
+        return kept, known
+
+    def collect_all_data(self, incremental: bool = False, watchlist: bool = False) -> Dict:
         """
         Main collection method - orchestrates the entire data collection process
 
@@ -917,9 +1484,23 @@ class YouTubeCollector:
         5. Get detailed info for top channels
         6. Collect comments for each video
 
+        Args:
+            incremental: Skip already-featured videos and reuse cached stats and
+                comments for videos already in Supabase (see _plan_delta)
+            watchlist: Also poll the uploads playlist of every creator in
+                creator_history.json (see poll_watchlist)
+
         Returns:
             Complete data dictionary ready to be saved as JSON
         """
+        try:
+            return self._collect_all_data(incremental, watchlist)
+        finally:
+            # Rejections are written in the background; make sure they land
+            self._close_rejection_log()
+
+    def _collect_all_data(self, incremental: bool, watchlist: bool) -> Dict:
+        """Body of collect_all_data; see there."""
         print("\n" + "=" * 70)
         print("🥩 CARNIVORE DIET YOUTUBE DATA COLLECTOR")
         print("=" * 70)
@@ -1016,6 +1597,7 @@ class YouTubeCollector:
 
             print(f"   ✓ Kept: {total_kept} videos (score >= {MIN_RELEVANCE_SCORE})")
             print(f"   ✗ Filtered out: {total_filtered} off-topic videos")
+            self._flush_rejections()
 
             # Update cached data with filtered results
             cached_data["top_creators"] = filtered_creators
@@ -1029,9 +1611,16 @@ class YouTubeCollector:
         all_videos = []
         seen_video_ids = set()
 
-        for query in SEARCH_QUERIES:
+        with self._timed_phase("search"):
+            query_results = self._fan_out(
+                lambda q: self.search_videos(q, max_results=SEARCH_RESULTS_PER_QUERY),
+                SEARCH_QUERIES,
+            )
+
+        # Merge in SEARCH_QUERIES order so the first query to return a video
+        # owns it, exactly as in the serial loop
+        for query, query_videos in zip(SEARCH_QUERIES, query_results):
             print(f"\n🔍 Query: '{query}'")
-            query_videos = self.search_videos(query, max_results=30)
 
             # Deduplicate and filter non-English videos
             for video in query_videos:
@@ -1046,6 +1635,20 @@ class YouTubeCollector:
                     all_videos.append(video)
                     seen_video_ids.add(video_id)
 
+        # Step 1.1: Poll known creators' uploads playlists (1 unit per channel)
+        if watchlist:
+            print("\n📺 Polling creator watchlist...")
+            with self._timed_phase("watchlist"):
+                watched = self.poll_watchlist()
+            added = 0
+            for video in watched:
+                if video["video_id"] in seen_video_ids or not is_likely_english(video["title"]):
+                    continue
+                all_videos.append(video)
+                seen_video_ids.add(video["video_id"])
+                added += 1
+            print(f"   ✓ Added {added} watchlist videos not found by search")
+
         print(f"\n✓ Total unique videos found: {len(all_videos)}")
 
         if not all_videos:
@@ -1057,11 +1660,7 @@ class YouTubeCollector:
         relevant_videos = []
         rejected_count = 0
 
-        for video in all_videos:
-            score, reason = self.score_video_relevance(
-                video.get("title", ""), video.get("description", "")
-            )
-
+        for video, (score, reason) in zip(all_videos, score_many(all_videos)):
             if score >= MIN_RELEVANCE_SCORE:
                 video["relevance_score"] = score
                 video["relevance_reason"] = reason
@@ -1088,6 +1687,7 @@ class YouTubeCollector:
         blocked_count = pre_block_count - len(relevant_videos)
         if blocked_count:
             print(f"   ✗ Blocked: {blocked_count} videos from blocklisted channels")
+        self._flush_rejections()
 
         # Title keyword failsafe — catches off-topic uploads regardless of channel
         pre_title_count = len(relevant_videos)
@@ -1108,22 +1708,58 @@ class YouTubeCollector:
         # This prevents off-topic videos from a creator's channel sneaking in.
         print(f"\n📊 Fetching stats and comments for {len(relevant_videos)} search result videos...")
 
+        known = {}
+        if incremental:
+            relevant_videos, known = self._plan_delta(relevant_videos)
+            if not relevant_videos:
+                print("✗ Every relevant video was already featured. Exiting.")
+                return {}
+
+        # Known videos with fresh cached stats skip the statistics call, and
+        # every known video reuses its cached comments
+        stale_cutoff = datetime.utcnow() - timedelta(hours=self.stats_staleness_hours)
         video_ids = [v["video_id"] for v in relevant_videos]
-        stats_map = self.get_video_statistics(video_ids)
+        stats_ids = [
+            vid for vid in video_ids
+            if vid not in known or known[vid]["stats_fetched_at"] < stale_cutoff
+        ]
+        comment_ids = [vid for vid in video_ids if vid not in known]
+
+        with self._timed_phase("statistics"):
+            stats_map = self.get_video_statistics(stats_ids)
+
+        for video in relevant_videos:
+            if video["video_id"] not in known:
+                print(f"   Getting comments for: {video['title'][:55]}...")
+        with self._timed_phase("comments"):
+            fetched = self._fan_out(
+                lambda vid_id: self.get_video_comments(vid_id, COMMENTS_PER_VIDEO), comment_ids
+            )
+        comments = dict(zip(comment_ids, fetched))
 
+        fetched_at = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
         enriched_videos = []
         for video in relevant_videos:
             vid_id = video["video_id"]
-            stats = stats_map.get(vid_id, {})
+            cached = known.get(vid_id, {})
+            stats = stats_map.get(vid_id) or cached.get("statistics", {})
             video["statistics"] = stats
+            if vid_id in stats_map:
+                video["stats_fetched_at"] = fetched_at
+            elif cached.get("stats_fetched_at", datetime.min) > datetime.min:
+                video["stats_fetched_at"] = cached["stats_fetched_at"].strftime(
+                    "%Y-%m-%dT%H:%M:%SZ"
+                )
             video["view_count"] = stats.get("view_count", 0)
-
-            print(f"   Getting comments for: {video['title'][:55]}...")
-            video["top_comments"] = self.get_video_comments(vid_id, COMMENTS_PER_VIDEO)
+            video["top_comments"] = comments.get(vid_id, cached.get("top_comments", []))
             enriched_videos.append(video)
 
-        # Sort by view count descending
-        enriched_videos.sort(key=lambda v: v.get("view_count", 0), reverse=True)
+        # Only freshly fetched stats are new observations for the time series
+        self._record_snapshots([v for v in enriched_videos if v["video_id"] in stats_map])
+        self._attach_velocity(enriched_videos)
+
+        # Sort by the ranking metric, descending
+        enriched_videos.sort(key=self._rank_key, reverse=True)
 
         # Group by channel to match generate.py's expected top_creators structure
         from collections import defaultdict
@@ -1139,11 +1775,17 @@ class YouTubeCollector:
                 "channel_id": cid,
                 "channel_name": channel_names[cid],
                 "total_views_week": sum(v.get("view_count", 0) for v in vids),
+                "views_per_hour": round(sum(v["views_per_hour"] for v in vids), 2),
                 "videos": vids,
             }
             for cid, vids in by_channel.items()
         ]
-        top_creators.sort(key=lambda c: c["total_views_week"], reverse=True)
+        top_creators.sort(
+            key=lambda c: (
+                c["views_per_hour"] if self.rank_by == "velocity" else c["total_views_week"]
+            ),
+            reverse=True,
+        )
 
         print(f"\n✓ {len(enriched_videos)} videos from {len(top_creators)} channels")
 
@@ -1156,32 +1798,33 @@ class YouTubeCollector:
             "total_videos_found": len(enriched_videos),
             "videos_per_creator_max": MAX_VIDEOS_PER_CREATOR,
             "min_relevance_score": MIN_RELEVANCE_SCORE,
+            "rank_by": self.rank_by,
             "top_creators_count": len(top_creators),
             "top_creators": top_creators,
             "source": "api",
+            "phase_timings": self.phase_timings,
+            "quota_units": self.quota.session_units,
         }
 
         return final_data
 
-    def save_data(self, data: Dict, output_file: Path = OUTPUT_FILE):
+    def save_data(self, data: Dict, output_file: Path = OUTPUT_FILE, ndjson: bool = False):
         """
         Save collected data to JSON file
 
         Args:
             data: Dictionary to save
             output_file: Path to output JSON file
+            ndjson: Also write the line-per-video copy next to it (.ndjson)
         """
         if not data:
             print("\n✗ No data to save")
             return
 
-        # Create data directory if it doesn't exist
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write JSON with nice formatting (indent=2)
-        # ensure_ascii=False allows unicode characters (emojis, etc.)
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Indented JSON as always. The line-per-video NDJSON copy is opt-in;
+        # consumers only read it while it matches the JSON (youtube_data_io)
+        ndjson_file = output_file.with_suffix(".ndjson") if ndjson else None
+        save_youtube_data(data, output_file, ndjson_file)
 
         print("\n" + "=" * 70)
         print("✓ DATA COLLECTION COMPLETE!")
@@ -1203,28 +1846,36 @@ class YouTubeCollector:
         # Also save to Supabase for caching
         self.save_to_supabase(data)
 
-    def save_to_supabase(self, data: Dict):
+    def save_to_supabase(self, data: Dict, chunk_size: int = SUPABASE_SYNC_CHUNK):
         """
         Save collected YouTube videos to Supabase for caching
         Reduces API calls on subsequent runs by reading from cache instead of YouTube API
 
+        Rows are upserted in chunks of chunk_size (one HTTP round trip each).
+        A chunk that fails is retried once; if it fails again it is replayed
+        row by row so only the rows that really fail get reported.
+
         Args:
             data: Dictionary with top_creators and their videos
+            chunk_size: Rows per bulk upsert request
         """
         if not self.supabase:
             return
 
         try:
             print("\n📊 Syncing data to Supabase...")
-            videos_inserted = 0
+            start = time.perf_counter()
+            records = {}
 
             for creator in data.get("top_creators", []):
                 channel_name = creator.get("channel_name", "Unknown")
 
                 for video in creator.get("videos", []):
                     try:
-                        # Prepare video record for Supabase
-                        video_record = {
+                        # Prepare video record for Supabase. Keyed by youtube_id
+                        # because a bulk upsert cannot touch the same row twice;
+                        # the last occurrence wins, as with sequential upserts.
+                        records[video.get("video_id")] = {
                             "youtube_id": video.get("video_id"),
                             "channel_name": channel_name,
                             "channel_id": creator.get("channel_id", ""),
@@ -1235,22 +1886,26 @@ class YouTubeCollector:
                             "view_count": video.get("statistics", {}).get("view_count", 0),
                             "like_count": video.get("statistics", {}).get("like_count", 0),
                             "comment_count": video.get("statistics", {}).get("comment_count", 0),
+                            # Only set after a real videos.list fetch (see _plan_delta)
+                            "stats_fetched_at": video.get("stats_fetched_at"),
                             "topic_tags": video.get("tags", [])[:10],
                             # Persist comments for commentary generation (limit 10)
                             "top_comments": video.get("top_comments", [])[:10],
                         }
-
-                        # Insert or update in Supabase (upsert on youtube_id)
-                        self.supabase.table("youtube_videos").upsert(
-                            video_record, on_conflict="youtube_id"
-                        ).execute()
-                        videos_inserted += 1
-
                     except Exception as e:
                         print(f"   ⚠ Failed to insert video {video.get('video_id')}: {e}")
 
+            videos_inserted, round_trips = self._upsert_chunked(
+                "youtube_videos", list(records.values()), "youtube_id", max(1, chunk_size)
+            )
+
+            elapsed = time.perf_counter() - start
             if videos_inserted > 0:
-                print(f"   ✓ Synced {videos_inserted} videos to Supabase")
+                rate = videos_inserted / elapsed if elapsed > 0 else float(videos_inserted)
+                print(
+                    f"   ✓ Synced {videos_inserted} videos to Supabase "
+                    f"({round_trips} round trips, {rate:.0f} rows/s)"
+                )
 
             self._prune_old_cache()
 
@@ -1258,6 +1913,42 @@ class YouTubeCollector:
             print(f"   ⚠ Warning: Could not sync to Supabase: {e}")
             print("   Data saved to JSON only")
 
+    def _upsert_chunked(self, table: str, records: List[Dict], on_conflict: str,
+                        chunk_size: int) -> tuple:
+        """
+        Bulk upsert records in chunks, retrying only the chunks that fail
+
+        Returns:
+            (rows_written, round_trips) tuple
+        """
+        written = 0
+        round_trips = 0
+
+        for i in range(0, len(records), chunk_size):
+            chunk = records[i:i + chunk_size]
+            for attempt in (1, 2):
+                round_trips += 1
+                try:
+                    self.supabase.table(table).upsert(chunk, on_conflict=on_conflict).execute()
+                    written += len(chunk)
+                    break
+                except Exception as e:
+                    if attempt == 1:
+                        print(f"   ⚠ Chunk {i // chunk_size + 1} failed ({e}), retrying...")
+            else:
+                # Still failing: isolate the bad rows so the report names them
+                for record in chunk:
+                    round_trips += 1
+                    try:
+                        self.supabase.table(table).upsert(
+                            record, on_conflict=on_conflict
+                        ).execute()
+                        written += 1
+                    except Exception as e:
+                        print(f"   ⚠ Failed to insert video {record.get(on_conflict)}: {e}")
+
+        return written, round_trips
+
     def _prune_old_cache(self):
         """Delete cache rows outside the retention windows so the tables stay flat"""
         try:
@@ -1291,19 +1982,86 @@ def main():
     This function is only executed when you run this file directly
     (not when you import it as a module)
     """
+    parser = argparse.ArgumentParser(description="Collect carnivore diet content from YouTube")
+    parser.add_argument(
+        "--workers", type=int, default=COLLECTION_WORKERS,
+        help=f"Concurrent search/comment requests (default: {COLLECTION_WORKERS}, 1 = serial)"
+    )
+    parser.add_argument(
+        "--offline", action="store_true",
+        help="Serve every YouTube request from the local response cache; never call the API"
+    )
+    parser.add_argument(
+        "--refresh-cache", action="store_true",
+        help="Ignore cached YouTube responses (still writes fresh ones)"
+    )
+    parser.add_argument(
+        "--record", metavar="DIR",
+        help="Record every YouTube response to DIR as replay fixtures for benchmarks"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Skip already-featured videos and reuse cached stats/comments for known ones"
+    )
+    parser.add_argument(
+        "--stale-hours", type=float, default=STATS_STALENESS_HOURS,
+        help=f"Incremental mode: refresh cached stats older than this (default: {STATS_STALENESS_HOURS})"
+    )
+    parser.add_argument(
+        "--watchlist", action="store_true",
+        help="Also poll the uploads playlist of every creator in creator_history.json"
+    )
+    parser.add_argument(
+        "--rank-by", choices=["velocity", "views"], default=RANK_BY,
+        help=f"Rank by views/hour since publish or by raw views (default: {RANK_BY})"
+    )
+    parser.add_argument(
+        "--ndjson", action="store_true",
+        help="Also write data/youtube_data.ndjson, a line-per-video copy for streaming readers"
+    )
+    parser.add_argument(
+        "--plan", action="store_true",
+        help="Print predicted YouTube quota usage for a run and exit without API calls"
+    )
+    args = parser.parse_args()
+
+    if args.plan:
+        plan_quota_usage(YouTubeQuota(), watchlist=args.watchlist)
+        return
+
     try:
         # Initialize collector
-        collector = YouTubeCollector(YOUTUBE_API_KEY)
+        if args.record:
+            # Same on-disk layout as the response cache, but nothing is read
+            # back, so every response of this run lands in DIR
+            response_cache = ResponseCache(cache_dir=args.record, refresh=True)
+        else:
+            response_cache = ResponseCache(offline=args.offline, refresh=args.refresh_cache)
+        collector = YouTubeCollector(
+            YOUTUBE_API_KEY, workers=args.workers, response_cache=response_cache,
+            stats_staleness_hours=args.stale_hours, rank_by=args.rank_by,
+        )
 
         # Collect all data
-        data = collector.collect_all_data()
+        data = collector.collect_all_data(
+            incremental=args.incremental, watchlist=args.watchlist
+        )
 
         # Save to file
         if data:
-            collector.save_data(data)
+            collector.save_data(data, ndjson=args.ndjson)
         else:
             print("\n✗ No data collected")
 
+        print(f"🗄  {collector.response_cache.summary()}")
+        if collector.quota.session_units:
+            spent = ", ".join(f"{k} {v:,}" for k, v in collector.quota.session_units.items())
+            print(f"🎫 YouTube quota this run: {spent}")
+
+    except QuotaBlocked as e:
+        print(f"\n✗ YouTube quota ledger refused a call: {e}")
+        print("   Check: python3 scripts/youtube_quota.py --status")
+
     except ValueError as e:
         # Handle configuration errors (missing API key, etc.)
         print(f"\n✗ Configuration Error: {e}")
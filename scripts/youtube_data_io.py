@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Read and write youtube_data in JSON or line-delimited (NDJSON) form.
+
+youtube_data.json is one indented document, so every consumer parses the
+whole thing, comments and descriptions included, even to read six titles.
+youtube_data.ndjson holds the same data as a header line (run metadata and
+the creator list without videos) followed by one line per video, so readers
+can stream videos one at a time.
+
+Each video line is written with its heavy fields (HEAVY_FIELDS) last. A
+reader that doesn't need them cuts the line at the first heavy key before
+calling json.loads, so those fields are never parsed at all. Inside a JSON
+string a quote is always escaped, so the marker ,"description": can only
+occur as a real key.
+
+youtube_data.json stays the source of truth. The NDJSON copy is opt-in
+(youtube_collector.py --ndjson) and gitignored. Its header records the
+SHA-256 of the JSON it was written alongside. Given youtube_data.json,
+load_youtube_data() streams the copy only while that hash still matches
+the JSON on disk. Once anything else rewrites or hand-edits the JSON, the
+copy is ignored. Either way it returns the familiar
+{"top_creators": [{"videos": [...]}]} shape, so output doesn't change.
+
+Typical use:
+
+    from youtube_data_io import iter_videos, load_youtube_data
+
+    for creator, video in iter_videos(skip_heavy=True):
+        print(creator["channel_name"], video["title"])
+
+    data = load_youtube_data("data/youtube_data.json")  # drop-in for json.load(...)
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from output_writer import OutputWriter
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+JSON_FILE = BASE_DIR / "data" / "youtube_data.json"
+NDJSON_FILE = BASE_DIR / "data" / "youtube_data.ndjson"
+
+FORMAT_VERSION = 1
+
+# Written last on every video line, in this order, so they can be cut off unparsed
+HEAVY_FIELDS = ("description", "top_comments")
+_HEAVY_MARKERS = tuple(f',"{field}":' for field in HEAVY_FIELDS)
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_ndjson(data: Dict, path: Path = NDJSON_FILE, json_sha256: Optional[str] = None):
+    """
+    Write youtube_data as a header line plus one line per video
+
+    Args:
+        data: youtube_data dictionary (as written to youtube_data.json)
+        path: Output file
+        json_sha256: Hash of the youtube_data.json this copy mirrors; without
+            it the copy is only readable by path, never picked in its place
+    """
+    header = {k: v for k, v in data.items() if k != "top_creators"}
+    header["type"] = "header"
+    header["format"] = FORMAT_VERSION
+    header["json_sha256"] = json_sha256
+    header["keys"] = list(data)
+    header["creators"] = [
+        {k: v for k, v in creator.items() if k != "videos"}
+        for creator in data.get("top_creators", [])
+    ]
+    # Heavy fields move to the end of each line; remember each distinct
+    # original key order so readers hand back byte-identical JSON on re-dump
+    orders = {}
+    for creator in data.get("top_creators", []):
+        for video in creator.get("videos", []):
+            orders.setdefault(tuple(video), len(orders))
+    header["video_key_orders"] = [list(order) for order in orders]
+
+    lines = [_dumps(header)]
+    for i, creator in enumerate(data.get("top_creators", [])):
+        for video in creator.get("videos", []):
+            light = {"type": "video", "_creator": i, "_keys": orders[tuple(video)]}
+            light.update((k, v) for k, v in video.items() if k not in HEAVY_FIELDS)
+            line = _dumps(light)[:-1]
+            for field in HEAVY_FIELDS:
+                if field in video:
+                    line += f',"{field}":' + _dumps(video[field])
+            lines.append(line + "}")
+
+    OutputWriter().write_text(path, "\n".join(lines) + "\n")
+
+
+def save_youtube_data(data: Dict, json_file: Path = JSON_FILE,
+                      ndjson_file: Optional[Path] = None):
+    """
+    Write youtube_data.json exactly as before, plus the NDJSON copy if asked
+
+    Args:
+        data: youtube_data dictionary
+        json_file: Indented JSON output
+        ndjson_file: Line-delimited copy, stamped with the JSON's hash; None to skip it
+    """
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    OutputWriter().write_text(json_file, text)
+    if ndjson_file is not None:
+        write_ndjson(data, ndjson_file, hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+
+def _parse_video(line: str, skip_heavy: bool) -> Dict:
+    if skip_heavy:
+        cut = min((i for i in (line.find(m) for m in _HEAVY_MARKERS) if i != -1), default=-1)
+        if cut != -1:
+            line = line[:cut] + "}"
+    return json.loads(line)
+
+
+def _open_stream(fh, path) -> Dict:
+    header = json.loads(fh.readline() or "{}")
+    if header.get("type") != "header":
+        raise ValueError(f"{path} does not start with a youtube_data header record")
+    return header
+
+
+def _video_lines(fh, header: Dict, skip_heavy: bool) -> Iterator[Tuple[int, Dict]]:
+    orders = header.get("video_key_orders", [])
+    for line in fh:
+        if not line.strip():
+            continue
+        video = _parse_video(line, skip_heavy)
+        video.pop("type", None)
+        index = video.pop("_creator")
+        order = video.pop("_keys", None)
+        if order is not None:
+            video = {k: video[k] for k in orders[order] if k in video}
+        yield index, video
+
+
+def read_header(path: Path = NDJSON_FILE) -> Dict:
+    """Run metadata and creator list (without videos) from an NDJSON file."""
+    with open(path, "r", encoding="utf-8") as fh:
+        return _open_stream(fh, path)
+
+
+def iter_videos(path: Path = NDJSON_FILE, skip_heavy: bool = False,
+                skip: Iterable[str] = ()) -> Iterator[Tuple[Dict, Dict]]:
+    """
+    Stream videos from an NDJSON file without loading the rest
+
+    Args:
+        path: youtube_data.ndjson
+        skip_heavy: Leave out HEAVY_FIELDS (never parsed)
+        skip: Further fields to drop from each video
+
+    Yields:
+        (creator, video) pairs in file order; creator is the header entry
+        (channel_id, channel_name, ... without "videos")
+    """
+    skip = set(skip)
+    with open(path, "r", encoding="utf-8") as fh:
+        header = _open_stream(fh, path)
+        creators = header.get("creators", [])
+        for index, video in _video_lines(fh, header, skip_heavy):
+            for field in skip:
+                video.pop(field, None)
+            yield creators[index], video
+
+
+def matching_ndjson(json_file: Path = JSON_FILE) -> Optional[Path]:
+    """
+    The NDJSON copy next to json_file, if it was written from exactly that content
+
+    Compares hashes, not mtimes: checkouts and hand edits (add_sentiment,
+    the weekly agent) leave mtimes meaningless.
+    """
+    json_file = Path(json_file)
+    copy = json_file.with_suffix(".ndjson")
+    try:
+        recorded = read_header(copy).get("json_sha256")
+        if not recorded:
+            return None
+        with open(json_file, "rb") as fh:
+            actual = hashlib.sha256(fh.read()).hexdigest()
+    except (OSError, ValueError):
+        return None
+    return copy if actual == recorded else None
+
+
+def load_youtube_data(path: Path = JSON_FILE, skip_heavy: bool = False) -> Dict:
+    """
+    Load youtube_data in the classic nested shape from either format
+
+    Args:
+        path: .json or .ndjson file. For .json, a matching NDJSON copy
+            (see matching_ndjson) is streamed instead when one exists
+        skip_heavy: Leave out HEAVY_FIELDS from every video
+
+    Returns:
+        {"top_creators": [{..., "videos": [...]}], ...run metadata}
+    """
+    path = Path(path)
+    if path.suffix != ".ndjson":
+        path = matching_ndjson(path) or path
+
+    if path.suffix != ".ndjson":
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if skip_heavy:
+            for creator in data.get("top_creators", []):
+                for video in creator.get("videos", []):
+                    for field in HEAVY_FIELDS:
+                        video.pop(field, None)
+        return data
+
+    with open(path, "r", encoding="utf-8") as fh:
+        header = _open_stream(fh, path)
+        creators = [dict(c, videos=[]) for c in header.pop("creators", [])]
+        for index, video in _video_lines(fh, header, skip_heavy):
+            creators[index]["videos"].append(video)
+
+    internal = ("type", "format", "video_key_orders", "json_sha256")
+    meta = {k: v for k, v in header.items() if k not in internal}
+    keys = meta.pop("keys", None) or [*meta, "top_creators"]
+    meta["top_creators"] = creators
+    return {k: meta[k] for k in keys if k in meta}
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Offline stand-ins for the googleapiclient YouTube service.
+
+YouTubeCollector takes a client_factory; anything returned by it only needs
+the small slice of the discovery API the collector touches:
+service.<resource>().list(**params) returning a request with .uri and
+.execute(). Two backends implement that here:
+
+- ReplayYouTube serves responses recorded from a real run
+  (python3 scripts/youtube_collector.py --record DIR), which uses the same
+  one-JSON-file-per-request layout as youtube_response_cache.py.
+- SyntheticYouTube generates N creators and M videos with comments on the
+  fly, so collector benchmarks can run at any scale without a key or quota.
+
+Both can inject a fixed per-request latency to mimic network round trips and
+count calls per method. See benchmarks/bench_collector.py.
+
+Typical use:
+
+    from youtube_fake_backend import SyntheticYouTube
+
+    backend = SyntheticYouTube(creators=50, videos=1000, latency=0.05)
+    collector = YouTubeCollector("fake-key", client_factory=lambda: backend)
+"""
+
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+from urllib.parse import urlencode
+
+# Parameters that change between a recording and its replay (the search
+# window is relative to "now"), so replay matching ignores them.
+VOLATILE_PARAMS = {"publishedAfter"}
+
+
+class FakeRequest:
+    """Mimics googleapiclient.http.HttpRequest: a uri plus execute()."""
+
+    def __init__(self, backend, method: str, params: Dict):
+        self.backend = backend
+        self.method = method
+        self.params = {k: str(v) for k, v in params.items()}
+        self.uri = f"https://fake.youtube/{method}?" + urlencode(sorted(self.params.items()))
+
+    def execute(self, *args, **kwargs):
+        return self.backend._dispatch(self.method, self.params)
+
+
+class FakeResource:
+    def __init__(self, backend, method: str):
+        self.backend = backend
+        self.method = method
+
+    def list(self, **params):
+        return FakeRequest(self.backend, self.method, params)
+
+
+class FakeYouTube:
+    """Base fake service: routes resource().list() calls to a responder."""
+
+    def __init__(self, responder: Callable[[str, Dict], Dict], latency: float = 0.0):
+        self.responder = responder
+        self.latency = latency
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def search(self):
+        return FakeResource(self, "search.list")
+
+    def videos(self):
+        return FakeResource(self, "videos.list")
+
+    def commentThreads(self):
+        return FakeResource(self, "commentThreads.list")
+
+    def channels(self):
+        return FakeResource(self, "channels.list")
+
+    def playlistItems(self):
+        return FakeResource(self, "playlistItems.list")
+
+    def _dispatch(self, method: str, params: Dict) -> Dict:
+        with self._lock:
+            self.calls[method] += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self.responder(method, params)
+
+
+def replay_key(method: str, params: Dict) -> str:
+    stable = {k: v for k, v in sorted(params.items()) if k not in VOLATILE_PARAMS}
+    return json.dumps([method, stable], separators=(",", ":"))
+
+
+class ReplayYouTube(FakeYouTube):
+    """Serves responses recorded under fixture_dir/<method>/<key>.json."""
+
+    def __init__(self, fixture_dir, latency: float = 0.0):
+        self.fixture_dir = Path(fixture_dir)
+        self.fixtures: Dict[str, Dict] = {}
+        self.misses = Counter()
+        for path in sorted(self.fixture_dir.glob("*/*.json")):
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            self.fixtures[replay_key(entry["method"], entry["params"])] = entry["response"]
+        super().__init__(self._respond, latency)
+
+    def _respond(self, method: str, params: Dict) -> Dict:
+        response = self.fixtures.get(replay_key(method, params))
+        if response is None:
+            with self._lock:
+                self.misses[method] += 1
+            return {"items": []}
+        return response
+
+
+class SyntheticYouTube(FakeYouTube):
+    """
+    Deterministic synthetic YouTube with `creators` channels and `videos` uploads
+
+    Titles mostly pass the carnivore relevance filter; a few are vegan,
+    low-carb baking, non-English or Shorts so every filter branch does work.
+    Search queries partition the corpus: each distinct query string gets its
+    own slice, ordered by view count, so more queries reach more videos.
+    Channels resolve to "UU..." uploads playlists listing their videos newest first.
+    """
+
+    TOPICS = [
+        "Carnivore Diet Results After 90 Days", "Why I Eat Only Meat", "Ribeye vs Ground Beef",
+        "Beef Liver Benefits Explained", "Nose to Tail on a Budget", "Animal-Based Breakfast",
+        "Zero Carb Meal Prep", "Bone Broth Every Day", "Lion Diet Reset Week",
+        "Vegan Doctor Reacts", "Keto Bread Recipe With Almond Flour", "Dieta carnívora resultados",
+    ]
+
+    def __init__(self, creators: int = 20, videos: int = 200, comments_per_video: int = 20,
+                 latency: float = 0.0, seed: int = 7):
+        rng = random.Random(seed)
+        published = (datetime.utcnow() - timedelta(days=2)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self.comments_per_video = comments_per_video
+        self.corpus: List[Dict] = []
+        for i in range(videos):
+            channel = i % max(1, creators)
+            topic = self.TOPICS[rng.randrange(len(self.TOPICS))]
+            self.corpus.append({
+                "id": f"vid{i:06d}",
+                "channel_id": f"UCsynthetic{channel:05d}",
+                "channel_title": f"Synthetic Creator {channel}",
+                "title": f"{topic} #{i}",
+                "description": "Steak, eggs and butter. " * rng.randint(5, 40),
+                "published_at": published,
+                "views": rng.randint(1, 500_000),
+                "duration": "PT45S" if i % 17 == 0 else f"PT{rng.randint(5, 90)}M",
+            })
+        self.by_id = {v["id"]: v for v in self.corpus}
+        self._query_slices: Dict[str, int] = {}
+        super().__init__(self._respond, latency)
+
+    def _respond(self, method: str, params: Dict) -> Dict:
+        handler = {
+            "search.list": self._search,
+            "videos.list": self._videos,
+            "commentThreads.list": self._comments,
+            "channels.list": self._channels,
+            "playlistItems.list": self._playlist_items,
+        }.get(method)
+        return handler(params) if handler else {"items": []}
+
+    def _snippet(self, v: Dict) -> Dict:
+        return {
+            "channelId": v["channel_id"],
+            "channelTitle": v["channel_title"],
+            "title": v["title"],
+            "description": v["description"],
+            "publishedAt": v["published_at"],
+            "thumbnails": {"medium": {"url": f"https://i.ytimg.com/vi/{v['id']}/mqdefault.jpg"}},
+        }
+
+    def _search(self, params: Dict) -> Dict:
+        limit = int(params.get("maxResults", 50))
+        pool = self.corpus
+        if "channelId" in params:
+            pool = [v for v in pool if v["channel_id"] == params["channelId"]]
+        else:
+            with self._lock:
+                slot = self._query_slices.setdefault(params.get("q", ""), len(self._query_slices))
+            pool = pool[slot * limit:(slot + 1) * limit]
+        pool = sorted(pool, key=lambda v: v["views"], reverse=True)[:limit]
+        return {
+            "items": [{"id": {"videoId": v["id"]}, "snippet": self._snippet(v)} for v in pool]
+        }
+
+    def _videos(self, params: Dict) -> Dict:
+        items = []
+        for vid in params.get("id", "").split(","):
+            v = self.by_id.get(vid)
+            if not v:
+                continue
+            items.append({
+                "id": vid,
+                "snippet": self._snippet(v),
+                "statistics": {
+                    "viewCount": str(v["views"]),
+                    "likeCount": str(v["views"] // 40),
+                    "commentCount": str(v["views"] // 200),
+                },
+                "contentDetails": {"duration": v["duration"]},
+            })
+        return {"items": items}
+
+    def _channels(self, params: Dict) -> Dict:
+        channels = {v["channel_id"] for v in self.corpus}
+        return {
+            "items": [
+                # Real uploads playlists are the channel ID with UC -> UU
+                {"id": cid, "contentDetails": {"relatedPlaylists": {"uploads": "UU" + cid[2:]}}}
+                for cid in params.get("id", "").split(",") if cid in channels
+            ]
+        }
+
+    def _playlist_items(self, params: Dict) -> Dict:
+        channel_id = "UC" + params.get("playlistId", "")[2:]
+        limit = int(params.get("maxResults", 5))
+        uploads = [v for v in reversed(self.corpus) if v["channel_id"] == channel_id][:limit]
+        return {
+            "items": [
+                {"contentDetails": {"videoId": v["id"], "videoPublishedAt": v["published_at"]}}
+                for v in uploads
+            ]
+        }
+
+    def _comments(self, params: Dict) -> Dict:
+        vid = params.get("videoId", "")
+        count = min(int(params.get("maxResults", 20)), self.comments_per_video)
+        return {
+            "items": [
+                {
+                    "snippet": {
+                        "topLevelComment": {
+                            "snippet": {
+                                "textDisplay": f"Comment {n} on {vid}: this changed my life.",
+                                "authorDisplayName": f"viewer{n}",
+                                "likeCount": (n * 37) % 101,
+                                "publishedAt": self.by_id.get(vid, {}).get("published_at", ""),
+                            }
+                        }
+                    }
+                }
+                for n in range(count)
+            ]
+        }
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+YouTube Data API quota ledger for Carnivore Weekly.
+
+Every request we make against the YouTube Data API v3 costs quota units out of
+one daily project allowance (10,000 by default, reset at midnight Pacific).
+search().list is the expensive one at 100 units; videos().list,
+commentThreads().list, channels().list and playlistItems().list cost 1 unit
+each. Nothing used to record this, so query fan-out was tuned blind.
+
+Design rule: FAIL CLOSED, same as image_budget.py. If the config cannot be
+read, the ledger cannot be read or written, or a method's unit cost is
+unknown, the call is refused. A skipped collection run is cheap; burning the
+whole day's quota in a retry loop is not.
+
+Config: config/youtube-quota.json
+Ledger: data/youtube-quota-ledger.jsonl (one JSON object per call, append only)
+
+Typical use:
+
+    from youtube_quota import YouTubeQuota, QuotaBlocked
+
+    quota = YouTubeQuota()
+    request = youtube.search().list(part="snippet", q="carnivore diet")
+    response = quota.execute(request, "search.list", script="youtube_collector")
+
+CLI:
+    python3 scripts/youtube_quota.py --status
+    python3 scripts/youtube_quota.py --report            # yesterday, one line
+    python3 scripts/youtube_quota.py --report --date 2026-10-09
+"""
+
+import json
+import os
+import sys
+import threading
+from collections import Counter
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from image_budget import ZoneInfo, today_str
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CONFIG_FILE = BASE_DIR / "config" / "youtube-quota.json"
+DEFAULT_LEDGER_FILE = BASE_DIR / "data" / "youtube-quota-ledger.jsonl"
+
+# YouTube quota resets at midnight Pacific Time.
+DEFAULT_TZ = "America/Los_Angeles"
+
+
+class QuotaBlocked(Exception):
+    """Raised when the ledger cannot vouch for a call. Always fatal for that call."""
+
+
+class YouTubeQuota:
+    """Reads the cap, reads the ledger, answers can-I-call, appends what was spent."""
+
+    def __init__(self, config_file=None, ledger_file=None, dry_run=False):
+        self.config_file = Path(config_file) if config_file else DEFAULT_CONFIG_FILE
+        self.ledger_file = Path(ledger_file) if ledger_file else DEFAULT_LEDGER_FILE
+        self.dry_run = dry_run
+
+        self.blocked_reason = None
+        self.config = {}
+        self.enabled = False
+        self.cap = 0
+        self.tz_name = DEFAULT_TZ
+        self.unit_costs = {}
+        self.today = today_str(DEFAULT_TZ)
+        self._used_today = 0
+        self._session = Counter()
+        # Collector workers share one ledger; check + append must not interleave.
+        self._lock = threading.Lock()
+
+        self._load()
+
+    # ------------------------------------------------------------------ load
+
+    def _load(self):
+        try:
+            raw = self.config_file.read_text()
+        except Exception as e:
+            self.blocked_reason = f"cannot read {self.config_file}: {e}"
+            return
+
+        try:
+            cfg = json.loads(raw)
+        except Exception as e:
+            self.blocked_reason = f"{self.config_file} is not valid JSON: {e}"
+            return
+
+        if not isinstance(cfg, dict):
+            self.blocked_reason = f"{self.config_file} must contain a JSON object"
+            return
+
+        self.config = cfg
+        self.tz_name = cfg.get("timezone") or DEFAULT_TZ
+        self.today = today_str(self.tz_name)
+
+        self.enabled = cfg.get("enabled")
+        if self.enabled is not True:
+            self.blocked_reason = "YouTube quota ledger is disabled (config enabled != true)"
+            return
+
+        cap = cfg.get("daily_cap_units")
+        if not isinstance(cap, int) or isinstance(cap, bool) or cap < 0:
+            self.blocked_reason = f"daily_cap_units must be a non-negative integer, got {cap!r}"
+            return
+        self.cap = cap
+
+        costs = cfg.get("unit_costs")
+        if not isinstance(costs, dict) or not costs:
+            self.blocked_reason = "unit_costs must be a non-empty object"
+            return
+        clean = {}
+        for key, value in costs.items():
+            if key.startswith("_"):
+                continue
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                self.blocked_reason = f"unit cost for {key!r} is not a non-negative integer"
+                return
+            clean[key] = value
+        self.unit_costs = clean
+
+        try:
+            self._used_today = self._read_usage(self.today)
+        except QuotaBlocked as e:
+            self.blocked_reason = str(e)
+            return
+
+        if not self._ledger_writable():
+            self.blocked_reason = f"ledger not writable: {self.ledger_file}"
+            return
+
+    def _ledger_writable(self):
+        try:
+            self.ledger_file.parent.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            return False
+        if self.ledger_file.exists():
+            return os.access(self.ledger_file, os.W_OK)
+        return os.access(self.ledger_file.parent, os.W_OK)
+
+    def _read_usage(self, day):
+        """Sum of units for one day. A corrupt ledger blocks; it never guesses."""
+        if not self.ledger_file.exists():
+            return 0
+        try:
+            lines = self.ledger_file.read_text().splitlines()
+        except Exception as e:
+            raise QuotaBlocked(f"cannot read ledger {self.ledger_file}: {e}")
+
+        total = 0
+        for n, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except Exception as e:
+                raise QuotaBlocked(f"ledger line {n} is corrupt ({e}); refusing to call")
+            if entry.get("date") != day:
+                continue
+            units = entry.get("units")
+            if not isinstance(units, int) or isinstance(units, bool):
+                raise QuotaBlocked(f"ledger line {n} has a non-integer units; refusing to call")
+            total += units
+        return total
+
+    # ---------------------------------------------------------------- queries
+
+    @property
+    def available(self):
+        return self.blocked_reason is None
+
+    @property
+    def used_today(self):
+        return self._used_today
+
+    @property
+    def remaining(self):
+        if not self.available:
+            return 0
+        return max(0, self.cap - self._used_today)
+
+    @property
+    def session_units(self):
+        """Units charged by this process, per method. Handy for run summaries."""
+        return dict(self._session)
+
+    def unit_cost(self, method):
+        return self.unit_costs.get(method)
+
+    def check(self, method, quantity=1):
+        """(ok, reason). Never returns ok=True when anything is uncertain."""
+        if not self.available:
+            return False, self.blocked_reason
+
+        cost = self.unit_cost(method)
+        if cost is None:
+            return False, (
+                f"no unit cost configured for method {method!r}; "
+                f"add it to {self.config_file.name} before calling it"
+            )
+
+        if self._used_today + cost * quantity > self.cap:
+            return False, (
+                f"daily cap reached: {self._used_today} of {self.cap} units used, "
+                f"next call needs {cost * quantity}"
+            )
+        return True, None
+
+    # ----------------------------------------------------------------- record
+
+    def spend(self, method, script, quantity=1, note=""):
+        """Check and append one call row atomically. Raises QuotaBlocked if refused."""
+        with self._lock:
+            ok, why = self.check(method, quantity)
+            if not ok:
+                raise QuotaBlocked(why)
+
+            units = self.unit_cost(method) * quantity
+            entry = {
+                "date": self.today,
+                "ts": datetime.now(ZoneInfo(self.tz_name)).isoformat(timespec="seconds")
+                if ZoneInfo is not None
+                else datetime.now().isoformat(timespec="seconds"),
+                "script": script,
+                "method": method,
+                "quantity": quantity,
+                "units": units,
+            }
+            if note:
+                entry["note"] = note
+
+            if self.dry_run:
+                entry["dry_run"] = True
+            else:
+                try:
+                    with open(self.ledger_file, "a") as fh:
+                        fh.write(json.dumps(entry) + "\n")
+                        fh.flush()
+                        os.fsync(fh.fileno())
+                except Exception as e:
+                    raise QuotaBlocked(f"cannot append to ledger {self.ledger_file}: {e}")
+
+            self._used_today += units
+            self._session[method] += units
+            return entry
+
+    def execute(self, request, method, script, note=""):
+        """Meter one googleapiclient request, then run it.
+
+        Quota is charged before the call: YouTube bills failed requests too.
+        """
+        self.spend(method, script=script, note=note)
+        return request.execute()
+
+    # ---------------------------------------------------------------- reports
+
+    def day_entries(self, day):
+        if not self.ledger_file.exists():
+            return []
+        out = []
+        for line in self.ledger_file.read_text().splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except Exception:
+                continue
+            if entry.get("date") == day:
+                out.append(entry)
+        return out
+
+    def day_summary(self, day):
+        entries = self.day_entries(day)
+        by_method = Counter()
+        by_script = Counter()
+        for e in entries:
+            units = int(e.get("units", 0) or 0)
+            by_method[e.get("method", "?")] += units
+            by_script[e.get("script", "?")] += units
+        return {
+            "date": day,
+            "total_units": sum(by_method.values()),
+            "calls": len(entries),
+            "by_method": dict(by_method),
+            "by_script": dict(by_script),
+            "cap_units": self.cap,
+            "entries": entries,
+        }
+
+    def report_line(self, day):
+        """One phone-readable line for the CEO brief."""
+        s = self.day_summary(day)
+        if not s["entries"]:
+            return f"YouTube quota {day}: 0 of {self.cap:,} units (no API calls)."
+        methods = ", ".join(
+            f"{k} {v:,}" for k, v in sorted(s["by_method"].items(), key=lambda kv: -kv[1])
+        )
+        pct = (s["total_units"] / self.cap * 100) if self.cap else 0
+        return (
+            f"YouTube quota {day}: {s['total_units']:,} of {self.cap:,} units "
+            f"({pct:.0f}%), {s['calls']} calls ({methods})."
+        )
+
+
+def yesterday_str(tz_name=DEFAULT_TZ):
+    return (date.fromisoformat(today_str(tz_name)) - timedelta(days=1)).isoformat()
+
+
+def main():
+    args = sys.argv[1:]
+    day = None
+    if "--date" in args:
+        day = args[args.index("--date") + 1]
+
+    quota = YouTubeQuota()
+
+    if "--report" in args:
+        target = day or yesterday_str(quota.tz_name if quota.available else DEFAULT_TZ)
+        if not quota.available:
+            print(f"YouTube quota {target}: UNAVAILABLE ({quota.blocked_reason}).")
+            return 0
+        print(quota.report_line(target))
+        return 0
+
+    target = day or quota.today
+    if not quota.available:
+        print(f"YouTube quota: BLOCKED ({quota.blocked_reason})")
+        return 1
+    s = quota.day_summary(target)
+    print(f"YouTube quota for {target}")
+    print(f"  cap:       {quota.cap:,} units/day")
+    print(f"  used:      {s['total_units']:,} units in {s['calls']} calls")
+    print(f"  remaining: {quota.remaining:,} units")
+    for method, units in sorted(s["by_method"].items(), key=lambda kv: -kv[1]):
+        print(f"    {method:<22} {units:>6,}")
+    print(f"  ledger:    {quota.ledger_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+On-disk response cache for YouTube Data API requests.
+
+The Supabase cache in youtube_collector.py is all-or-nothing: it either
+returns the whole 14-day dataset or nothing. This sits one level lower, around
+individual googleapiclient requests, so re-running the collector after a crash
+or a filter tweak replays what it already fetched instead of spending quota
+and latency again.
+
+Entries are content-addressed: the key is a SHA-256 of the API method plus
+its canonical query parameters (the API key is stripped), stored as one JSON
+file per response under .cache/youtube/<method>/. Each method has its own TTL
+because search results drift over hours while view counts move by the minute.
+
+Offline mode ignores TTLs and never touches the network; a miss is reported
+and served as an empty result so the run completes from whatever is cached.
+
+Typical use:
+
+    from youtube_response_cache import ResponseCache
+
+    cache = ResponseCache()
+    response = cache.get("videos.list", request)
+    if response is None:
+        response = request.execute()
+        cache.put("videos.list", request, response)
+"""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlparse
+
+from output_writer import OutputWriter
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = BASE_DIR / ".cache" / "youtube"
+
+# Seconds each method's response stays fresh. Unlisted methods are not cached.
+DEFAULT_TTLS = {
+    "search.list": 6 * 3600,
+    "commentThreads.list": 6 * 3600,
+    "videos.list": 15 * 60,
+    "playlistItems.list": 15 * 60,
+    "channels.list": 7 * 86400,
+}
+
+# Query parameters that never change the response
+IGNORED_PARAMS = {"key", "alt", "prettyPrint"}
+
+
+def request_params(request) -> Dict[str, str]:
+    """Canonical query parameters of a googleapiclient HttpRequest."""
+    query = urlparse(getattr(request, "uri", "") or "").query
+    return {k: v for k, v in sorted(parse_qsl(query)) if k not in IGNORED_PARAMS}
+
+
+def request_key(method: str, request) -> str:
+    """Content address for one request: method plus canonical parameters."""
+    payload = json.dumps([method, request_params(request)], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Per-method TTL cache of raw API responses, one JSON file per request."""
+
+    def __init__(self, cache_dir=None, ttls: Optional[Dict[str, int]] = None,
+                 offline: bool = False, refresh: bool = False):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.offline = offline
+        # refresh: skip reads but still write, to re-prime a stale cache
+        self.refresh = refresh
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "writes": 0}
+        self._lock = threading.Lock()
+
+    def _path(self, method: str, key: str) -> Path:
+        return self.cache_dir / method / f"{key}.json"
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def get(self, method: str, request) -> Optional[Dict]:
+        """Cached response for this request, or None on a miss or expiry."""
+        if method not in self.ttls or (self.refresh and not self.offline):
+            return None
+
+        path = self._path(method, request_key(method, request))
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+
+        age = time.time() - entry.get("fetched_at", 0)
+        if not self.offline and age > self.ttls[method]:
+            self._count("expired")
+            return None
+
+        self._count("hits")
+        return entry.get("response")
+
+    def put(self, method: str, request, response: Dict):
+        """Store a response. Written atomically so readers never see half a file."""
+        if method not in self.ttls or self.offline:
+            return
+
+        path = self._path(method, request_key(method, request))
+        entry = {
+            "method": method,
+            "params": request_params(request),
+            "fetched_at": time.time(),
+            "response": response,
+        }
+        try:
+            OutputWriter().write_json(path, entry, ensure_ascii=False)
+            self._count("writes")
+        except (OSError, TypeError, ValueError) as e:
+            # A cache that cannot be written just means the next run pays again
+            print(f"   ⚠ Could not write response cache: {e}")
+
+    def summary(self) -> str:
+        s = self.stats
+        mode = " (offline)" if self.offline else ""
+        return (
+            f"Response cache{mode}: {s['hits']} hits, {s['misses']} misses, "
+            f"{s['expired']} expired, {s['writes']} written"
+        )
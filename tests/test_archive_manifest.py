@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for the archived-weeks manifest behind the archive listing.
+
+No network. Week files are written to a temp directory.
+
+Run: python3 tests/test_archive_manifest.py
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from archive_manifest import ArchiveManifest, summarize_week  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def week(summary, creators=0, videos=0):
+    return {"analysis": {"weekly_summary": summary, "top_creators_count": creators,
+                         "total_videos_found": videos}}
+
+
+def write_week(archive_dir, date, data):
+    (archive_dir / f"{date}.json").write_text(json.dumps(data))
+
+
+def test_summary_rows():
+    row = summarize_week("2026-01-05", week("x" * 400, creators=12, videos=40))
+    check("counts kept", row["total_creators"] == 12 and row["total_videos"] == 40)
+    check("preview clipped to 150 chars", len(row["summary_preview"]) == 150)
+    flat = summarize_week("2026-01-12", {"key_insights": ["a", "b"]})
+    check("flat file, fallback counts", flat["total_videos"] == 2 and flat["total_creators"] == 1,
+          str(flat))
+    check("empty summary placeholder", flat["summary_preview"] == "Week of 2026-01-12")
+
+
+def test_refresh_reads_only_changed_weeks():
+    tmp = Path(tempfile.mkdtemp(prefix="archmf-"))
+    try:
+        for i in range(1, 26):
+            write_week(tmp, f"2026-01-{i:02d}", week(f"Week {i}", creators=i, videos=i))
+        manifest = ArchiveManifest(tmp)
+        changed = manifest.refresh()
+        check("first refresh reports every week", len(changed) == 25, str(len(changed)))
+        check("manifest written", (tmp / "manifest.json").exists())
+        check("manifest is not mistaken for a week", "manifest" not in manifest.weeks)
+
+        reopened = ArchiveManifest(tmp)
+        check("unchanged files report nothing", reopened.refresh() == [])
+
+        write_week(tmp, "2026-01-07", week("Week 7, corrected", creators=7, videos=7))
+        st = (tmp / "2026-01-07.json").stat()
+        os.utime(tmp / "2026-01-07.json", ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        os.utime(tmp / "2026-01-08.json")  # touched, same bytes
+        check("only the edited week changed", reopened.refresh() == ["2026-01-07"])
+        check("row updated", reopened.weeks["2026-01-07"]["summary_preview"] == "Week 7, corrected")
+
+        (tmp / "2026-01-01.json").unlink()
+        check("removed week reported", reopened.refresh() == ["2026-01-01"])
+
+        pages = reopened.pages(10)
+        check("paginates full history", [len(p) for p in pages] == [10, 10, 4],
+              str([len(p) for p in pages]))
+        check("newest first", pages[0][0]["date"] == "2026-01-25")
+        check("empty archive still has a page", ArchiveManifest(tmp / "none").pages(10) == [[]])
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_archive_week_and_bad_files():
+    tmp = Path(tempfile.mkdtemp(prefix="archmf-"))
+    try:
+        manifest = ArchiveManifest(tmp)
+        path = manifest.archive_week("2026-02-02", week("Fresh week", creators=3, videos=9))
+        check("week file written", path.name == "2026-02-02.json" and path.exists())
+        check("row added without a refresh", manifest.weeks["2026-02-02"]["total_videos"] == 9)
+        check("refresh sees nothing new", ArchiveManifest(tmp).refresh() == [])
+
+        bad = False
+        try:
+            manifest.archive_week("Feb 2", {})
+        except ValueError:
+            bad = True
+        check("non-ISO date rejected", bad)
+
+        (tmp / "2026-02-09.json").write_text("{not json")
+        manifest.refresh()
+        check("unreadable week skipped and reported",
+              "2026-02-09" not in manifest.weeks and "2026-02-09.json" in manifest.errors)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} archive manifest test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental (per-post fingerprint) and parallel (--jobs) blog builds.
+
+No network. Fingerprinted templates and keyword files, and rendered pages,
+live in temp directories.
+
+Run: python3 tests/test_blog_incremental.py
+"""
+
+import shutil
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from jinja2 import Environment, FileSystemLoader  # noqa: E402
+
+import generate_blog_pages  # noqa: E402
+from build_manifest import BuildManifest, template_chain  # noqa: E402
+from generate_blog_pages import post_fingerprint  # noqa: E402
+from output_writer import OutputWriter  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+POST = {"slug": "2026-01-05-steak", "title": "Steak", "content": "## Hi", "tags": ["beef"]}
+RELATED = [
+    {"slug": "2026-01-01-eggs", "title": "Eggs", "excerpt": "Yolks.", "content": "long body"},
+]
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def test_fingerprint_inputs():
+    tmp = Path(tempfile.mkdtemp(prefix="blogfp-"))
+    try:
+        (tmp / "base.html").write_text("<main>{% block body %}{% endblock %}</main>")
+        (tmp / "post.html").write_text('{% extends "base.html" %}{% block body %}x{% endblock %}')
+        (tmp / "wiki-keywords.json").write_text('{"steak": "/wiki/#steak"}')
+        env = Environment(loader=FileSystemLoader(str(tmp)))
+        build = BuildManifest(tmp / "manifest.json", root=tmp)
+
+        def fingerprint(post=POST, related=RELATED, dims=(1200, 630)):
+            shared = template_chain(env, "post.html") + [tmp / "wiki-keywords.json"]
+            return post_fingerprint(build, shared, post, related, dims)
+
+        base = fingerprint()
+        check("stable across calls", fingerprint() == base)
+        check("post field edit changes it", fingerprint(post={**POST, "title": "Steak!"}) != base)
+        check("related post retitled changes it",
+              fingerprint(related=[{**RELATED[0], "title": "Eggs!"}]) != base)
+        check("related post body edit does not",
+              fingerprint(related=[{**RELATED[0], "content": "edited"}]) == base)
+        check("different related set changes it", fingerprint(related=[]) != base)
+        check("hero image size changes it", fingerprint(dims=(800, 600)) != base)
+
+        (tmp / "base.html").write_text("<main class='v2'>{% block body %}{% endblock %}</main>")
+        after_template = fingerprint()
+        check("parent template edit changes it", after_template != base)
+
+        (tmp / "wiki-keywords.json").write_text('{"steak": "/wiki/#ribeye"}')
+        check("wiki keyword edit changes it", fingerprint() != after_template)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def make_posts():
+    body = "\n\n".join(
+        f"## Part {i}\n\nRibeye and **salt** every day keeps the cravings away for good. " * 6
+        for i in range(4)
+    )
+    meta = ("A practical look at eating ribeye daily on carnivore: how much, how often, "
+            "and what changed in energy, digestion and cravings after a month.")
+    posts = [
+        {"slug": f"2026-01-0{i}-steak-{i}", "title": f"Steak {i}", "date": f"2026-01-0{i}",
+         "author": "marcus", "published": True, "content": body, "tags": ["beef", f"t{i % 2}"],
+         "excerpt": f"Excerpt {i}", "seo": {"meta_description": meta}}
+        for i in range(1, 6)
+    ]
+    posts.append({"slug": "2026-01-07-stub", "title": "Stub", "date": "2026-01-07",
+                  "published": True, "content": "Too short.", "seo": {}})
+    posts.append({"slug": "2026-01-08-empty", "title": "Empty", "published": True,
+                  "content": "  "})
+    return posts
+
+
+def build_into(out_dir, jobs):
+    """generate_blog_posts() into out_dir; returns (counts, console output)."""
+    saved = generate_blog_pages.BLOG_DIR, generate_blog_pages.WRITER
+    generate_blog_pages.BLOG_DIR = out_dir
+    generate_blog_pages.WRITER = OutputWriter()
+    try:
+        build = BuildManifest(out_dir / "manifest.json", root=out_dir, force=True)
+        console = StringIO()
+        with redirect_stdout(console):
+            counts = generate_blog_pages.generate_blog_posts(
+                generate_blog_pages.setup_jinja(), make_posts(), build=build, jobs=jobs
+            )
+        return counts, console.getvalue()
+    finally:
+        generate_blog_pages.BLOG_DIR, generate_blog_pages.WRITER = saved
+
+
+def test_parallel_render_matches_serial():
+    tmp = Path(tempfile.mkdtemp(prefix="blogjobs-"))
+    try:
+        (tmp / "serial").mkdir()
+        (tmp / "parallel").mkdir()
+        serial_counts, serial_out = build_into(tmp / "serial", jobs=1)
+        parallel_counts, parallel_out = build_into(tmp / "parallel", jobs=3)
+
+        pages = sorted(p.name for p in (tmp / "serial").glob("*.html"))
+        check("valid posts written, stub blocked, empty skipped",
+              len(pages) == 5 and "2026-01-07-stub.html" not in pages, str(pages))
+        check("same blocked/fixed counts", serial_counts == parallel_counts,
+              f"{serial_counts} vs {parallel_counts}")
+        check("one post blocked", serial_counts[0] == 1, str(serial_counts))
+        check("same console output, same order", serial_out == parallel_out)
+        check("identical pages", all(
+            (tmp / "serial" / name).read_bytes() == (tmp / "parallel" / name).read_bytes()
+            for name in pages
+        ) and pages == sorted(p.name for p in (tmp / "parallel").glob("*.html")))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} incremental blog build test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental build manifest used by generate.py.
+
+No network. Templates, inputs, outputs and the manifest all live in a temp
+directory.
+
+Run: python3 tests/test_build_manifest.py
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from jinja2 import Environment, FileSystemLoader  # noqa: E402
+
+from build_manifest import BuildManifest, template_chain  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def build_once(tmp, force=False):
+    """One generator run: render out.html unless the manifest says it's current."""
+    build = BuildManifest(tmp / "manifest.json", root=tmp, force=force)
+    output = tmp / "out.html"
+    digest = build.digest([tmp / "data.json", tmp / "page.html"], {"site": "cw"})
+    if build.is_current([output], digest):
+        build.skip([output])
+    else:
+        output.write_text("rendered " + (tmp / "data.json").read_text())
+        build.record([output], digest, 2.5)
+    build.save()
+    return build
+
+
+def test_skips_until_an_input_changes():
+    tmp = Path(tempfile.mkdtemp(prefix="buildmf-"))
+    try:
+        (tmp / "data.json").write_text(json.dumps({"week": 1}))
+        (tmp / "page.html").write_text("<p>{{ week }}</p>")
+
+        first = build_once(tmp)
+        check("first run renders", first.rendered == ["out.html"], str(first.rendered))
+        second = build_once(tmp)
+        check("unchanged inputs skip", second.skipped == ["out.html"] and not second.rendered)
+        check("time saved from last render", second.seconds_saved == 2.5)
+        check("summary reports both", "0 rendered, 1 skipped (~2.5s saved)" in second.summary(),
+              second.summary())
+
+        (tmp / "data.json").write_text(json.dumps({"week": 2}))
+        check("data change re-renders", build_once(tmp).rendered == ["out.html"])
+        (tmp / "page.html").write_text("<h1>{{ week }}</h1>")
+        check("template change re-renders", build_once(tmp).rendered == ["out.html"])
+
+        (tmp / "out.html").write_text("hand edited")
+        check("edited output re-rendered", build_once(tmp).rendered == ["out.html"])
+        (tmp / "out.html").unlink()
+        check("deleted output re-rendered", build_once(tmp).rendered == ["out.html"])
+
+        check("--force renders", build_once(tmp, force=True).rendered == ["out.html"])
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_unhashable_inputs_never_skip():
+    tmp = Path(tempfile.mkdtemp(prefix="buildmf-"))
+    try:
+        build = BuildManifest(tmp / "manifest.json", root=tmp)
+        (tmp / "live.html").write_text("from the database")
+        build.record([tmp / "live.html"], None, 1.0)
+        check("None digest is never current", not build.is_current([tmp / "live.html"], None))
+        check("and is not recorded", "live.html" not in build.outputs)
+        check("missing input file still hashes",
+              build.digest([tmp / "nope.json"]) != build.digest([]))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_template_chain_follows_references():
+    tmp = Path(tempfile.mkdtemp(prefix="buildmf-"))
+    try:
+        (tmp / "base.html").write_text("{% block body %}{% endblock %}")
+        (tmp / "nav.html").write_text("<nav></nav>")
+        (tmp / "page.html").write_text(
+            '{% extends "base.html" %}{% block body %}{% include "nav.html" %}{% endblock %}'
+        )
+        (tmp / "unused.html").write_text("")
+        env = Environment(loader=FileSystemLoader(tmp))
+        names = sorted(p.name for p in template_chain(env, "page.html"))
+        check("extends and include followed", names == ["base.html", "nav.html", "page.html"],
+              str(names))
+
+        (tmp / "dynamic.html").write_text("{% include partial %}")
+        names = {p.name for p in template_chain(env, "dynamic.html")}
+        check("dynamic include falls back to every template", "unused.html" in names, str(names))
+
+        real = Environment(loader=FileSystemLoader(PROJECT_ROOT / "templates"))
+        check("real homepage template resolves",
+              template_chain(real, "index_template.html")[0].name == "index_template.html")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} build manifest test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent channel avatar cache behind the channels page.
+
+No network. The cache file and mirrored avatars live in a temp directory;
+downloads go through a fake.
+
+Run: python3 tests/test_channel_thumbnails.py
+"""
+
+import shutil
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from channel_thumbnails import ChannelThumbnailCache  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+PLACEHOLDER = "https://via.placeholder.com/150x150/8b4513/f4e4d4?text=Channel"
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def test_ttl_and_seeding():
+    tmp = Path(tempfile.mkdtemp(prefix="thumbs-"))
+    try:
+        cache = ChannelThumbnailCache(tmp / "t.json", ttl_days=30, today=date(2026, 10, 1))
+        cache.seed([
+            {"channel_id": "UCold", "thumbnail_url": "https://yt3.ggpht.com/old",
+             "last_seen": "2026-08-01"},
+            {"channel_id": "UCnew", "thumbnail_url": "https://yt3.ggpht.com/new",
+             "last_seen": "2026-09-20"},
+            {"channel_id": "UCph", "thumbnail_url": PLACEHOLDER, "last_seen": "2026-09-20"},
+        ])
+        check("only missing and expired are stale",
+              cache.stale(["UCnew", "UCold", "UCph", "UCunknown", "UCold", ""])
+              == ["UCold", "UCph", "UCunknown"],
+              str(cache.stale(["UCnew", "UCold", "UCph", "UCunknown"])))
+
+        cache.store(["UCold", "UCph", "UCunknown"],
+                    {"UCold": "https://yt3.ggpht.com/old2", "UCph": "https://yt3.ggpht.com/ph"})
+        check("fresh lookups no longer stale", cache.stale(["UCold", "UCph", "UCunknown"]) == [])
+        check("channel with no avatar remembered but not linked",
+              "UCunknown" not in cache.urls(["UCunknown"]))
+        check("src falls back", cache.src("UCunknown", PLACEHOLDER) == PLACEHOLDER)
+        cache.save()
+
+        later = ChannelThumbnailCache(tmp / "t.json", ttl_days=30, today=date(2026, 11, 15))
+        check("persisted across runs",
+              later.urls(["UCold"]) == {"UCold": "https://yt3.ggpht.com/old2"})
+        check("expires after the TTL", "UCold" in later.stale(["UCold"]))
+        check("no temp files left", [p.name for p in tmp.iterdir()] == ["t.json"])
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_mirroring():
+    tmp = Path(tempfile.mkdtemp(prefix="thumbs-"))
+    try:
+        calls = []
+
+        def fake_download(url):
+            calls.append(url)
+            if "broken" in url:
+                raise OSError("404")
+            return url.encode()
+
+        avatars = tmp / "public" / "images" / "channels"
+        cache = ChannelThumbnailCache(tmp / "t.json", avatar_dir=avatars, today=date(2026, 10, 1))
+        cache.store(["UCa", "UCb"], {"UCa": "https://x/a", "UCb": "https://x/broken"})
+        cache.mirror(["UCa", "UCb"], download=fake_download)
+        check("avatar written", (avatars / "UCa.jpg").read_bytes() == b"https://x/a")
+        check("local copy linked", cache.src("UCa", PLACEHOLDER) == "/images/channels/UCa.jpg")
+        check("failed download keeps hot-linking",
+              cache.src("UCb", PLACEHOLDER) == "https://x/broken")
+
+        calls.clear()
+        cache.mirror(["UCa"], download=fake_download)
+        check("unchanged avatar not downloaded again", calls == [])
+
+        cache.store(["UCa"], {"UCa": "https://x/a2"})
+        check("changed URL hot-links until mirrored",
+              cache.src("UCa", PLACEHOLDER) == "https://x/a2")
+        cache.mirror(["UCa"], download=fake_download)
+        check("changed URL re-downloaded", calls == ["https://x/a2"])
+
+        plain = ChannelThumbnailCache(tmp / "t.json")
+        plain.store(["UCa"], {"UCa": "https://x/a2"})
+        plain.mirror(["UCa"], download=fake_download)
+        check("mirroring off hot-links", plain.src("UCa", PLACEHOLDER) == "https://x/a2")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} channel thumbnail cache test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the polling file watcher behind `generate.py --watch`.
+
+No network. Watches a temp directory.
+
+Run: python3 tests/test_file_watch.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from file_watch import FileWatcher  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def bump(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+
+def test_detects_edits_additions_and_removals():
+    tmp = Path(tempfile.mkdtemp(prefix="fwatch-"))
+    try:
+        (tmp / "templates").mkdir()
+        (tmp / "templates" / "index.html").write_text("<p>hi</p>")
+        (tmp / "data.json").write_text("{}")
+        watcher = FileWatcher([tmp / "templates", tmp / "data.json"])
+        check("quiet tree has no changes", watcher.changes() == [])
+
+        bump(tmp / "templates" / "index.html")
+        check("edit detected", watcher.changes() == [tmp / "templates" / "index.html"])
+        check("reported once", watcher.changes() == [])
+
+        (tmp / "templates" / "new.html").write_text("x")
+        (tmp / "data.json").write_text('{"a": 1}')
+        check("addition and single-file root detected",
+              watcher.changes() == sorted([tmp / "templates" / "new.html", tmp / "data.json"]))
+
+        (tmp / "templates" / "new.html").unlink()
+        check("removal detected", watcher.changes() == [tmp / "templates" / "new.html"])
+
+        (tmp / "templates" / "index.html.swp").write_text("x")
+        (tmp / "templates" / "abc.tmp").write_text("x")
+        (tmp / "templates" / ".hidden").write_text("x")
+        check("swap, tmp and dot files ignored", watcher.changes() == [])
+
+        bump(tmp / "data.json")
+        watcher.reset()
+        check("reset drops pending changes", watcher.changes() == [])
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_wait_returns_promptly():
+    tmp = Path(tempfile.mkdtemp(prefix="fwatch-"))
+    try:
+        (tmp / "a.html").write_text("a")
+        watcher = FileWatcher([tmp])
+        start = time.monotonic()
+        check("timeout returns empty", watcher.wait(interval=0.01, timeout=0.05) == [])
+        check("timeout honoured", time.monotonic() - start < 0.5)
+        bump(tmp / "a.html")
+        check("wait sees the change", watcher.wait(interval=0.01, timeout=1) == [tmp / "a.html"])
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} file watcher test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
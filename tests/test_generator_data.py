@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for the generator's memoized data layer.
+
+No network. Files live in a temp directory.
+
+Run: python3 tests/test_generator_data.py
+"""
+
+import copy
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from generator_data import DataLayer, FrozenDict, FrozenList, thaw  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def raises(fn, exc=TypeError):
+    try:
+        fn()
+    except exc:
+        return True
+    return False
+
+
+def test_parses_once_and_reparses_on_change():
+    tmp = Path(tempfile.mkdtemp(prefix="gendata-"))
+    try:
+        f = tmp / "youtube_data.json"
+        f.write_text(json.dumps({"top_creators": [{"channel_name": "A"}]}))
+        layer = DataLayer()
+        first = layer.read_json(f)
+        second = layer.read_json(tmp / "." / "youtube_data.json")
+        check("same object on repeat read", first is second)
+        check("one parse, one hit", layer.stats["parses"] == 1 and layer.stats["hits"] == 1,
+              str(layer.stats))
+
+        f.write_text(json.dumps({"top_creators": [{"channel_name": "B"}, {}]}))
+        st = f.stat()
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        third = layer.read_json(f)
+        check("changed file re-parsed", third["top_creators"][0]["channel_name"] == "B")
+        check("reparse counted", layer.stats["reparses"] == 1, str(layer.stats))
+        check("report mentions hits", "1 cache hits" in layer.report(), layer.report())
+
+        check("missing file returns default", layer.read_json(tmp / "nope.json", {}) == {})
+        check("missing file without default raises",
+              raises(lambda: layer.read_json(tmp / "nope.json"), FileNotFoundError))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_views_are_read_only_but_json_friendly():
+    tmp = Path(tempfile.mkdtemp(prefix="gendata-"))
+    try:
+        f = tmp / "d.json"
+        f.write_text(json.dumps({"videos": [{"id": "a", "stats": {"views": 1}}]}))
+        data = DataLayer().read_json(f)
+        check("dict view", isinstance(data, FrozenDict))
+        check("list view", isinstance(data["videos"], FrozenList))
+        check("setitem blocked", raises(lambda: data.__setitem__("x", 1)))
+        check("nested setitem blocked",
+              raises(lambda: data["videos"][0]["stats"].__setitem__("views", 2)))
+        check("append blocked", raises(lambda: data["videos"].append({})))
+        check("json.dumps works", json.loads(json.dumps(data)) == data)
+        check(".copy() is a plain dict", type(data.copy()) is dict)
+        check("slices are plain lists", type(data["videos"][:1]) is list)
+
+        editable = thaw(data)
+        editable["videos"][0]["stats"]["views"] = 99
+        check("thaw gives an independent copy", data["videos"][0]["stats"]["views"] == 1)
+        check("deepcopy thaws", type(copy.deepcopy(data)["videos"]) is list)
+        check("pickle round trip", pickle.loads(pickle.dumps(data)) == data)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} generator data layer test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for the versioned homepage view model (the weekly half of the homepage).
+
+No network. Artifacts and blog pages are written to a temp directory.
+
+Run: python3 tests/test_homepage_view_model.py
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from homepage_view_model import (  # noqa: E402
+    VIEW_MODEL_VERSION,
+    drop_dead_blog_links,
+    link_topics_to_wiki,
+    load_view_model,
+    parse_key_insights,
+    parse_trending_topics,
+    save_view_model,
+    sentiment_percentages,
+)
+
+PASSED = []
+FAILED = []
+
+WIKI = {"seed oils": "/wiki/#seed-oils", "ribeye steak preparation": "wiki.html#ribeye"}
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def test_trending_topics_formats():
+    raw = (
+        '```json\n[{"topic": "Oils", "wiki_keyword": "seed oils", "blog_link": "/blog/x.html"},'
+        ' "Sleep"]\n```'
+    )
+    topics = parse_trending_topics(raw, WIKI)
+    check("fenced JSON parsed", [t["topic"] for t in topics] == ["Oils", "Sleep"], str(topics))
+    check("explicit wiki keyword linked",
+          topics[0]["wiki_links"] == [{"anchor": "seed-oils", "title": "Seed Oils"}])
+    check("blog link carried for the render-time check", topics[0]["blog_link"] == "/blog/x.html")
+
+    md = (
+        "### **Steak Prep**\n- Ribeye steak preparation tips\n**Bold only**\n---\n"
+        "More text\n### Empty\n"
+    )
+    topics = parse_trending_topics(md, WIKI)
+    check("markdown sections parsed",
+          topics == [{"topic": "Steak Prep",
+                      "description": "Ribeye steak preparation tips More text",
+                      "mentioned_by": ["Analysis"]}], str(topics))
+    check("unparseable text falls back",
+          parse_trending_topics("just words", {})[0]["topic"] == "Content Opportunities")
+
+    topics = [{"topic": "Ribeye Steak Preparation Guide"}, {"topic": "Morning coffee"}]
+    link_topics_to_wiki(topics, WIKI)
+    check("two-word overlap links", topics[0]["wiki_links"][0]["anchor"] == "ribeye")
+    check("single word does not link", "wiki_links" not in topics[1])
+
+
+def test_insights_and_sentiment():
+    insights = parse_key_insights("### Protein\n- Eat more\n### Fat\nButter is fine")
+    check("insights parsed", [i["title"] for i in insights] == ["Protein", "Fat"], str(insights))
+    check("lists passed through", parse_key_insights([{"title": "a"}]) == [{"title": "a"}])
+
+    source = {"positive_count": 3, "neutral_count": 1, "negative_count": 0}
+    sentiment = sentiment_percentages(source)
+    check("percentages added",
+          (sentiment["positive_percent"], sentiment["neutral_percent"],
+           sentiment["negative_percent"]) == (75, 25, 0))
+    check("source left alone", "positive_percent" not in source)
+    check("no comments, no percentages", "positive_percent" not in sentiment_percentages({}))
+
+
+def test_artifact_round_trip_and_invalidation():
+    tmp = Path(tempfile.mkdtemp(prefix="viewmodel-"))
+    try:
+        path = tmp / "homepage_view_model.json"
+        check("missing artifact must be built", load_view_model(path, "abc") is None)
+
+        view = {"weekly_summary": "Hi", "trending_topics": []}
+        save_view_model(path, view, "abc")
+        check("current artifact loads", load_view_model(path, "abc") == view)
+        check("changed inputs invalidate", load_view_model(path, "def") is None)
+
+        artifact = json.loads(path.read_text())
+        artifact["version"] = VIEW_MODEL_VERSION - 1
+        path.write_text(json.dumps(artifact))
+        check("older version invalidates", load_view_model(path, "abc") is None)
+
+        path.write_text("{truncated")
+        check("corrupt artifact is rebuilt", load_view_model(path, "abc") is None)
+        check("no temp files left", [p.name for p in tmp.iterdir()] == [path.name])
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_dead_blog_links_dropped_at_render():
+    tmp = Path(tempfile.mkdtemp(prefix="viewmodel-"))
+    try:
+        (tmp / "blog").mkdir()
+        (tmp / "blog" / "live.html").write_text("x")
+        topics = [{"topic": "a", "blog_link": "/blog/live.html"},
+                  {"topic": "b", "blog_link": "/blog/gone.html"}]
+        live = drop_dead_blog_links(topics, tmp)
+        check("live link kept", live[0]["blog_link"] == "/blog/live.html")
+        check("dead link dropped", "blog_link" not in live[1])
+        check("view model not mutated", topics[1]["blog_link"] == "/blog/gone.html")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} homepage view model test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
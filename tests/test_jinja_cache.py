@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent Jinja bytecode cache.
+
+No network. Templates and the cache live in a temp directory.
+
+Run: python3 tests/test_jinja_cache.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from jinja2 import Environment, FileSystemLoader  # noqa: E402
+
+from jinja_cache import bytecode_cache  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def fresh_env(templates, cache_dir, namespace="site", **kwargs):
+    """A new Environment, as a new generator process would build it."""
+    cache = bytecode_cache(namespace, cache_dir)
+    return Environment(loader=FileSystemLoader(templates), bytecode_cache=cache, **kwargs), cache
+
+
+def test_second_process_loads_bytecode():
+    tmp = Path(tempfile.mkdtemp(prefix="jcache-"))
+    try:
+        (tmp / "t").mkdir()
+        (tmp / "t" / "page.html").write_text("<p>{{ name }}</p>")
+        env, cache = fresh_env(tmp / "t", tmp / "cache")
+        first = env.get_template("page.html").render(name="A&B")
+        check("cold start compiles", cache.misses == 1 and cache.hits == 0)
+
+        env, cache = fresh_env(tmp / "t", tmp / "cache")
+        second = env.get_template("page.html").render(name="A&B")
+        check("warm start loads bytecode", cache.hits == 1 and cache.misses == 0)
+        check("same output", first == second == "<p>A&B</p>")
+        check("report shows hit rate", "100% hit rate" in cache.report(), cache.report())
+
+        (tmp / "t" / "page.html").write_text("<h1>{{ name }}</h1>")
+        st = (tmp / "t" / "page.html").stat()
+        os.utime(tmp / "t" / "page.html", ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        env, cache = fresh_env(tmp / "t", tmp / "cache")
+        check("edited template recompiled",
+              env.get_template("page.html").render(name="x") == "<h1>x</h1>"
+              and cache.misses == 1)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_namespaces_keep_environment_settings_apart():
+    tmp = Path(tempfile.mkdtemp(prefix="jcache-"))
+    try:
+        (tmp / "t").mkdir()
+        (tmp / "t" / "post.html").write_text("{{ body }}")
+        plain, _ = fresh_env(tmp / "t", tmp / "cache", "site")
+        check("plain env does not escape",
+              plain.get_template("post.html").render(body="<b>") == "<b>")
+        escaping, cache = fresh_env(tmp / "t", tmp / "cache", "blog", autoescape=True)
+        check("autoescaping env compiles its own copy",
+              escaping.get_template("post.html").render(body="<b>") == "&lt;b&gt;"
+              and cache.misses == 1)
+        check("unwritable cache dir disables caching",
+              bytecode_cache("x", Path("/proc/no-such-dir")) is None)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} Jinja cache test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the write-if-changed atomic output writer shared by the generators.
+
+No network. Writes into a temp directory.
+
+Run: python3 tests/test_output_writer.py
+"""
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from output_writer import OutputWriter  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def test_skips_identical_content():
+    tmp = Path(tempfile.mkdtemp(prefix="owriter-"))
+    try:
+        page = tmp / "public" / "blog" / "post.html"
+        writer = OutputWriter()
+        check("new file written", writer.write_text(page, "<p>café</p>") is True)
+        check("parent dirs created, content exact",
+              page.read_text(encoding="utf-8") == "<p>café</p>")
+
+        old = page.stat().st_mtime_ns - 10 ** 9
+        os.utime(page, ns=(old, old))
+        check("identical content skipped", writer.write_text(page, "<p>café</p>") is False)
+        check("mtime untouched", page.stat().st_mtime_ns == old)
+
+        check("same size, different bytes written", writer.write_text(page, "<p>cafe!</p>") is True)
+        check("json helper", writer.write_json(tmp / "r.json", {"a": 1}, indent=2) is True
+              and (tmp / "r.json").read_text() == '{\n  "a": 1\n}')
+        check("counts", (writer.written, writer.skipped) == (3, 1),
+              f"{writer.written} written, {writer.skipped} skipped")
+        check("report", writer.report().startswith("Output: 3 files written")
+              and "1 unchanged (12 B not rewritten)" in writer.report(), writer.report())
+        check("no temp files left", sorted(p.name for p in page.parent.iterdir()) == ["post.html"])
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_permissions_and_threads():
+    tmp = Path(tempfile.mkdtemp(prefix="owriter-"))
+    try:
+        page = tmp / "index.html"
+        page.write_text("old")
+        os.chmod(page, 0o644)
+        writer = OutputWriter()
+        writer.write_text(page, "new")
+        check("existing mode kept (not mkstemp's 0600)", stat.S_IMODE(page.stat().st_mode) == 0o644)
+
+        umask = os.umask(0)
+        os.umask(umask)
+        writer.write_text(tmp / "fresh.html", "x")
+        check("new file gets open()'s umask-based mode",
+              stat.S_IMODE((tmp / "fresh.html").stat().st_mode) == 0o666 & ~umask)
+
+        threads = [
+            threading.Thread(target=writer.write_text, args=(tmp / f"p{i % 5}.html", "same"))
+            for i in range(20)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        check("concurrent writers all counted", writer.written + writer.skipped == 22,
+              f"{writer.written} + {writer.skipped}")
+        check("concurrent writes land intact",
+              all((tmp / f"p{i}.html").read_text() == "same" for i in range(5)))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} output writer test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the TF-IDF related-posts index shared by the blog generators.
+
+No network. The index cache lives in a temp directory. The NumPy scorer is
+compared with the pure-Python one when NumPy is installed.
+
+Run: python3 tests/test_related_posts.py
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+import related_posts  # noqa: E402
+from related_posts import RelatedPostsIndex  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def post(slug, title, tags=(), date="2026-01-01", site="cw", excerpt="", category=""):
+    return {"slug": slug, "title": title, "tags": list(tags), "date": date, "site": site,
+            "excerpt": excerpt, "category": category, "published": True}
+
+
+def corpus():
+    return [
+        post("ribeye", "Ribeye steak: the perfect carnivore cut", ["steak", "beef"],
+             "2026-01-10", excerpt="Why ribeye fat matters."),
+        post("strip", "Strip steak versus ribeye steak", ["steak", "beef"], "2026-01-08"),
+        post("tallow", "Cooking with beef tallow", ["beef", "fat"], "2026-01-06",
+             excerpt="Render tallow from beef fat."),
+        post("sleep", "Sleep quality on carnivore", ["sleep"], "2026-01-12"),
+        post("eggs", "Eggs and butter breakfast", ["eggs"], "2026-01-04"),
+        post("kd-macros", "Steak macros for keto", ["steak"], "2026-01-11", site="kd"),
+    ]
+
+
+def slugs(index, p):
+    return [r["slug"] for r in index.related(p)]
+
+
+def test_ranking_and_fill():
+    posts = corpus()
+    index = RelatedPostsIndex(posts, cache_file=None)
+    by_slug = {p["slug"]: p for p in posts}
+
+    check("closest post ranked first", slugs(index, by_slug["ribeye"])[0] == "strip",
+          str(slugs(index, by_slug["ribeye"])))
+    check("shared tag ranks above unrelated",
+          slugs(index, by_slug["ribeye"])[1] == "tallow", str(slugs(index, by_slug["ribeye"])))
+    check("never relates a post to itself",
+          all(p["slug"] not in slugs(index, p) for p in posts))
+    check("only same-site posts", "kd-macros" not in slugs(index, by_slug["strip"])
+          and slugs(index, by_slug["kd-macros"]) == [])
+    check("no similar posts: most recent fill in",
+          slugs(index, by_slug["eggs"]) == ["sleep", "ribeye", "strip"],
+          str(slugs(index, by_slug["eggs"])))
+    check("unindexed post has none", index.related(post("new", "New")) == [])
+    shuffled = RelatedPostsIndex(list(reversed(posts)), cache_file=None)
+    check("input order doesn't matter",
+          all(slugs(index, p) == slugs(shuffled, p) for p in posts))
+
+
+def test_numpy_and_python_agree():
+    vectors = related_posts._tfidf([related_posts.post_terms(p) for p in corpus() * 3])
+    recency = list(range(len(vectors)))
+    expected = related_posts._top_k_python(vectors, recency, 3)
+    check("python scorer breaks exact ties by recency", expected[0][:2] == [6, 12],
+          str(expected[0]))
+    if related_posts.np is None:
+        print("  (numpy not installed, NumPy scorer not compared)")
+        return
+    check("numpy scorer ranks identically",
+          related_posts._top_k_numpy(vectors, recency, 3) == expected)
+
+
+def test_cache_and_incremental_update():
+    tmp = Path(tempfile.mkdtemp(prefix="related-"))
+    try:
+        cache = tmp / "related_posts_index.json"
+        posts = corpus()
+        first = RelatedPostsIndex(posts, cache_file=cache)
+        first.save()
+        check("built every post once", first.tokenized == len(posts) and
+              first.built_sites == ["cw", "kd"], first.report())
+
+        again = RelatedPostsIndex(posts, cache_file=cache)
+        check("unchanged corpus loads from cache",
+              again.built_sites == [] and again.cached_sites == ["cw", "kd"], again.report())
+        check("cached lists match", all(slugs(first, p) == slugs(again, p) for p in posts))
+
+        added = posts + [post("ny-strip", "New York strip steak", ["steak"], "2026-01-13")]
+        grown = RelatedPostsIndex(added, cache_file=cache)
+        check("new post: only it tokenized, only its site rebuilt",
+              grown.tokenized == 1 and grown.built_sites == ["cw"], grown.report())
+        check("new post gets related posts", "strip" in slugs(grown, added[-1]))
+
+        json.loads(cache.read_text())  # still valid after the first save
+        cache.write_text("{broken")
+        check("corrupt cache rebuilt", RelatedPostsIndex(posts, cache_file=cache).tokenized == 6)
+        check("no temp files left", [p.name for p in tmp.iterdir()] == [cache.name])
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} related posts index test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
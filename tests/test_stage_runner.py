@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallel generation stage runner.
+
+No network, no files. Stages are small functions that sleep and print.
+
+Run: python3 tests/test_stage_runner.py
+"""
+
+import contextlib
+import io
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from stage_runner import run_stages  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def stage(name, seconds, ok=True, log=None):
+    def fn():
+        if log is not None:
+            log.append(("start", name))
+        for i in range(3):
+            print(f"{name} line {i}")
+            time.sleep(seconds / 3)
+        if log is not None:
+            log.append(("end", name))
+        return ok
+    return fn
+
+
+def run_captured(*args, **kwargs):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        results = run_stages(*args, **kwargs)
+    return results, out.getvalue()
+
+
+def test_runs_concurrently_with_unmixed_output():
+    stages = [("slow", stage("slow", 0.3)), ("fast", stage("fast", 0.1)),
+              ("mid", stage("mid", 0.2))]
+    start = time.perf_counter()
+    results, out = run_captured(stages, workers=3)
+    elapsed = time.perf_counter() - start
+    check("wall time close to slowest stage", elapsed < 0.5, f"{elapsed:.2f}s")
+    check("results in declared order", list(results) == ["slow", "fast", "mid"])
+    check("all succeeded", all(r.ok for r in results.values()))
+    expected = "".join(f"{n} line {i}\n" for n in ("slow", "fast", "mid") for i in range(3))
+    check("output grouped per stage in declared order", out == expected, repr(out))
+    check("stdout restored", not type(sys.stdout).__name__.startswith("_Thread"))
+
+
+def test_failures_and_exceptions_keep_combined_status():
+    def boom():
+        print("about to fail")
+        raise RuntimeError("template exploded")
+
+    results, out = run_captured(
+        [("good", stage("good", 0.01)), ("bad", stage("bad", 0.01, ok=False)),
+         ("boom", boom)],
+        workers=3,
+    )
+    check("failed stage reported", results["bad"].ok is False)
+    check("raising stage counts as failed", results["boom"].ok is False)
+    check("others still succeed", results["good"].ok is True)
+    check("traceback lands in the stage's block",
+          "about to fail" in out and "RuntimeError: template exploded" in out
+          and out.index("about to fail") < out.index("RuntimeError"), repr(out))
+
+
+def test_dependencies_wait_for_their_stage():
+    log = []
+    results, _ = run_captured(
+        [("a", stage("a", 0.15, log=log)), ("b", stage("b", 0.01, log=log)),
+         ("c", stage("c", 0.01, log=log))],
+        dependencies={"b": ("a",), "c": ("not-selected",)},
+        workers=3,
+    )
+    check("dependent starts after its dependency ends",
+          log.index(("end", "a")) < log.index(("start", "b")), str(log))
+    check("unknown dependency ignored", results["c"].ok)
+    check("independent stage not held back",
+          log.index(("start", "c")) < log.index(("end", "a")), str(log))
+
+
+def test_serial_mode_matches():
+    threads = set()
+
+    def record():
+        threads.add(threading.get_ident())
+        return True
+
+    results, _ = run_captured([("x", record), ("y", record)], workers=1)
+    check("workers=1 runs on the calling thread", threads == {threading.get_ident()})
+    check("serial results", [r.ok for r in results.values()] == [True, True])
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} stage runner test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for the video statistics time-series store.
+
+No network. Every case writes to a temp directory so data/video_stats is
+never touched.
+
+Run: python3 tests/test_video_stats_store.py
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from video_stats_store import VideoStatsStore, parse_timestamp  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+HOUR = 3600
+T0 = parse_timestamp("2026-01-01T00:00:00Z")
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def video(vid, views, likes=0, comments=0, published="2026-01-01T00:00:00Z"):
+    return {
+        "video_id": vid,
+        "published_at": published,
+        "statistics": {"view_count": views, "like_count": likes, "comment_count": comments},
+    }
+
+
+def temp_store():
+    return VideoStatsStore(Path(tempfile.mkdtemp(prefix="vstats-")))
+
+
+# ------------------------------------------------------------ append / reload
+
+def test_append_and_reload():
+    store = temp_store()
+    try:
+        n = store.append([video("a", 100, 5, 1), video("b", 50)], timestamp=T0 + 10 * HOUR)
+        store.append([video("a", 300, 9, 2)], timestamp=T0 + 20 * HOUR)
+        check("append returns rows written", n == 2, str(n))
+
+        reopened = VideoStatsStore(store.store_dir)
+        check("snapshots persist", len(reopened) == 3, str(len(reopened)))
+        check("video index persists", reopened.video_count == 2)
+        hist = reopened.history("a")
+        check("history oldest first", [h["views"] for h in hist] == [100, 300], str(hist))
+        check("likes column kept", hist[-1]["likes"] == 9 and hist[-1]["comments"] == 2)
+        check("unknown video has no history", reopened.history("zzz") == [])
+        check("empty batch writes nothing", store.append([]) == 0)
+    finally:
+        shutil.rmtree(store.store_dir, ignore_errors=True)
+
+
+def test_torn_append_is_truncated():
+    store = temp_store()
+    try:
+        store.append([video("a", 100)], timestamp=T0 + HOUR)
+        # Simulate a crash part-way through the next append: one column longer
+        with open(store._column_path("ts"), "ab") as fh:
+            fh.write(b"\0" * 8)
+        reopened = VideoStatsStore(store.store_dir)
+        check("torn row dropped on load", len(reopened) == 1, str(len(reopened)))
+        reopened.append([video("a", 200)], timestamp=T0 + 2 * HOUR)
+        again = VideoStatsStore(store.store_dir)
+        check(
+            "later append lines up after torn row",
+            [h["views"] for h in again.history("a")] == [100, 200],
+            str(again.history("a")),
+        )
+    finally:
+        shutil.rmtree(store.store_dir, ignore_errors=True)
+
+
+# ---------------------------------------------------------------- velocities
+
+def test_velocity_and_acceleration():
+    store = temp_store()
+    try:
+        store.append([video("a", 100)], timestamp=T0 + 10 * HOUR)
+        store.append([video("a", 300)], timestamp=T0 + 20 * HOUR)
+        store.append([video("a", 700)], timestamp=T0 + 30 * HOUR)
+        m = store.velocities(["a"])["a"]
+        check("views/hour since publish", abs(m["views_per_hour"] - 700 / 30) < 1e-9,
+              str(m))
+        check("recent velocity", abs(m["recent_velocity"] - 40.0) < 1e-9, str(m))
+        # 20 views/h -> 40 views/h over 10 hours
+        check("acceleration", abs(m["acceleration"] - 2.0) < 1e-9, str(m))
+        check("snapshot count", m["snapshots"] == 3)
+        check("latest views", m["views"] == 700)
+    finally:
+        shutil.rmtree(store.store_dir, ignore_errors=True)
+
+
+def test_velocity_ranks_young_videos_above_big_old_ones():
+    store = temp_store()
+    try:
+        now = T0 + 100 * HOUR
+        store.append(
+            [
+                video("old", 10_000, published="2026-01-01T00:00:00Z"),   # 100 h old
+                video("new", 2_000, published="2026-01-05T02:00:00Z"),    # 2 h old
+            ],
+            timestamp=now,
+        )
+        v = store.velocities(now=now)
+        check("old video 100 views/h", abs(v["old"]["views_per_hour"] - 100) < 1e-9)
+        check("new video 1000 views/h", abs(v["new"]["views_per_hour"] - 1000) < 1e-9)
+        check("single snapshot has no acceleration", v["new"]["acceleration"] == 0.0)
+        check("filter by id", list(store.velocities(["old"])) == ["old"])
+        check("unknown ids ignored", store.velocities(["nope"]) == {})
+    finally:
+        shutil.rmtree(store.store_dir, ignore_errors=True)
+
+
+def test_months_of_snapshots_query_fast():
+    store = temp_store()
+    try:
+        # ~6 months of twice-weekly runs over 500 videos
+        for run in range(52):
+            store.append(
+                [video(f"v{i}", i * run + 1) for i in range(500)],
+                timestamp=T0 + run * 84 * HOUR,
+            )
+        reopened = VideoStatsStore(store.store_dir)
+        start = time.perf_counter()
+        v = reopened.velocities()
+        elapsed = time.perf_counter() - start
+        check("all videos ranked", len(v) == 500, str(len(v)))
+        check("26k snapshots loaded", len(reopened) == 26_000, str(len(reopened)))
+        check("velocity pass under 500 ms", elapsed < 0.5, f"{elapsed * 1000:.0f} ms")
+    finally:
+        shutil.rmtree(store.store_dir, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} video stats store test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+End-to-end tests for YouTubeCollector.collect_all_data against the offline
+SyntheticYouTube backend.
+
+No network, no API key, no Supabase. The quota ledger, watchlist state,
+seen-IDs file and stats store live in a temp directory; Supabase is an
+in-memory fake that can be told to reject rows.
+
+Run: python3 tests/test_youtube_collector_offline.py
+"""
+
+import json
+import math
+import shutil
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from io import StringIO
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+import youtube_collector  # noqa: E402
+from video_stats_store import VideoStatsStore  # noqa: E402
+from youtube_collector import YouTubeCollector  # noqa: E402
+from youtube_fake_backend import SyntheticYouTube  # noqa: E402
+from youtube_quota import YouTubeQuota  # noqa: E402
+from youtube_response_cache import ResponseCache  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+WATCHED = ["UCsynthetic00000", "UCsynthetic00001", "UCsynthetic00002", "UCdeleted000000"]
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+class FakeResult:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeQuery:
+    """The slice of the supabase-py query builder the collector uses."""
+
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.op = "select"
+        self.payload = None
+        self.filter = None
+
+    def select(self, columns):
+        return self
+
+    def order(self, *args, **kwargs):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def gte(self, *args):
+        return self
+
+    def lt(self, *args):
+        return self
+
+    def range(self, start, end):
+        self.filter = ("range", start, end)
+        return self
+
+    def in_(self, column, values):
+        self.filter = ("in", column, set(values))
+        return self
+
+    def insert(self, rows):
+        self.op, self.payload = "insert", rows
+        return self
+
+    def upsert(self, rows, on_conflict):
+        self.op, self.payload = "upsert", rows if isinstance(rows, list) else [rows]
+        return self
+
+    def delete(self):
+        self.op = "delete"
+        return self
+
+    def execute(self):
+        rows = self.db.tables.setdefault(self.table, {})
+        if self.op == "upsert":
+            self.db.upserts += 1
+            if any(r["youtube_id"] in self.db.reject_ids for r in self.payload):
+                raise RuntimeError("row violates check constraint")
+            for record in self.payload:
+                rows[record["youtube_id"]] = {**rows.get(record["youtube_id"], {}), **record}
+            return FakeResult(self.payload)
+        if self.op != "select":
+            return FakeResult([])
+        data = list(rows.values())
+        if self.filter and self.filter[0] == "in":
+            data = [r for r in data if r.get(self.filter[1]) in self.filter[2]]
+        elif self.filter and self.filter[0] == "range":
+            data = data[self.filter[1]:self.filter[2] + 1]
+        return FakeResult(data)
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.tables = {}
+        self.upserts = 0
+        self.reject_ids = set()
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+class Sandbox:
+    """Temp dir for the collector's on-disk state, plus module paths pointed at it."""
+
+    def __init__(self, queries):
+        self.tmp = Path(tempfile.mkdtemp(prefix="collector-"))
+        self.saved = {
+            name: getattr(youtube_collector, name)
+            for name in ("SEARCH_QUERIES", "SEEN_IDS_FILE", "CREATOR_HISTORY_FILE",
+                         "WATCHLIST_STATE_FILE")
+        }
+        youtube_collector.SEARCH_QUERIES = queries
+        youtube_collector.SEEN_IDS_FILE = self.tmp / "seen_video_ids.json"
+        youtube_collector.CREATOR_HISTORY_FILE = self.tmp / "creator_history.json"
+        youtube_collector.WATCHLIST_STATE_FILE = self.tmp / "channel_watchlist.json"
+        config = self.tmp / "youtube-quota.json"
+        config.write_text(json.dumps({
+            "enabled": True,
+            "daily_cap_units": 10000,
+            "unit_costs": json.loads(
+                (PROJECT_ROOT / "config" / "youtube-quota.json").read_text()
+            )["unit_costs"],
+        }))
+        self.supabase = FakeSupabase()
+
+    def collector(self, backend, quota=None):
+        with redirect_stdout(StringIO()):
+            collector = YouTubeCollector(
+                "test-key",
+                workers=2,
+                quota=quota or self.quota(),
+                response_cache=ResponseCache(cache_dir=self.tmp / "cache", ttls={}),
+                client_factory=lambda: backend,
+                stats_store=VideoStatsStore(self.tmp / "video_stats"),
+            )
+        collector.supabase = self.supabase
+        return collector
+
+    def quota(self):
+        return YouTubeQuota(config_file=self.tmp / "youtube-quota.json",
+                            ledger_file=self.tmp / "ledger.jsonl")
+
+    def close(self):
+        for name, value in self.saved.items():
+            setattr(youtube_collector, name, value)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+
+def collect(collector, **kwargs):
+    out = StringIO()
+    with redirect_stdout(out):
+        data = collector.collect_all_data(**kwargs)
+    return data, out.getvalue()
+
+
+def video_ids(data):
+    return [v["video_id"] for c in data.get("top_creators", []) for v in c["videos"]]
+
+
+def test_cold_run_quota_spend():
+    sb = Sandbox(["carnivore diet", "animal-based diet"])
+    try:
+        backend = SyntheticYouTube(creators=6, videos=60, comments_per_video=3)
+        quota = sb.quota()
+        data, _ = collect(sb.collector(backend, quota))
+
+        ids = video_ids(data)
+        check("cold run collects videos", len(ids) > 10, str(len(ids)))
+        check("every video has comments", all(
+            v["top_comments"] for c in data["top_creators"] for v in c["videos"]
+        ))
+        costs = {m: quota.unit_cost(m) for m in backend.calls}
+        expected = {m: n * costs[m] for m, n in backend.calls.items()}
+        check("quota charged per call and method", quota.session_units == expected,
+              f"{quota.session_units} vs {expected}")
+        check("two searches at 100 units", quota.session_units.get("search.list") == 200,
+              str(quota.session_units))
+        ledger = (sb.tmp / "ledger.jsonl").read_text().splitlines()
+        check("one ledger row per API call", len(ledger) == sum(backend.calls.values()),
+              f"{len(ledger)} vs {dict(backend.calls)}")
+        check("quota units reported in the output", data["quota_units"] == expected)
+    finally:
+        sb.close()
+
+
+def test_quota_cap_skips_comments():
+    sb = Sandbox(["carnivore diet"])
+    try:
+        config = json.loads((sb.tmp / "youtube-quota.json").read_text())
+        config["daily_cap_units"] = 105
+        (sb.tmp / "youtube-quota.json").write_text(json.dumps(config))
+        backend = SyntheticYouTube(creators=6, videos=60, comments_per_video=3)
+        data, out = collect(sb.collector(backend))
+
+        check("run still completes at the cap", len(video_ids(data)) > 0)
+        check("comments skipped with a warning", "Skipped comments (quota)" in out)
+        check("no call beyond the cap", sum(data["quota_units"].values()) <= 105,
+              str(data["quota_units"]))
+    finally:
+        sb.close()
+
+
+def test_channel_rankings_follow_rank_by():
+    sb = Sandbox(["carnivore diet"])
+    try:
+        backend = SyntheticYouTube(creators=6, videos=60, comments_per_video=3)
+        collector = sb.collector(backend)
+        data, _ = collect(collector)
+        videos = [v for c in data["top_creators"] for v in c["videos"]]
+
+        for rank_by, metric in (("views", "total_views_week"), ("velocity", "views_per_hour")):
+            collector.rank_by = rank_by
+            with redirect_stdout(StringIO()):
+                ranked = collector.calculate_channel_rankings(videos)
+            values = [c[metric] for c in ranked]
+            check(f"channel rankings sorted by {metric}", values == sorted(values, reverse=True),
+                  str(values))
+
+            diverse = collector.enforce_creator_diversity([dict(v) for v in videos])
+            per_channel = {}
+            for v in diverse:
+                per_channel.setdefault(v["channel_id"], []).append(collector._rank_key(v))
+            check(f"diversity keeps the top {rank_by} videos per creator", all(
+                len(keys) <= youtube_collector.MAX_VIDEOS_PER_CREATOR
+                and keys == sorted(keys, reverse=True)
+                for keys in per_channel.values()
+            ), str(per_channel))
+    finally:
+        sb.close()
+
+
+def test_stats_quota_block_still_saves():
+    sb = Sandbox(["carnivore diet"])
+    try:
+        config = json.loads((sb.tmp / "youtube-quota.json").read_text())
+        del config["unit_costs"]["videos.list"]  # the ledger refuses unpriced methods
+        (sb.tmp / "youtube-quota.json").write_text(json.dumps(config))
+        backend = SyntheticYouTube(creators=6, videos=60, comments_per_video=3)
+        collector = sb.collector(backend)
+        data, out = collect(collector)
+
+        ids = video_ids(data)
+        check("searches kept despite blocked videos.list", len(ids) > 0, out[-300:])
+        check("no videos.list call made", backend.calls["videos.list"] == 0,
+              str(dict(backend.calls)))
+        check("statistics skipped with a warning", "Skipped statistics (quota)" in out)
+
+        output = sb.tmp / "youtube_data.json"
+        with redirect_stdout(StringIO()):
+            collector.save_data(data, output)
+        saved = json.loads(output.read_text())
+        check("collected videos saved to disk", video_ids(saved) == ids)
+        check("collected videos synced",
+              sorted(sb.supabase.tables["youtube_videos"]) == sorted(ids))
+    finally:
+        sb.close()
+
+
+def test_watchlist_and_incremental():
+    sb = Sandbox(["carnivore diet"])
+    try:
+        (sb.tmp / "creator_history.json").write_text(json.dumps({
+            "creators": {f"Creator {i}": {"channel_id": c} for i, c in enumerate(WATCHED)}
+        }))
+        backend = SyntheticYouTube(creators=6, videos=60, comments_per_video=3)
+        collector = sb.collector(backend)
+        data, _ = collect(collector, watchlist=True)
+        with redirect_stdout(StringIO()):
+            collector.save_to_supabase(data)
+
+        ids = video_ids(data)
+        # One query only reaches vid000000-vid000029; later uploads come from polling
+        polled = [v for v in ids if int(v[3:]) >= 30]
+        check("watchlist adds uploads search missed", polled, str(ids))
+        check("polled uploads come from watched channels", all(
+            backend.by_id[v]["channel_id"] in WATCHED for v in polled
+        ))
+        check("one channels.list for the roster", backend.calls["channels.list"] == 1,
+              str(dict(backend.calls)))
+        check("one playlistItems.list per resolvable channel",
+              backend.calls["playlistItems.list"] == 3, str(dict(backend.calls)))
+        state = json.loads((sb.tmp / "channel_watchlist.json").read_text())
+        check("uploads playlists cached",
+              sorted(state["uploads_playlists"]) == WATCHED[:3], str(state["uploads_playlists"]))
+
+        rows = sb.supabase.tables["youtube_videos"]
+        check("every collected video synced", sorted(rows) == sorted(ids))
+        check("fresh stats stamped", all(r["stats_fetched_at"] for r in rows.values()))
+
+        # Second run: one fresh, one stale, one already featured
+        fresh, stale, featured = ids[0], ids[1], ids[2]
+        rows[fresh]["view_count"] = 123
+        rows[fresh]["stats_fetched_at"] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        rows[stale]["stats_fetched_at"] = (
+            datetime.utcnow() - timedelta(days=2)
+        ).strftime("%Y-%m-%dT%H:%M:%SZ")
+        (sb.tmp / "seen_video_ids.json").write_text(json.dumps([{"video_id": featured}]))
+
+        backend = SyntheticYouTube(creators=6, videos=60, comments_per_video=3)
+        data, out = collect(sb.collector(backend), incremental=True, watchlist=True)
+        videos = {v["video_id"]: v for c in data["top_creators"] for v in c["videos"]}
+
+        check("plan reported", "🔁 Incremental:" in out)
+        check("featured video dropped", featured not in videos)
+        check("fresh cached stats reused", videos[fresh]["view_count"] == 123,
+              str(videos[fresh]["view_count"]))
+        check("stale stats refetched",
+              videos[stale]["view_count"] == backend.by_id[stale]["views"])
+        check("known videos reuse cached comments", backend.calls["commentThreads.list"] == 0,
+              str(dict(backend.calls)))
+        # Cached playlists are reused; only the channel that never resolved is asked again
+        check("one channels.list, for the unresolved channel only",
+              backend.calls["channels.list"] == 1, str(dict(backend.calls)))
+        check("watchlist polled again", backend.calls["playlistItems.list"] == 3,
+              str(dict(backend.calls)))
+        check("fresh video keeps its fetch time",
+              videos[fresh]["stats_fetched_at"] == rows[fresh]["stats_fetched_at"])
+        check("stale video gets a new fetch time",
+              videos[stale]["stats_fetched_at"] > rows[stale]["stats_fetched_at"])
+    finally:
+        sb.close()
+
+
+def test_watchlist_quota_falls_back():
+    sb = Sandbox(["carnivore diet"])
+    try:
+        (sb.tmp / "creator_history.json").write_text(json.dumps({
+            "creators": {f"Creator {i}": {"channel_id": c} for i, c in enumerate(WATCHED)}
+        }))
+        earlier = {"video_id": "vid000042", "channel_id": WATCHED[0], "title": "Earlier upload",
+                   "published_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")}
+        (sb.tmp / "channel_watchlist.json").write_text(json.dumps({
+            "last_polled": {WATCHED[0]: "2026-01-01T00:00:00Z"},
+            "recent_uploads": {"vid000042": earlier},
+        }))
+        config = json.loads((sb.tmp / "youtube-quota.json").read_text())
+        config["daily_cap_units"] = 2  # channels.list and one playlistItems.list
+        (sb.tmp / "youtube-quota.json").write_text(json.dumps(config))
+
+        backend = SyntheticYouTube(creators=6, videos=60, comments_per_video=3)
+        collector = sb.collector(backend)
+        collector.workers = 1
+        out = StringIO()
+        with redirect_stdout(out):
+            uploads = collector.poll_watchlist()
+
+        check("quota stop reported, not raised", "Skipped watchlist polling (quota)"
+              in out.getvalue(), out.getvalue())
+        check("earlier uploads still returned", [u["video_id"] for u in uploads] == ["vid000042"],
+              str(uploads))
+        state = json.loads((sb.tmp / "channel_watchlist.json").read_text())
+        check("resolved playlists kept", sorted(state["uploads_playlists"]) == WATCHED[:3])
+        check("last_polled untouched",
+              state["last_polled"] == {WATCHED[0]: "2026-01-01T00:00:00Z"},
+              str(state["last_polled"]))
+        check("no temp files left", list(sb.tmp.glob(".channel_watchlist.json*")) == [])
+    finally:
+        sb.close()
+
+
+def test_chunked_upsert_fallback():
+    sb = Sandbox(["carnivore diet", "animal-based diet"])
+    try:
+        backend = SyntheticYouTube(creators=6, videos=60, comments_per_video=3)
+        collector = sb.collector(backend)
+        data, _ = collect(collector)
+        ids = video_ids(data)
+        bad = ids[len(ids) // 2]
+        sb.supabase.reject_ids = {bad}
+
+        out = StringIO()
+        with redirect_stdout(out):
+            collector.save_to_supabase(data, chunk_size=5)
+
+        rows = sb.supabase.tables["youtube_videos"]
+        check("good rows all written", sorted(rows) == sorted(set(ids) - {bad}),
+              f"{len(rows)} of {len(ids)}")
+        check("failing row named", bad in out.getvalue(), out.getvalue()[-300:])
+        chunks = math.ceil(len(ids) / 5)
+        bad_chunk = len(ids[(ids.index(bad) // 5) * 5:][:5])
+        check("only the failing chunk is retried and replayed row by row",
+              sb.supabase.upserts == chunks + 1 + bad_chunk,
+              f"{sb.supabase.upserts} upserts for {chunks} chunks")
+    finally:
+        sb.close()
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} offline collector test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
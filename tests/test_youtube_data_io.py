@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for the youtube_data JSON / NDJSON reader and writer.
+
+No network. Files are written to a temp directory; data/youtube_data.json is
+only read, as a realistic fixture.
+
+Run: python3 tests/test_youtube_data_io.py
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from youtube_data_io import (  # noqa: E402
+    HEAVY_FIELDS,
+    iter_videos,
+    load_youtube_data,
+    matching_ndjson,
+    read_header,
+    save_youtube_data,
+)
+
+PASSED = []
+FAILED = []
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def sample_data():
+    return {
+        "collection_date": "2026-01-05",
+        "total_videos_found": 3,
+        "top_creators": [
+            {
+                "channel_id": "UCa",
+                "channel_name": "Creator A",
+                "total_views_week": 300,
+                "videos": [
+                    {
+                        "video_id": "a1",
+                        "title": 'Tricky ,"description": "title"',
+                        "description": 'Has ,"top_comments": inside',
+                        "statistics": {"view_count": 200},
+                        "top_comments": [{"text": "great", "likes": 3}],
+                        "comment_sentiment": {"overall": "positive"},
+                    },
+                    {"video_id": "a2", "title": "No heavy fields", "statistics": {}},
+                ],
+            },
+            {
+                "channel_id": "UCb",
+                "channel_name": "Créateur B",
+                "total_views_week": 10,
+                "videos": [
+                    {"video_id": "b1", "title": "Ünïcode", "description": "",
+                     "top_comments": []},
+                ],
+            },
+        ],
+        "source": "api",
+    }
+
+
+def test_round_trip_is_byte_identical():
+    tmp = Path(tempfile.mkdtemp(prefix="ytdata-"))
+    try:
+        data = sample_data()
+        save_youtube_data(data, tmp / "y.json", tmp / "y.ndjson")
+        check("json written as indent=2",
+              (tmp / "y.json").read_text() == json.dumps(data, indent=2, ensure_ascii=False))
+        back = load_youtube_data(tmp / "y.ndjson")
+        check("ndjson loads back equal", back == data)
+        check(
+            "key order preserved",
+            json.dumps(back, indent=2) == json.dumps(data, indent=2),
+        )
+        lines = (tmp / "y.ndjson").read_text().splitlines()
+        check("header + one line per video", len(lines) == 4, str(len(lines)))
+        header = read_header(tmp / "y.ndjson")
+        check("header has creators without videos",
+              [c["channel_name"] for c in header["creators"]] == ["Creator A", "Créateur B"]
+              and "videos" not in header["creators"][0])
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_lazy_reader_skips_heavy_fields():
+    tmp = Path(tempfile.mkdtemp(prefix="ytdata-"))
+    try:
+        save_youtube_data(sample_data(), tmp / "y.json", tmp / "y.ndjson")
+        pairs = list(iter_videos(tmp / "y.ndjson", skip_heavy=True))
+        check("every video streamed", [v["video_id"] for _, v in pairs] == ["a1", "a2", "b1"])
+        check("creator attached", pairs[2][0]["channel_name"] == "Créateur B")
+        check("heavy fields dropped",
+              all(f not in v for _, v in pairs for f in HEAVY_FIELDS), str(pairs))
+        check("markers inside strings don't cut early",
+              pairs[0][1]["title"] == 'Tricky ,"description": "title"')
+        check("light fields kept", pairs[0][1]["comment_sentiment"] == {"overall": "positive"})
+
+        full = list(iter_videos(tmp / "y.ndjson", skip=("statistics",)))
+        check("full read keeps comments", full[0][1]["top_comments"][0]["likes"] == 3)
+        check("explicit skip", all("statistics" not in v for _, v in full))
+
+        from_json = load_youtube_data(tmp / "y.json", skip_heavy=True)
+        check("json source honours skip_heavy",
+              "top_comments" not in from_json["top_creators"][0]["videos"][0])
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_ndjson_copy_is_opt_in_and_checked_by_content():
+    tmp = Path(tempfile.mkdtemp(prefix="ytdata-"))
+    try:
+        save_youtube_data(sample_data(), tmp / "y.json")
+        check("no copy unless asked", not (tmp / "y.ndjson").exists())
+
+        save_youtube_data(sample_data(), tmp / "y.json", tmp / "y.ndjson")
+        check("matching copy is used", matching_ndjson(tmp / "y.json") == tmp / "y.ndjson")
+
+        # Hand edit, as add_sentiment or the weekly agent would, then make the
+        # stale copy look newer: the edit must still win
+        edited = sample_data()
+        edited["top_creators"][1]["videos"][0]["comment_sentiment"] = {"overall": "mixed"}
+        (tmp / "y.json").write_text(json.dumps(edited, indent=2, ensure_ascii=False))
+        os.utime(tmp / "y.ndjson", (time.time() + 60, time.time() + 60))
+        check("edited json no longer matches its copy", matching_ndjson(tmp / "y.json") is None)
+        check("edited json is what loads", load_youtube_data(tmp / "y.json") == edited)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_real_collector_output_round_trips():
+    source = PROJECT_ROOT / "data" / "youtube_data.json"
+    if not source.exists():
+        return
+    tmp = Path(tempfile.mkdtemp(prefix="ytdata-"))
+    try:
+        data = json.loads(source.read_text(encoding="utf-8"))
+        save_youtube_data(data, tmp / "y.json", tmp / "y.ndjson")
+        check("committed youtube_data.json round-trips",
+              load_youtube_data(tmp / "y.ndjson") == data)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} youtube_data I/O test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Tests for the YouTube Data API quota ledger.
+
+No network, no API keys. Every case runs against a temp config and temp
+ledger so the real ledger is never touched.
+
+Run: python3 tests/test_youtube_quota.py
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from youtube_quota import QuotaBlocked, YouTubeQuota, today_str  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+class Sandbox:
+    """A throwaway config + ledger pair."""
+
+    def __init__(self, config=None, ledger_lines=None):
+        self.dir = Path(tempfile.mkdtemp(prefix="ytquota-"))
+        self.config_file = self.dir / "youtube-quota.json"
+        self.ledger_file = self.dir / "youtube-quota-ledger.jsonl"
+        if config is not None:
+            self.config_file.write_text(
+                config if isinstance(config, str) else json.dumps(config)
+            )
+        if ledger_lines is not None:
+            self.ledger_file.write_text("".join(ledger_lines))
+
+    def quota(self, **kw):
+        return YouTubeQuota(
+            config_file=self.config_file, ledger_file=self.ledger_file, **kw
+        )
+
+    def close(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+
+def good_config(cap=10000, enabled=True):
+    return {
+        "enabled": enabled,
+        "daily_cap_units": cap,
+        "timezone": "America/Los_Angeles",
+        "unit_costs": {"search.list": 100, "videos.list": 1, "commentThreads.list": 1},
+    }
+
+
+def row(units, day=None, method="search.list"):
+    return json.dumps({
+        "date": day or today_str("America/Los_Angeles"),
+        "script": "youtube_collector",
+        "method": method,
+        "quantity": 1,
+        "units": units,
+    }) + "\n"
+
+
+class FakeRequest:
+    def __init__(self):
+        self.executed = 0
+
+    def execute(self):
+        self.executed += 1
+        return {"items": []}
+
+
+# ---------------------------------------------------------------- happy path
+
+def test_spend_accumulates_and_persists():
+    sb = Sandbox(good_config())
+    try:
+        q = sb.quota()
+        check("fresh ledger is available", q.available, q.blocked_reason or "")
+        q.spend("search.list", script="test")
+        q.spend("videos.list", script="test")
+        check("spend updates in-memory total", q.used_today == 101, str(q.used_today))
+        check("session tracks per method", q.session_units == {"search.list": 100, "videos.list": 1})
+
+        reloaded = sb.quota()
+        check("usage survives a reload", reloaded.used_today == 101, str(reloaded.used_today))
+        rows = [r for r in sb.ledger_file.read_text().splitlines() if r.strip()]
+        check("ledger has one row per call", len(rows) == 2, f"got {len(rows)}")
+    finally:
+        sb.close()
+
+
+def test_execute_meters_then_runs():
+    sb = Sandbox(good_config())
+    try:
+        q = sb.quota()
+        req = FakeRequest()
+        q.execute(req, "commentThreads.list", script="test")
+        check("request ran", req.executed == 1)
+        check("call was charged", q.used_today == 1)
+    finally:
+        sb.close()
+
+
+def test_yesterday_does_not_count_against_today():
+    sb = Sandbox(good_config(), ledger_lines=[row(9999, day="2020-01-01")])
+    try:
+        q = sb.quota()
+        check("old usage excluded from today", q.used_today == 0, str(q.used_today))
+    finally:
+        sb.close()
+
+
+# ------------------------------------------------------------ the cap itself
+
+def test_cap_refuses_the_call_that_would_exceed_it():
+    sb = Sandbox(good_config(cap=250), ledger_lines=[row(200)])
+    try:
+        q = sb.quota()
+        ok, why = q.check("search.list")
+        check("search refused past the cap", not ok, why or "")
+        ok, _ = q.check("videos.list")
+        check("cheap call still fits", ok)
+        req = FakeRequest()
+        raised = False
+        try:
+            q.execute(req, "search.list", script="test")
+        except QuotaBlocked:
+            raised = True
+        check("execute raises when refused", raised)
+        check("refused request never ran", req.executed == 0)
+    finally:
+        sb.close()
+
+
+# --------------------------------------------------------------- fail closed
+
+def test_missing_config_fails_closed():
+    sb = Sandbox(config=None)
+    try:
+        q = sb.quota()
+        check("missing config blocks", not q.available)
+        ok, _ = q.check("videos.list")
+        check("missing config refuses calls", not ok)
+    finally:
+        sb.close()
+
+
+def test_corrupt_ledger_fails_closed():
+    sb = Sandbox(good_config(), ledger_lines=[row(1), "NOT JSON AT ALL\n"])
+    try:
+        q = sb.quota()
+        check("corrupt ledger blocks", not q.available)
+        check("corrupt ledger says why", "corrupt" in (q.blocked_reason or "").lower())
+    finally:
+        sb.close()
+
+
+def test_unknown_method_fails_closed():
+    sb = Sandbox(good_config())
+    try:
+        q = sb.quota()
+        ok, why = q.check("liveBroadcasts.list")
+        check("unpriced method is refused", not ok)
+        check("unpriced method says why", "unit cost" in (why or ""), why or "")
+    finally:
+        sb.close()
+
+
+def test_dry_run_writes_nothing():
+    sb = Sandbox(good_config())
+    try:
+        q = sb.quota(dry_run=True)
+        q.spend("search.list", script="test")
+        check("dry run leaves no ledger file", not sb.ledger_file.exists())
+        check("dry run still tracks in memory", q.used_today == 100)
+    finally:
+        sb.close()
+
+
+# --------------------------------------------------------------- CEO reports
+
+def test_report_line_groups_by_method():
+    day = "2026-10-09"
+    sb = Sandbox(good_config(), ledger_lines=[
+        row(100, day=day), row(100, day=day), row(1, day=day, method="videos.list"),
+    ])
+    try:
+        q = sb.quota()
+        s = q.day_summary(day)
+        check("summary totals units", s["total_units"] == 201, str(s["total_units"]))
+        check("summary counts calls", s["calls"] == 3, str(s["calls"]))
+        line = q.report_line(day)
+        check("report line names search", "search.list 200" in line, line)
+    finally:
+        sb.close()
+
+
+# ------------------------------------------------------- the shipped config
+
+def test_shipped_config_prices_every_collector_method():
+    q = YouTubeQuota(ledger_file=Path(tempfile.mkdtemp(prefix="ytquota-")) / "l.jsonl")
+    check("shipped config loads", q.available, q.blocked_reason or "")
+    check("search costs 100 units", q.unit_cost("search.list") == 100)
+    for method in ("videos.list", "commentThreads.list", "channels.list", "playlistItems.list"):
+        check(f"{method} costs 1 unit", q.unit_cost(method) == 1)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} YouTube quota test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk YouTube API response cache.
+
+No network. Requests are fakes carrying only a URI; cache entries live in a
+temp directory.
+
+Run: python3 tests/test_youtube_response_cache.py
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from youtube_response_cache import ResponseCache, request_key, request_params  # noqa: E402
+
+PASSED = []
+FAILED = []
+
+BASE = "https://youtube.googleapis.com/youtube/v3/videos"
+
+
+class FakeRequest:
+    def __init__(self, query):
+        self.uri = f"{BASE}?{query}"
+
+
+def check(name, condition, detail=""):
+    if condition:
+        PASSED.append(name)
+        print(f"  PASS  {name}")
+    else:
+        FAILED.append(f"{name} {detail}".strip())
+        print(f"  FAIL  {name} {detail}")
+
+
+def test_request_key():
+    a = FakeRequest("part=snippet&id=abc&key=SECRET1&alt=json")
+    b = FakeRequest("id=abc&part=snippet&key=SECRET2")
+    check("api key and alt stripped", request_params(a) == {"id": "abc", "part": "snippet"},
+          str(request_params(a)))
+    check("parameter order and key don't change the key",
+          request_key("videos.list", a) == request_key("videos.list", b))
+    check("method is part of the key",
+          request_key("videos.list", a) != request_key("channels.list", a))
+    check("different ids, different keys",
+          request_key("videos.list", a) != request_key("videos.list", FakeRequest("id=xyz")))
+
+
+def test_hit_miss_and_ttl():
+    tmp = Path(tempfile.mkdtemp(prefix="ytcache-"))
+    try:
+        cache = ResponseCache(tmp, ttls={"videos.list": 60})
+        req = FakeRequest("part=statistics&id=abc")
+        check("cold cache misses", cache.get("videos.list", req) is None)
+
+        cache.put("videos.list", req, {"items": [{"id": "abc"}]})
+        check("stored response is served",
+              cache.get("videos.list", req) == {"items": [{"id": "abc"}]})
+        check("stats counted", cache.stats == {"hits": 1, "misses": 1, "expired": 0, "writes": 1},
+              str(cache.stats))
+
+        path = next(tmp.glob("videos.list/*.json"))
+        entry = json.loads(path.read_text())
+        entry["fetched_at"] = time.time() - 120
+        path.write_text(json.dumps(entry))
+        check("entry older than its TTL expires", cache.get("videos.list", req) is None)
+        check("expiry counted", cache.stats["expired"] == 1, str(cache.stats))
+
+        cache.put("search.list", req, {"items": []})
+        check("unlisted methods are not cached",
+              not (tmp / "search.list").exists() and cache.get("search.list", req) is None)
+
+        refresh = ResponseCache(tmp, ttls={"videos.list": 3600}, refresh=True)
+        check("refresh skips reads", refresh.get("videos.list", req) is None)
+        refresh.put("videos.list", req, {"items": [{"id": "new"}]})
+        check("refresh still writes",
+              ResponseCache(tmp, ttls={"videos.list": 3600}).get("videos.list", req)
+              == {"items": [{"id": "new"}]})
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_offline():
+    tmp = Path(tempfile.mkdtemp(prefix="ytcache-"))
+    try:
+        req = FakeRequest("part=snippet&id=abc")
+        ResponseCache(tmp, ttls={"videos.list": 60}).put("videos.list", req, {"items": [1]})
+        path = next(tmp.glob("videos.list/*.json"))
+        entry = json.loads(path.read_text())
+        entry["fetched_at"] = 0
+        path.write_text(json.dumps(entry))
+
+        offline = ResponseCache(tmp, ttls={"videos.list": 60}, offline=True, refresh=True)
+        check("offline ignores TTL and refresh", offline.get("videos.list", req) == {"items": [1]})
+        offline.put("videos.list", FakeRequest("id=other"), {"items": [2]})
+        check("offline never writes", len(list(tmp.glob("videos.list/*.json"))) == 1)
+        check("offline summary says so", "(offline)" in offline.summary(), offline.summary())
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_failed_write_leaves_no_temp_file():
+    tmp = Path(tempfile.mkdtemp(prefix="ytcache-"))
+    try:
+        cache = ResponseCache(tmp, ttls={"videos.list": 60})
+        req = FakeRequest("id=abc")
+        with redirect_stdout(StringIO()) as out:
+            cache.put("videos.list", req, {"items": [object()]})
+        check("unserializable response reported, not raised",
+              "Could not write response cache" in out.getvalue(), out.getvalue())
+        check("no temp file left behind", list(tmp.rglob("*.tmp")) == [],
+              str(list(tmp.rglob("*"))))
+        check("nothing cached", cache.get("videos.list", req) is None)
+        check("write not counted", cache.stats["writes"] == 0, str(cache.stats))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    print(f"Running {len(tests)} response cache test groups\n")
+    for t in tests:
+        print(t.__name__)
+        t()
+        print()
+
+    print("=" * 60)
+    print(f"{len(PASSED)} passed, {len(FAILED)} failed")
+    if FAILED:
+        for f in FAILED:
+            print(f"  FAILED: {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())